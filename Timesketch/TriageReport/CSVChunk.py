@@ -0,0 +1,150 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Parallel Chunked CSV Reader for TriageReport and ts_Transform     #
+#    Split a large tool CSV (MFTDump.csv, LNKFiles.csv, hayabusa.csv) #
+#    into newline aligned byte ranges, parse the ranges in a process  #
+#    pool, and hand the rows back in their original order.            #
+#                                                                     #
+#   Note: A range only ends on a newline that is outside of a quoted  #
+#         field (even number of quotes so far), so quoted multi-line  #
+#         fields are never split between two workers.                 #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#######################################################################
+import io
+import os
+import csv
+import collections
+import concurrent.futures
+
+
+###########################################################################
+# Defaults - Ranges are large so the pool overhead stays small            #
+###########################################################################
+ChunkSize = 64 * 1024 * 1024
+BlockSize = 8 * 1024 * 1024
+
+
+###########################################################################
+# Split the CSV into newline aligned (Start, End) byte ranges             #
+###########################################################################
+def ChunkRanges(CSVName, ChunkLen=ChunkSize, QuoteChar=b'"'):
+    FileSize = os.path.getsize(CSVName)
+    if FileSize <= ChunkLen:
+        return [(0, FileSize)]
+
+    Ranges = []
+    RngStart = 0
+    Target = ChunkLen
+    Quotes = 0
+    BlkPos = 0
+
+    with open(CSVName, 'rb') as csvfile:
+        while Target < FileSize:
+            Block = csvfile.read(BlockSize)
+            if not Block:
+                break
+
+            BlkLen = len(Block)
+            ScanOff = 0
+            ScanQuotes = Quotes
+
+            while BlkPos + BlkLen > Target:
+                NewOff = max(Target - BlkPos, ScanOff)
+                ScanQuotes += Block.count(QuoteChar, ScanOff, NewOff)
+                ScanOff = NewOff
+
+                # First newline past the Target that is outside of quotes
+                RngEnd = -1
+                while True:
+                    NewLine = Block.find(b'\n', ScanOff)
+                    if NewLine == -1:
+                        break
+                    ScanQuotes += Block.count(QuoteChar, ScanOff, NewLine)
+                    ScanOff = NewLine + 1
+                    if ScanQuotes % 2 == 0:
+                        RngEnd = BlkPos + ScanOff
+                        break
+
+                if RngEnd == -1:
+                    break
+
+                Ranges.append((RngStart, RngEnd))
+                RngStart = RngEnd
+                Target = RngStart + ChunkLen
+                if Target >= FileSize:
+                    break
+
+            Quotes += Block.count(QuoteChar)
+            BlkPos += BlkLen
+
+    if RngStart < FileSize:
+        Ranges.append((RngStart, FileSize))
+
+    return Ranges
+
+
+###########################################################################
+# Parse one byte range (Runs in the Worker Process)                       #
+#  RowFunc (optional) must be a top level function so it can be pickled - #
+#  it returns the value to keep for a row, or None to drop the row        #
+###########################################################################
+def ParseRange(CSVName, RngStart, RngEnd, Delim=',', RowFunc=None, MinCols=0):
+    with open(CSVName, 'rb') as csvfile:
+        csvfile.seek(RngStart)
+        RngData = csvfile.read(RngEnd - RngStart)
+
+    RngText = RngData.decode('utf8', errors="replace").replace('\0', '')
+    csvread = csv.reader(io.StringIO(RngText, newline=''), delimiter=Delim)
+
+    RngRows = []
+    for csvrow in csvread:
+        if len(csvrow) < MinCols:
+            continue
+        if RowFunc is None:
+            RngRows.append(csvrow)
+        else:
+            RowVal = RowFunc(csvrow)
+            if RowVal is not None:
+                RngRows.append(RowVal)
+
+    return RngRows
+
+
+###########################################################################
+# Read the CSV - Yields the rows (or RowFunc values) in File Order        #
+#  Workers < 2 reads the file sequentially in this process (Default)      #
+###########################################################################
+def ReadCSV(CSVName, Delim=',', RowFunc=None, MinCols=0, Workers=0, ChunkLen=ChunkSize):
+    if Workers < 2 or os.path.getsize(CSVName) <= ChunkLen:
+        with open(CSVName, 'r', encoding='utf8', errors="replace") as csvfile:
+            csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=Delim)
+            for csvrow in csvread:
+                if len(csvrow) < MinCols:
+                    continue
+                if RowFunc is None:
+                    yield csvrow
+                else:
+                    RowVal = RowFunc(csvrow)
+                    if RowVal is not None:
+                        yield RowVal
+        return
+
+    Ranges = ChunkRanges(CSVName, ChunkLen)
+
+    # Keep only a couple of ranges per worker in flight to bound memory
+    with concurrent.futures.ProcessPoolExecutor(max_workers=Workers) as ChnkPool:
+        InFlight = collections.deque()
+        RngIndx = 0
+
+        while RngIndx < len(Ranges) or InFlight:
+            while RngIndx < len(Ranges) and len(InFlight) < Workers * 2:
+                RngStart, RngEnd = Ranges[RngIndx]
+                InFlight.append(ChnkPool.submit(ParseRange, CSVName, RngStart, RngEnd, Delim, RowFunc, MinCols))
+                RngIndx += 1
+
+            for RowVal in InFlight.popleft().result():
+                yield RowVal
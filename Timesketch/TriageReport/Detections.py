@@ -0,0 +1,189 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Table Driven Renderer for the Chainsaw and Hayabusa Detections    #
+#    Each Detection CSV is one Row in a Table (File Name, Title,      #
+#    Cell Widths, Columns, Row Check), and every one of them goes     #
+#    through the same streaming Renderer.  The Detection CSVs are     #
+#    found with one scandir pass over the TriageReport Directory      #
+#    instead of one recursive glob per CSV.                           #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Sigma False Positive Suppression Table (SigSupp:) - The   #
+#           Rule Titles are Matched once per Row (IOCMatcher)         #
+#######################################################################
+import os
+import CSVChunk
+import ReportTable
+from IOCMatch import IOCMatcher
+
+
+###########################################################################
+# Sigma False Positive Suppression: (Rule Title Pattern, Required Channel #
+#  or Provider Pattern) - A Sigma Row whose Title has the Pattern is left #
+#  out unless its Channel/Provider (Column 3) has the Required Pattern.   #
+#  Patterns are Case Insensitive Substrings.  Add Rules with              #
+#  SigSupp:Title|Channel (SigSupp:None drops these Defaults)              #
+###########################################################################
+SigmaDefaults = (
+    ("defender", "defender"),
+    ("sysmon", "sysmon"),
+    ("file was not allowed to run", "applocker")
+)
+
+
+class SigmaSuppress:
+    def __init__(self, SuppRules=SigmaDefaults):
+        self.Rules = []
+        self.Counts = []
+        self.Titles = None
+        for TitlePat, ChanPat in SuppRules:
+            self.Add(TitlePat, ChanPat)
+
+    def Add(self, TitlePat, ChanPat):
+        self.Rules.append((TitlePat.lower(), ChanPat.lower()))
+        self.Counts.append(0)
+        self.Titles = None
+
+    def Clear(self):
+        self.Rules = []
+        self.Counts = []
+        self.Titles = None
+
+    ###########################################################################
+    # Row Check - One Title Scan finds every Rule that applies, and the       #
+    #  Channel is only lowercased when one does                               #
+    ###########################################################################
+    def Keep(self, csvrow):
+        if self.Titles is None:
+            # Built once, on the first Row (After the Config Rules are in)
+            self.Titles = IOCMatcher([TitlePat for TitlePat, ChanPat in self.Rules])
+
+        RuleHits = self.Titles.Hits(csvrow[1])
+        if not RuleHits:
+            return True
+
+        ChanLower = csvrow[3].lower()
+        for RuleIndx in RuleHits:
+            if self.Rules[RuleIndx][1] not in ChanLower:
+                self.Counts[RuleIndx] += 1
+                return False
+
+        return True
+
+    def Report(self):
+        for (TitlePat, ChanPat), RuleCount in zip(self.Rules, self.Counts):
+            print("[+] Sigma Rows Suppressed: " + str(RuleCount) + " (Title: " + TitlePat + " / Not Channel: " + ChanPat + ")")
+
+
+# The Suppression Table used for the Chainsaw sigma.csv Rows
+SigmaSupp = SigmaSuppress()
+
+
+###########################################################################
+# Row Checks - Return False to leave the Row out of the Table             #
+###########################################################################
+def HighCrit(csvrow):
+    return csvrow[2] == "Level" or csvrow[2] == "high" or csvrow[2] == "crit"
+
+
+###########################################################################
+# Detection Tables:                                                       #
+#  (File Name, Title, Cell Widths, TopAlign, MinCols, Columns, RowCheck)  #
+#   TopAlign - 1 for the Top Aligned Table (Long, Multi Line Cells)       #
+#   MinCols  - The Row must have more Columns than this                   #
+#   Columns  - The CSV Columns shown, in Order (Missing ones are blank)   #
+#                                                                         #
+# IMPORTANT NOTE: The Chainsaw Columns are for Chainsaw v2.9, and the     #
+#  Hayabusa Columns are for Hayabusa v2.15.0 - Output can change between  #
+#  versions.                                                              #
+###########################################################################
+ChainsawTables = (
+    ("log_tampering.csv", "Log Tampering", ("20%", "20%", "20%", "20%", "20%"), 0, 3, (0, 1, 3, 5, 6), None),
+    ("account_tampering.csv", "Account Tampering", ("20%", "20%", "10%", "10%", "10%", "15%", "15%"), 0, 3, (0, 1, 3, 5, 6, 7, 8), None),
+    ("login_attacks.csv", "Login Attacks", ("20%", "40%", "10%", "10%", "20%"), 0, 3, (0, 1, 2, 3, 4), None),
+    ("antivirus.csv", "Antivirus Detections", ("15%", "15%", "5%", "10%", "10%", "10%", "10%", "15%", "10%"), 1, 5, (0, 1, 2, 4, 5, 6, 7, 8, 9), None),
+    ("lateral_movement.csv", "Lateral Movement Detections", ("20%", "10%", "5%", "15%", "15%", "5%", "20%"), 1, 5, (0, 1, 3, 4, 5, 6, 7), None),
+    ("powershell_script.csv", "Powershell Script", ("20%", "15%", "5%", "10%", "10%", "30%"), 1, 5, (0, 1, 3, 4, 5, 6), None),
+    ("rdp_attacks.csv", "RDP Attacks", ("20%", "15%", "5%", "10%", "10%", "10%", "10%", "10%", "10%"), 1, 5, (0, 1, 3, 4, 5, 6, 7, 8, 9), None),
+    ("rdp_events.csv", "RDP Events", ("20%", "20%", "10%", "20%", "10%", "20%"), 1, 5, (0, 1, 3, 4, 5, 6), None),
+    ("service_installation.csv", "Service Installation", ("20%", "20%", "10%", "10%", "10%", "10%", "10%", "10%"), 1, 5, (0, 1, 3, 5, 6, 7, 8, 9), None),
+    ("sigma.csv", "Sigma Rule(s) Detections", ("20%", "20%", "5%", "10%", "5%", "10%", "30%"), 0, 3, (0, 1, 3, 4, 5, 7, 8), SigmaSupp.Keep)
+)
+
+# Chainsaw Output that is not Reported - Just Delete These
+ChainsawDelete = ("microsoft_rds_events_-_user_profile_disk.csv",)
+
+HayabusaTables = (
+    ("hayabusa.csv", "High and Critical Detections", ("20%", "20%", "5%", "5%", "5%", "5%", "20%", "20%"), 0, 7, (0, 1, 2, 3, 4, 5, 7, 8), HighCrit),
+)
+
+
+def TableFiles(DetTables):
+    return tuple(DetTable[0] for DetTable in DetTables)
+
+
+###########################################################################
+# One scandir pass under RootDir - Returns {Lower Case Name: [Paths]}     #
+#  for the FileNames (Every .csv if FileNames is None).  SkipDirs are     #
+#  not entered (Directory Names, like the Artifact Cache)                 #
+###########################################################################
+def ScanCSVs(RootDir, FileNames=None, SkipDirs=()):
+    Wanted = None if FileNames is None else set(FileName.lower() for FileName in FileNames)
+    Found = {}
+
+    DirStack = [RootDir]
+    while DirStack:
+        CurDir = DirStack.pop()
+        try:
+            with os.scandir(CurDir) as DirEnts:
+                for DirEnt in DirEnts:
+                    if DirEnt.is_dir(follow_symlinks=False):
+                        if DirEnt.name not in SkipDirs:
+                            DirStack.append(DirEnt.path)
+                        continue
+
+                    EntName = DirEnt.name.lower()
+                    if (Wanted is None and EntName.endswith(".csv")) or (Wanted is not None and EntName in Wanted):
+                        Found.setdefault(EntName, []).append(DirEnt.path)
+        except OSError:
+            continue
+
+    for EntName in Found:
+        Found[EntName].sort()
+    return Found
+
+
+###########################################################################
+# Stream one Detection CSV into a Report Table - Returns the Row Count    #
+###########################################################################
+def RenderCSV(outfile, CSVName, DetTable, IOCMatch, Workers=0):
+    FileName, Title, Widths, TopAlign, MinCols, Columns, RowCheck = DetTable
+
+    outfile.write("<p><i><font color=firebrick>" + Title + ":</font></i></p>\n")
+    if TopAlign == 1:
+        RptTable = ReportTable.ReportTable(outfile, ReportTable.TopAlign(*Widths), IOCMatch, HeadRow=1, TableTag=ReportTable.TopTable)
+    else:
+        RptTable = ReportTable.ReportTable(outfile, Widths, IOCMatch, HeadRow=1)
+
+    reccount = 0
+    for csvrow in CSVChunk.ReadCSV(CSVName, Workers=Workers):
+        if len(csvrow) > MinCols:
+            if RowCheck is not None and not RowCheck(csvrow):
+                continue
+
+            # Is it in our IOC List? (The Table Highlights the Hits)
+            RptTable.Add(tuple(csvrow[ColIndx] if ColIndx < len(csvrow) else "" for ColIndx in Columns), ' '.join(map(str, csvrow)))
+
+            reccount = reccount + 1
+
+    RptTable.Close()
+
+    if reccount < 2:
+        outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+    else:
+        outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
+
+    return reccount
@@ -0,0 +1,318 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Single Pass Event Log Extractor for TriageReport                  #
+#    Each Event Log is read once (One LogParser query for all of the  #
+#    EventIDs the Report needs), and every record is dispatched by    #
+#    its EventID to the Section Sinks (RDPGood.csv, SecEvt4625.csv,   #
+#    etc.).  Adding an EventID to the Report is one more Sink - Not   #
+#    one more scan of a multi GB log.                                 #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Native EVTX Records (EvtxParse) as a Sink Source          #
+#   v0.03 - Native reads go through the Sidecar Event Index           #
+#   v0.04 - Workstation, Source IP and Logon Type for 4625 (Logon     #
+#           Aggregator)                                               #
+#   v0.05 - Channel Sweep: Every other .evtx in the Event Log Dirs    #
+#           is parsed in a Process Pool (Largest first), with Sinks   #
+#           for PowerShell, TaskScheduler and RDP LocalSessionManager #
+#   v0.06 - The Event Index is kept in OutDir\ArtCache (IndexDir),    #
+#           not next to the collected Logs                            #
+#   v0.07 - The Channel Sweep Hashes each Log once (EvtxKey), not     #
+#           once for the Split and again for the Summary              #
+#   v0.08 - Message is only Rendered (LogParser) for the Sinks that   #
+#           use it - They get their own small Query                   #
+#######################################################################
+import os
+import csv
+import glob
+import concurrent.futures
+import CSVChunk
+import EvtIndex
+import EvtxParse
+
+
+###########################################################################
+# Section Sinks:                                                          #
+#  (Sink Name, Log, EventID, Filter, Columns)                             #
+#   Log     - The Channel (.evtx File Name without the Extension)         #
+#   EventID - One EventID, or a Tuple of them                             #
+#   Filter  - (Token, Value) the record must have, or None                #
+#   Columns - (Title, Field): Field is a Token Number in the Strings, or  #
+#             a Record Field ("Date", "EventID", "SourceName",            #
+#             "EventCategoryName", "Message")                             #
+#                                                                         #
+#  Bump SinkFormat when the Sinks change (Cached Extracts are rebuilt)    #
+###########################################################################
+SinkFormat = 3
+
+EvtSinks = (
+    ("RDPGood", "Security", 4624, (8, "10"),
+     (("Date", "Date"), ("Machine", 1), ("LoginID", 5), ("LoginMachine", 6), ("LogonType", 8), ("RemoteIP", 18))),
+    ("SecEvt4625", "Security", 4625, None,
+     (("Date", "Date"), ("LoginID", 5), ("Workstation", 13), ("SourceIP", 19), ("LogonType", 10))),
+    ("SecEvt4698", "Security", 4698, None,
+     (("Date", "Date"), ("SourceName", "SourceName"), ("EventCategoryName", "EventCategoryName"), ("Message", "Message"))),
+    ("SecEvt4648", "Security", 4648, None,
+     (("Date", "Date"), ("accountname", 1), ("domain", 2), ("usedaccount", 5), ("useddomain", 6),
+      ("targetserver", 8), ("extradata", 9), ("procname", 11), ("sourceip", 12))),
+    ("SysEvt7045", "System", 7045, None,
+     (("Date", "Date"), ("ServiceName", 0), ("ServicePath", 1), ("ServiceUser", 4))),
+    ("PShl4104", "Microsoft-Windows-PowerShell%4Operational", 4104, None,
+     (("Date", "Date"), ("ScriptBlockId", 3), ("Part", 0), ("Parts", 1), ("Path", 4), ("ScriptBlockText", 2))),
+    ("TaskSched", "Microsoft-Windows-TaskScheduler%4Operational", (106, 140, 141, 200), None,
+     (("Date", "Date"), ("EventID", "EventID"), ("TaskName", 0), ("Detail", 1))),
+    ("RDPLsm", "Microsoft-Windows-TerminalServices-LocalSessionManager%4Operational", (21, 22, 23, 24, 25), None,
+     (("Date", "Date"), ("EventID", "EventID"), ("User", 0), ("SessionID", 1), ("Address", 2)))
+)
+
+# The Logs with their own (Cached) Section Extracts - Not in the Sweep
+MainLogs = ("Security", "System")
+
+RecFields = ("Date", "EventID", "SourceName", "EventCategoryName", "Strings", "Message")
+
+
+def LogSinks(LogName):
+    return [EvtSink for EvtSink in EvtSinks if EvtSink[1].lower() == LogName.lower()]
+
+
+def SinkIDs(EventID):
+    return EventID if isinstance(EventID, tuple) else (EventID,)
+
+
+def LogEventIDs(LogName):
+    return set(SinkID for EvtSink in LogSinks(LogName) for SinkID in SinkIDs(EvtSink[2]))
+
+
+###########################################################################
+# One LogParser Query for every Sink of this Log - The Sink Filters are   #
+#  pushed into the Where clause so LogParser only returns what is used.   #
+#  Rendering the Message is costly (Every Record of a multi GB Log), so   #
+#  the Sinks that use it get their own Query, appended to the same CSV -  #
+#  The other Records have an empty Message                                #
+###########################################################################
+def SinkMessage(SinkCols):
+    return any(ColField == "Message" for ColTitle, ColField in SinkCols)
+
+
+def LogQuery(LogParser, EvtxName, LogName, QueryCSV):
+    WhereLists = {0: [], 1: []}
+    for SinkName, SinkLog, EventID, SinkFilter, SinkCols in LogSinks(LogName):
+        IDWhere = " OR ".join("EventID = " + str(SinkID) for SinkID in SinkIDs(EventID))
+        if SinkFilter is None:
+            SinkWhere = "(" + IDWhere + ")"
+        else:
+            SinkWhere = "((" + IDWhere + ") AND EXTRACT_TOKEN(Strings, " + str(SinkFilter[0]) + ", '|') = '" + SinkFilter[1] + "')"
+        WhereLists[int(SinkMessage(SinkCols))].append(SinkWhere)
+
+    QueryCmds = []
+    for WithMsg, MsgField in ((0, "'' AS Message"), (1, "Message")):
+        if len(WhereLists[WithMsg]) == 0:
+            continue
+
+        if len(QueryCmds) == 0:
+            QueryOut = " -q > " + QueryCSV
+        else:
+            QueryOut = " -q -headers:OFF >> " + QueryCSV
+
+        QueryCmds.append(LogParser + " \"Select to_utctime(Timegenerated) AS Date, EventID, SourceName, EventCategoryName, Strings, " + MsgField
+                         + " FROM " + EvtxName + " WHERE " + " OR ".join(WhereLists[WithMsg]) + "\" -i:evt -o:csv" + QueryOut)
+
+    return " && ".join(QueryCmds)
+
+
+###########################################################################
+# Dispatch Records to the Sinks of this Log (One Pass)                    #
+#  Records are (Date, EventID, SourceName, EventCategoryName, Strings,    #
+#  Message) - Strings is the list of Event Data Strings                   #
+#  Returns the number of Rows written to each Sink                        #
+###########################################################################
+def WriteSinks(Records, LogName, OutDir):
+    SinkFiles = []
+    SinkByID = {}
+    SinkRows = {}
+
+    try:
+        for SinkName, SinkLog, EventID, SinkFilter, SinkCols in LogSinks(LogName):
+            SinkFile = open(os.path.join(OutDir, SinkName + ".csv"), "w", newline='', encoding='utf8', errors="replace")
+            SinkFiles.append(SinkFile)
+
+            SinkCSV = csv.writer(SinkFile)
+            SinkCSV.writerow([ColTitle for ColTitle, ColField in SinkCols])
+
+            # Record Fields are looked up once here - (1, Token) or (0, Field Index)
+            ColPicks = []
+            for ColTitle, ColField in SinkCols:
+                if isinstance(ColField, int):
+                    ColPicks.append((1, ColField))
+                else:
+                    ColPicks.append((0, RecFields.index(ColField)))
+
+            for SinkID in SinkIDs(EventID):
+                SinkByID.setdefault(SinkID, []).append((SinkName, SinkFilter, ColPicks, SinkCSV))
+            SinkRows[SinkName] = 0
+
+        for EvtRec in Records:
+            EvtSinkList = SinkByID.get(EvtRec[1])
+            if EvtSinkList is None:
+                continue
+
+            EvtStrs = EvtRec[4]
+            for SinkName, SinkFilter, ColPicks, SinkCSV in EvtSinkList:
+                if SinkFilter is not None:
+                    if len(EvtStrs) <= SinkFilter[0] or EvtStrs[SinkFilter[0]] != SinkFilter[1]:
+                        continue
+
+                SinkRow = []
+                for IsToken, ColIndx in ColPicks:
+                    if IsToken == 0:
+                        SinkRow.append(EvtRec[ColIndx])
+                    elif ColIndx < len(EvtStrs):
+                        SinkRow.append(EvtStrs[ColIndx])
+                    else:
+                        SinkRow.append("")
+
+                SinkCSV.writerow(SinkRow)
+                SinkRows[SinkName] += 1
+
+    finally:
+        for SinkFile in SinkFiles:
+            SinkFile.close()
+
+    return SinkRows
+
+
+###########################################################################
+# Records from the (Combined) LogParser Query CSV                         #
+###########################################################################
+def QueryRecords(QueryCSV, Workers=0):
+    for csvrow in CSVChunk.ReadCSV(QueryCSV, MinCols=6, Workers=Workers):
+        # Header Row (Only the first Query writes one)
+        if csvrow[1] == "EventID":
+            continue
+
+        try:
+            EventID = int(csvrow[1])
+        except ValueError:
+            continue
+
+        yield (csvrow[0], EventID, csvrow[2], csvrow[3], csvrow[4].split("|"), csvrow[5])
+
+
+###########################################################################
+# Split any Record Iterator into the Section Sinks                        #
+###########################################################################
+def SplitRecords(Records, LogName, OutDir):
+    SinkRows = WriteSinks(Records, LogName, OutDir)
+    for SinkName in SinkRows:
+        print("[+] " + LogName + " Events: " + SinkName + " (" + str(SinkRows[SinkName]) + ")")
+    return SinkRows
+
+
+###########################################################################
+# Split the Query CSV into the Section Sinks, then delete it              #
+###########################################################################
+def SplitQuery(QueryCSV, LogName, OutDir, Workers=0):
+    if not os.path.isfile(QueryCSV):
+        return SplitRecords((), LogName, OutDir)
+
+    SinkRows = SplitRecords(QueryRecords(QueryCSV, Workers), LogName, OutDir)
+    os.remove(QueryCSV)
+    return SinkRows
+
+
+###########################################################################
+# The Event Index Dir - The Collection's TriageReport\ArtCache.  Logs     #
+#  read In Place are Evidence, nothing is written next to them            #
+###########################################################################
+def IndexDir(OutDir):
+    return os.path.join(OutDir, "ArtCache")
+
+
+###########################################################################
+# Split an EVTX with the Native Parser (No LogParser Query) - Only the    #
+#  Records of the Sink EventIDs are read if the Event Index is current.   #
+#  EvtxKey is the Log's (Size, SHA256) if the Caller already has it       #
+###########################################################################
+def SplitEvtx(EvtxName, LogName, OutDir, Workers=0, EvtxKey=None):
+    EvtRecs = EvtIndex.IndexRecords(EvtxName, IndexDir(OutDir), LogEventIDs(LogName), Workers, EvtxKey)
+    return SplitRecords((EvtxParse.ReportRecord(EvtRec) for EvtRec in EvtRecs), LogName, OutDir)
+
+
+###########################################################################
+# Channel Sweep: Every .evtx in the Event Log Dirs except the Main Logs - #
+#  The first Dir wins if a Channel is in both.  Largest File first, so    #
+#  the slowest Channels start earliest                                    #
+###########################################################################
+def ChannelName(EvtxName):
+    return os.path.splitext(os.path.basename(EvtxName))[0]
+
+
+def SweepFiles(EvtxDirs):
+    SweepSeen = set(MainLog.lower() for MainLog in MainLogs)
+    SweepList = []
+    for EvtxDir in EvtxDirs:
+        for EvtxName in sorted(glob.glob(os.path.join(glob.escape(EvtxDir), "*.evtx"))):
+            LogKey = ChannelName(EvtxName).lower()
+            if LogKey not in SweepSeen and os.path.isfile(EvtxName):
+                SweepSeen.add(LogKey)
+                SweepList.append(EvtxName)
+
+    SweepList.sort(key=os.path.getsize, reverse=True)
+    return SweepList
+
+
+###########################################################################
+# One Channel (Runs in the Worker Process) - Split it into its Sinks (If  #
+#  it has any) and Summarize it from its Event Index.  Returns the Row    #
+#  for EvtChannels.csv                                                    #
+###########################################################################
+def SweepEvtx(EvtxName, OutDir):
+    LogName = ChannelName(EvtxName)
+    EvtxKey = EvtIndex.LogKey(EvtxName, IndexDir(OutDir))
+    if LogSinks(LogName):
+        SplitEvtx(EvtxName, LogName, OutDir, 0, EvtxKey)
+
+    EvtCount = 0
+    EvtIDs = set()
+    FirstTime = LastTime = ""
+    for EventID, Provider, OffStart, OffCount, GrpFirst, GrpLast in EvtIndex.IndexSummary(EvtxName, IndexDir(OutDir), 0, EvtxKey):
+        EvtCount += OffCount
+        EvtIDs.add(EventID)
+        if FirstTime == "" or GrpFirst < FirstTime:
+            FirstTime = GrpFirst
+        if GrpLast > LastTime:
+            LastTime = GrpLast
+
+    return [LogName.replace("%4", "/"), os.path.getsize(EvtxName), EvtCount, len(EvtIDs), FirstTime[:19], LastTime[:19], ""]
+
+
+###########################################################################
+# Sweep the Channels with up to Workers Processes, and write the Channel  #
+#  Summary (EvtChannels.csv) - A Channel that fails is listed with the    #
+#  Error, it does not stop the Sweep                                      #
+###########################################################################
+def SweepChannels(EvtxFiles, OutDir, Workers=0):
+    if Workers < 1:
+        Workers = os.cpu_count() or 1
+
+    SweepRows = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(Workers, max(len(EvtxFiles), 1))) as SweepPool:
+        SweepJobs = [(EvtxName, SweepPool.submit(SweepEvtx, EvtxName, OutDir)) for EvtxName in EvtxFiles]
+
+        for EvtxName, SweepJob in SweepJobs:
+            try:
+                SweepRows.append(SweepJob.result())
+            except Exception as SweepErr:
+                print("[!] Channel Sweep Failed: " + EvtxName + " (" + str(SweepErr) + ")")
+                SweepRows.append([ChannelName(EvtxName).replace("%4", "/"), os.path.getsize(EvtxName), 0, 0, "", "", str(SweepErr)])
+
+    with open(os.path.join(OutDir, "EvtChannels.csv"), "w", newline='', encoding='utf8', errors="replace") as ChnFile:
+        ChnCSV = csv.writer(ChnFile)
+        ChnCSV.writerow(["Channel", "Size", "Records", "EventIDs", "First", "Last", "Error"])
+        ChnCSV.writerows(SweepRows)
+
+    print("[+] Event Log Channels Swept: " + str(len(SweepRows)))
+    return SweepRows
@@ -0,0 +1,246 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Sidecar EventID Index for the Native EVTX Parser                  #
+#    The first full parse of an Event Log also records where every    #
+#    Record is (File Offset), grouped by EventID and Provider, with   #
+#    the first and last TimeCreated of each group.  Re-runs that      #
+#    only want some EventIDs (4624, 4625, 4648, 4698, 7045...) read   #
+#    just those Records instead of rendering the whole log again.     #
+#                                                                     #
+#   Layout (In the Index Dir - TriageReport\ArtCache, never next to   #
+#    the collected Logs, which are read In Place and Read Only):      #
+#    <SHA256>.idx.json   - Manifest: Size, SHA256, and the Groups     #
+#                          (EventID, Provider, Start, Count, First,   #
+#                          Last)                                      #
+#    <SHA256>.idx.q      - Packed uint64 Record Offsets, by Group     #
+#    <Key>.key.json      - The SHA256 of a Log at (Path, Size, Time)  #
+#                                                                     #
+#   The Index is keyed by the Size and Content Hash of the log (Not   #
+#    its Path or Modified Time), so a fresh copy of the same log      #
+#    still uses it.  The Manifest is written last, and an Index that  #
+#    can not be written is simply skipped.  The Hash itself is        #
+#    remembered by (Path, Size, mtime_ns), so an unchanged Log is     #
+#    not read again just to find its Index.                           #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Index Summary (Groups) for the Event Log Channel Sweep    #
+#   v0.03 - Indexes are kept in the Index Dir (By Content Hash), not  #
+#           in the Evidence Tree                                      #
+#   v0.04 - LogKey (Size, SHA256) can be passed in, so a Log is only  #
+#           Hashed once per run                                       #
+#   v0.05 - Log Hashes are remembered in the Index Dir by (Path,      #
+#           Size, mtime_ns) - An unchanged Log is not Hashed again    #
+#######################################################################
+import os
+import sys
+import json
+import array
+import hashlib
+import EvtxParse
+
+
+###########################################################################
+# Bump this if the on-disk Layout changes (Old Indexes are then rebuilt)  #
+###########################################################################
+IndexFormat = 1
+
+HashBlock = 1024 * 1024
+
+
+def IndexPath(IndexDir, EvtxHash, Part):
+    return os.path.join(IndexDir, EvtxHash + ".idx." + Part)
+
+
+def FileHash(EvtxName):
+    EvtxHash = hashlib.sha256()
+    with open(EvtxName, "rb") as EvtxFile:
+        while True:
+            HashData = EvtxFile.read(HashBlock)
+            if not HashData:
+                break
+            EvtxHash.update(HashData)
+    return EvtxHash.hexdigest()
+
+
+###########################################################################
+# The Index Key of a Log: (Size, SHA256) - Callers that read the same Log #
+#  more than once pass it in (EvtxKey) instead of Hashing it again.  With #
+#  an IndexDir, the SHA256 is kept there by (Path, Size, mtime_ns) and    #
+#  only recomputed if the Log has changed                                 #
+###########################################################################
+def LogKey(EvtxName, IndexDir=None):
+    EvtxStat = os.stat(EvtxName)
+    if IndexDir is None:
+        return EvtxStat.st_size, FileHash(EvtxName)
+
+    EvtxPath = os.path.abspath(EvtxName)
+    KeyName = hashlib.blake2b(EvtxPath.encode("utf8", errors="replace"), digest_size=16).hexdigest()
+    KeyFile = os.path.join(IndexDir, KeyName + ".key.json")
+    try:
+        with open(KeyFile, 'r', encoding='utf8') as KeyData:
+            HashMemo = json.load(KeyData)
+        if (HashMemo.get("Format") == IndexFormat and HashMemo.get("Path") == EvtxPath and
+                HashMemo.get("Size") == EvtxStat.st_size and HashMemo.get("MTime") == EvtxStat.st_mtime_ns):
+            return EvtxStat.st_size, HashMemo["Hash"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+
+    EvtxHash = FileHash(EvtxName)
+    HashMemo = {"Format": IndexFormat, "Path": EvtxPath, "Size": EvtxStat.st_size, "MTime": EvtxStat.st_mtime_ns, "Hash": EvtxHash}
+    try:
+        os.makedirs(IndexDir, exist_ok=True)
+        with open(KeyFile + "." + str(os.getpid()), 'w', encoding='utf8') as KeyData:
+            json.dump(HashMemo, KeyData)
+        os.replace(KeyFile + "." + str(os.getpid()), KeyFile)
+    except OSError:
+        pass
+
+    return EvtxStat.st_size, EvtxHash
+
+
+###########################################################################
+# Return the Manifest if the Index matches this Log, else None            #
+###########################################################################
+def LoadIndex(IndexDir, EvtxSize, EvtxHash):
+    try:
+        with open(IndexPath(IndexDir, EvtxHash, "json"), 'r', encoding='utf8') as ManFile:
+            Manifest = json.load(ManFile)
+    except (OSError, ValueError):
+        return None
+
+    if Manifest.get("Format") != IndexFormat or Manifest.get("ByteOrder") != sys.byteorder:
+        return None
+    if Manifest.get("Size") != EvtxSize or Manifest.get("Hash") != EvtxHash:
+        return None
+    return Manifest
+
+
+###########################################################################
+# Offsets of the Records with these EventIDs (All Providers), in File     #
+#  Order.  EventIDs of None is every Record                               #
+###########################################################################
+def IndexOffsets(IndexDir, Manifest, EventIDs=None):
+    OffData = array.array('Q')
+    with open(IndexPath(IndexDir, Manifest["Hash"], "q"), "rb") as OffFile:
+        OffData.frombytes(OffFile.read())
+
+    FileOffs = []
+    for EventID, Provider, OffStart, OffCount, FirstTime, LastTime in Manifest["Groups"]:
+        if EventIDs is None or EventID in EventIDs:
+            FileOffs.extend(OffData[OffStart:OffStart + OffCount])
+
+    FileOffs.sort()
+    return FileOffs
+
+
+###########################################################################
+# Index Builder - Add() each (File Offset, Fields) pair from a full parse #
+###########################################################################
+class IndexWriter:
+    def __init__(self):
+        self.Groups = {}
+
+    def Add(self, FileOff, EvtRec):
+        GroupKey = (EvtRec[2], EvtRec[3])
+        EvtGroup = self.Groups.get(GroupKey)
+        if EvtGroup is None:
+            EvtGroup = self.Groups[GroupKey] = [array.array('Q'), EvtRec[1], EvtRec[1]]
+
+        EvtGroup[0].append(FileOff)
+        if EvtRec[1] < EvtGroup[1]:
+            EvtGroup[1] = EvtRec[1]
+        if EvtRec[1] > EvtGroup[2]:
+            EvtGroup[2] = EvtRec[1]
+
+    ###########################################################################
+    # Manifest Groups: [EventID, Provider, Start, Count, First, Last] - The   #
+    #  Offsets are written in this same (Sorted) Order                        #
+    ###########################################################################
+    def GroupRows(self):
+        GroupRows = []
+        OffStart = 0
+        for (EventID, Provider), (GroupOffs, FirstTime, LastTime) in sorted(self.Groups.items()):
+            GroupRows.append([EventID, Provider, OffStart, len(GroupOffs), FirstTime, LastTime])
+            OffStart += len(GroupOffs)
+        return GroupRows
+
+    def Save(self, EvtxName, IndexDir, EvtxSize, EvtxHash):
+        Manifest = {"Format": IndexFormat, "ByteOrder": sys.byteorder, "Size": EvtxSize, "Hash": EvtxHash, "Groups": self.GroupRows()}
+
+        try:
+            os.makedirs(IndexDir, exist_ok=True)
+
+            # Invalidate the old Index before its Offsets are replaced
+            if os.path.isfile(IndexPath(IndexDir, EvtxHash, "json")):
+                os.remove(IndexPath(IndexDir, EvtxHash, "json"))
+
+            with open(IndexPath(IndexDir, EvtxHash, "q"), "wb") as OffFile:
+                for GroupKey in sorted(self.Groups):
+                    self.Groups[GroupKey][0].tofile(OffFile)
+
+            with open(IndexPath(IndexDir, EvtxHash, "json"), 'w', encoding='utf8') as ManFile:
+                json.dump(Manifest, ManFile)
+
+        except OSError:
+            print("[!] Could not write the Event Index for: " + EvtxName)
+            return False
+
+        return True
+
+
+###########################################################################
+# Record Iterator for these EventIDs (Same Fields as EvtxRecords) - Uses  #
+#  the Index (In IndexDir) if it matches the Log, otherwise parses the    #
+#  whole Log and writes the Index for the next run                        #
+###########################################################################
+def IndexRecords(EvtxName, IndexDir, EventIDs=None, Workers=0, EvtxKey=None):
+    if not os.path.isfile(EvtxName):
+        return
+
+    EvtxSize, EvtxHash = EvtxKey or LogKey(EvtxName, IndexDir)
+
+    Manifest = LoadIndex(IndexDir, EvtxSize, EvtxHash)
+    if Manifest is not None:
+        try:
+            FileOffs = IndexOffsets(IndexDir, Manifest, EventIDs)
+        except OSError:
+            FileOffs = None
+
+        if FileOffs is not None:
+            print("[+] Using Event Index: " + os.path.basename(EvtxName) + " (" + str(len(FileOffs)) + " Records)")
+            for EvtRec in EvtxParse.OffsetRecords(EvtxName, FileOffs, Workers):
+                yield EvtRec
+            return
+
+    EvtIndex = IndexWriter()
+    for FileOff, EvtRec in EvtxParse.EvtxRecords(EvtxName, Workers, WithPos=True):
+        EvtIndex.Add(FileOff, EvtRec)
+        if EventIDs is None or EvtRec[2] in EventIDs:
+            yield EvtRec
+
+    EvtIndex.Save(EvtxName, IndexDir, EvtxSize, EvtxHash)
+
+
+###########################################################################
+# Index Groups for the whole Log (Record Counts and Time Ranges per       #
+#  EventID and Provider) - Builds the Index if it is not current          #
+###########################################################################
+def IndexSummary(EvtxName, IndexDir, Workers=0, EvtxKey=None):
+    if not os.path.isfile(EvtxName):
+        return []
+
+    EvtxSize, EvtxHash = EvtxKey or LogKey(EvtxName, IndexDir)
+
+    Manifest = LoadIndex(IndexDir, EvtxSize, EvtxHash)
+    if Manifest is not None:
+        return Manifest["Groups"]
+
+    EvtIndex = IndexWriter()
+    for FileOff, EvtRec in EvtxParse.EvtxRecords(EvtxName, Workers, WithPos=True):
+        EvtIndex.Add(FileOff, EvtRec)
+
+    EvtIndex.Save(EvtxName, IndexDir, EvtxSize, EvtxHash)
+    return EvtIndex.GroupRows()
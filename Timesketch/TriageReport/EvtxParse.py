@@ -0,0 +1,653 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Native EVTX Parser for TriageReport and ts_Transform              #
+#    mmap the Event Log, validate each 64KB Chunk (Signature and      #
+#    CRC32s), and decode the BinXML of every record in-process.       #
+#    Templates are parsed once per Chunk (Template Cache) and each    #
+#    record only fills in its Substitution Values.  Chunks are        #
+#    parsed in a process pool and the records come back in order.     #
+#    No LogParser/Wevtutil - Runs on any OS.                          #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Tolerate Dirty Chunks (Stale Header CRC) for In Place     #
+#           reads of the collected logs                               #
+#   v0.03 - Record File Offsets (WithPos) and Reads of single Records #
+#           by Offset for the Event Index (EvtIndex)                  #
+#######################################################################
+import os
+import mmap
+import zlib
+import struct
+import datetime
+import collections
+import concurrent.futures
+
+
+###########################################################################
+# EVTX Constants                                                          #
+###########################################################################
+FileSig = b"ElfFile\x00"
+ChunkSig = b"ElfChnk\x00"
+RecordSig = b"\x2a\x2a\x00\x00"
+
+HeaderSize = 4096
+ChunkSize = 65536
+RecordStart = 512
+
+EpochTime = datetime.datetime(1601, 1, 1)
+
+# Chunks per Worker Task - Keeps the pool overhead small
+ChunkGroup = 64
+
+# Records per Worker Task when reading by Offset (Event Index)
+OffsetGroup = 4096
+
+
+###########################################################################
+# BinXML Tokens (The 0x40 bit means "More Data" / "Has Attributes")       #
+###########################################################################
+TokEOF = 0x00
+TokOpenElem = 0x01
+TokCloseStart = 0x02
+TokCloseEmpty = 0x03
+TokEndElem = 0x04
+TokValue = 0x05
+TokAttr = 0x06
+TokCDATA = 0x07
+TokCharRef = 0x08
+TokEntityRef = 0x09
+TokPITarget = 0x0A
+TokPIData = 0x0B
+TokTemplate = 0x0C
+TokSubst = 0x0D
+TokOptSubst = 0x0E
+TokFragment = 0x0F
+
+EntityNames = {"amp": "&", "lt": "<", "gt": ">", "quot": "\"", "apos": "'"}
+
+
+class EvtxError(Exception):
+    pass
+
+
+###########################################################################
+# Value Formatting - One Function per BinXML Value Type                   #
+###########################################################################
+def FileTimeText(FileTime):
+    try:
+        return (EpochTime + datetime.timedelta(microseconds=FileTime // 10)).strftime("%Y-%m-%d %H:%M:%S.%f")
+    except OverflowError:
+        return ""
+
+
+def SIDText(Data):
+    if len(Data) < 8:
+        return Data.hex()
+    SubCount = Data[1]
+    Authority = int.from_bytes(Data[2:8], "big")
+    SubAuths = struct.unpack_from("<" + str(SubCount) + "I", Data, 8) if len(Data) >= 8 + SubCount * 4 else ()
+    return "S-" + str(Data[0]) + "-" + str(Authority) + "".join("-" + str(SubAuth) for SubAuth in SubAuths)
+
+
+def GUIDText(Data):
+    if len(Data) < 16:
+        return Data.hex()
+    Part1, Part2, Part3 = struct.unpack_from("<IHH", Data, 0)
+    return "{{{:08X}-{:04X}-{:04X}-{}-{}}}".format(Part1, Part2, Part3, Data[8:10].hex().upper(), Data[10:16].hex().upper())
+
+
+def SysTimeText(Data):
+    if len(Data) < 16:
+        return Data.hex()
+    Year, Month, WeekDay, Day, Hour, Minute, Second, MilliSec = struct.unpack_from("<8H", Data, 0)
+    return "{:04d}-{:02d}-{:02d} {:02d}:{:02d}:{:02d}.{:03d}".format(Year, Month, Day, Hour, Minute, Second, MilliSec)
+
+
+def UTF16Text(Data):
+    return Data.decode("utf-16-le", errors="replace").rstrip("\x00")
+
+
+FixedTypes = {
+    0x03: ("<b", 1), 0x04: ("<B", 1), 0x05: ("<h", 2), 0x06: ("<H", 2),
+    0x07: ("<i", 4), 0x08: ("<I", 4), 0x09: ("<q", 8), 0x0A: ("<Q", 8),
+    0x0B: ("<f", 4), 0x0C: ("<d", 8)
+}
+
+
+def ValueText(ValType, Data):
+    if ValType == 0x00:
+        return ""
+    if ValType == 0x01:
+        return UTF16Text(Data)
+    if ValType == 0x02:
+        return Data.decode("latin-1").rstrip("\x00")
+    if ValType in FixedTypes:
+        ValFmt, ValLen = FixedTypes[ValType]
+        if len(Data) < ValLen:
+            return ""
+        return str(struct.unpack_from(ValFmt, Data, 0)[0])
+    if ValType == 0x0D:
+        return "true" if Data and int.from_bytes(Data[:4], "little") != 0 else "false"
+    if ValType == 0x0E:
+        return Data.hex().upper()
+    if ValType == 0x0F:
+        return GUIDText(Data)
+    if ValType == 0x10:
+        return "0x" + format(int.from_bytes(Data, "little"), "x")
+    if ValType == 0x11:
+        if len(Data) < 8:
+            return ""
+        return FileTimeText(struct.unpack_from("<Q", Data, 0)[0])
+    if ValType == 0x12:
+        return SysTimeText(Data)
+    if ValType == 0x13:
+        return SIDText(Data)
+    if ValType == 0x14:
+        return "0x" + format(int.from_bytes(Data[:4], "little"), "08x")
+    if ValType == 0x15:
+        return "0x" + format(int.from_bytes(Data[:8], "little"), "016x")
+    if ValType == 0x81:
+        return ", ".join(ArrString for ArrString in UTF16Text(Data).split("\x00") if ArrString != "")
+    if ValType & 0x80 and (ValType & 0x7F) in FixedTypes:
+        ValFmt, ValLen = FixedTypes[ValType & 0x7F]
+        return ", ".join(str(struct.unpack_from(ValFmt, Data, ValOff)[0]) for ValOff in range(0, len(Data) - ValLen + 1, ValLen))
+    return Data.hex().upper()
+
+
+###########################################################################
+# One Chunk: Names and Templates are Chunk Relative, so both are cached   #
+#  per Chunk.  Template Nodes are:                                        #
+#   ("E", Name, [(AttrName, [Nodes])], [Child Nodes])  - Element          #
+#   ("T", Text)                                        - Text             #
+#   ("S", SubIndex)                                    - Substitution     #
+#   ("I", TemplateNodes, Values)                       - Instance         #
+###########################################################################
+class EvtxChunk:
+    def __init__(self, ChunkData):
+        self.Data = ChunkData
+        self.Names = {}
+        self.Templates = {}
+
+    def Name(self, NameOff):
+        ChunkName = self.Names.get(NameOff)
+        if ChunkName is None:
+            NameLen = struct.unpack_from("<H", self.Data, NameOff + 6)[0]
+            ChunkName = self.Data[NameOff + 8:NameOff + 8 + NameLen * 2].decode("utf-16-le", errors="replace")
+            self.Names[NameOff] = ChunkName
+        return ChunkName
+
+    ###########################################################################
+    # A Name Offset is followed by the Name itself if it points right here    #
+    ###########################################################################
+    def ReadName(self, Pos):
+        NameOff = struct.unpack_from("<I", self.Data, Pos)[0]
+        Pos += 4
+        if NameOff == Pos:
+            NameLen = struct.unpack_from("<H", self.Data, Pos + 6)[0]
+            Pos += 8 + NameLen * 2 + 2
+        return self.Name(NameOff), Pos
+
+    ###########################################################################
+    # Parse BinXML Nodes until EOF, End Element, or the End of the Data       #
+    ###########################################################################
+    def ReadNodes(self, Pos, EndPos):
+        Nodes = []
+        while Pos < EndPos:
+            Token = self.Data[Pos]
+            TokBase = Token & 0x0F
+
+            if TokBase == TokEOF:
+                return Nodes, Pos + 1
+
+            elif TokBase == TokEndElem:
+                return Nodes, Pos + 1
+
+            elif TokBase == TokFragment:
+                Pos += 4
+
+            elif TokBase == TokOpenElem:
+                ElemNode, Pos = self.ReadElement(Pos, EndPos)
+                Nodes.append(ElemNode)
+
+            elif TokBase == TokTemplate:
+                TmplNode, Pos = self.ReadTemplate(Pos)
+                Nodes.append(TmplNode)
+
+            elif TokBase in (TokValue, TokSubst, TokCDATA, TokCharRef, TokEntityRef, TokOptSubst):
+                ValNode, Pos = self.ReadValue(Pos)
+                Nodes.append(ValNode)
+
+            elif TokBase == TokPITarget:
+                PIName, Pos = self.ReadName(Pos + 1)
+
+            elif TokBase == TokPIData:
+                PILen = struct.unpack_from("<H", self.Data, Pos + 1)[0]
+                Pos += 3 + PILen * 2
+
+            else:
+                raise EvtxError("Unknown BinXML Token: " + hex(Token) + " at " + str(Pos))
+
+        return Nodes, Pos
+
+    def ReadValue(self, Pos):
+        Token = self.Data[Pos]
+        TokBase = Token & 0x0F
+
+        if TokBase == TokValue:
+            ValType = self.Data[Pos + 1]
+            ValLen = struct.unpack_from("<H", self.Data, Pos + 2)[0]
+            if ValType == 0x01:
+                return ("T", self.Data[Pos + 4:Pos + 4 + ValLen * 2].decode("utf-16-le", errors="replace")), Pos + 4 + ValLen * 2
+            return ("T", ValueText(ValType, self.Data[Pos + 4:Pos + 4 + ValLen])), Pos + 4 + ValLen
+
+        if TokBase in (TokSubst, TokOptSubst):
+            SubIndex = struct.unpack_from("<H", self.Data, Pos + 1)[0]
+            return ("S", SubIndex), Pos + 4
+
+        if TokBase == TokCDATA:
+            ValLen = struct.unpack_from("<H", self.Data, Pos + 1)[0]
+            return ("T", self.Data[Pos + 3:Pos + 3 + ValLen * 2].decode("utf-16-le", errors="replace")), Pos + 3 + ValLen * 2
+
+        if TokBase == TokCharRef:
+            return ("T", chr(struct.unpack_from("<H", self.Data, Pos + 1)[0])), Pos + 3
+
+        EntName, Pos = self.ReadName(Pos + 1)
+        return ("T", EntityNames.get(EntName, "&" + EntName + ";")), Pos
+
+    def ReadElement(self, Pos, EndPos):
+        Token = self.Data[Pos]
+        ElemName, Pos = self.ReadName(Pos + 7)
+
+        if Token & 0x40:
+            Pos += 4
+
+        ElemAttrs = []
+        while Pos < EndPos:
+            TokBase = self.Data[Pos] & 0x0F
+
+            if TokBase == TokAttr:
+                AttrName, Pos = self.ReadName(Pos + 1)
+                AttrVals = []
+                while Pos < EndPos and (self.Data[Pos] & 0x0F) in (TokValue, TokSubst, TokOptSubst, TokCharRef, TokEntityRef, TokCDATA):
+                    ValNode, Pos = self.ReadValue(Pos)
+                    AttrVals.append(ValNode)
+                ElemAttrs.append((AttrName, AttrVals))
+
+            elif TokBase == TokCloseStart:
+                Children, Pos = self.ReadNodes(Pos + 1, EndPos)
+                return ("E", ElemName, ElemAttrs, Children), Pos
+
+            elif TokBase == TokCloseEmpty:
+                return ("E", ElemName, ElemAttrs, []), Pos + 1
+
+            else:
+                raise EvtxError("Unexpected Token in Element: " + hex(self.Data[Pos]) + " at " + str(Pos))
+
+        raise EvtxError("Element runs past the Record: " + ElemName)
+
+    ###########################################################################
+    # Template Instance: The Definition is parsed once per Chunk (Cache),     #
+    #  then the Substitution Values of this Instance are read                 #
+    ###########################################################################
+    def ReadTemplate(self, Pos):
+        DefOff = struct.unpack_from("<I", self.Data, Pos + 6)[0]
+        Pos += 10
+
+        TmplNodes = self.Templates.get(DefOff)
+        if TmplNodes is None:
+            DefSize = struct.unpack_from("<I", self.Data, DefOff + 20)[0]
+            TmplNodes, DefEnd = self.ReadNodes(DefOff + 24, DefOff + 24 + DefSize)
+            self.Templates[DefOff] = TmplNodes
+
+        if DefOff == Pos:
+            DefSize = struct.unpack_from("<I", self.Data, DefOff + 20)[0]
+            Pos = DefOff + 24 + DefSize
+
+        SubCount = struct.unpack_from("<I", self.Data, Pos)[0]
+        SubDescs = []
+        for SubIndx in range(SubCount):
+            SubDescs.append(struct.unpack_from("<HB", self.Data, Pos + 4 + SubIndx * 4))
+        Pos += 4 + SubCount * 4
+
+        Values = []
+        for SubLen, SubType in SubDescs:
+            SubData = self.Data[Pos:Pos + SubLen]
+            if SubType == 0x21:
+                # Embedded BinXML (Like EventData from a Provider Template)
+                SubNodes, SubEnd = self.ReadNodes(Pos, Pos + SubLen)
+                Values.append(SubNodes)
+            else:
+                Values.append(ValueText(SubType, SubData))
+            Pos += SubLen
+
+        return ("I", TmplNodes, Values), Pos
+
+
+###########################################################################
+# Fill the Substitutions in: Returns Elements as (Name, {Attrs}, [Kids])  #
+#  where a Kid is an Element or a Text string                             #
+###########################################################################
+def RenderNodes(Nodes, Values):
+    Rendered = []
+    for Node in Nodes:
+        NodeType = Node[0]
+
+        if NodeType == "T":
+            Rendered.append(Node[1])
+
+        elif NodeType == "S":
+            if Node[1] < len(Values):
+                SubVal = Values[Node[1]]
+                if isinstance(SubVal, list):
+                    Rendered.extend(RenderNodes(SubVal, ()))
+                elif SubVal != "":
+                    Rendered.append(SubVal)
+
+        elif NodeType == "I":
+            Rendered.extend(RenderNodes(Node[1], Node[2]))
+
+        else:
+            ElemAttrs = {}
+            for AttrName, AttrVals in Node[2]:
+                ElemAttrs[AttrName] = "".join(AttrText for AttrText in RenderNodes(AttrVals, Values) if isinstance(AttrText, str))
+            Rendered.append((Node[1], ElemAttrs, RenderNodes(Node[3], Values)))
+
+    return Rendered
+
+
+def ElemText(Element):
+    return "".join(Kid if isinstance(Kid, str) else ElemText(Kid) for Kid in Element[2])
+
+
+def ElemChild(Element, ChildName):
+    for Kid in Element[2]:
+        if not isinstance(Kid, str) and Kid[0] == ChildName:
+            return Kid
+    return None
+
+
+###########################################################################
+# Pull the Report Fields out of one rendered Event:                       #
+#  (RecordID, TimeCreated, EventID, Provider, Channel, Computer, Level,   #
+#   Task, EventData) - EventData is a list of (Name, Value)               #
+###########################################################################
+def EventFields(RecordID, WrittenTime, EvtElem):
+    EventID = 0
+    Provider = Channel = Computer = ""
+    Level = Task = ""
+    TimeCreated = WrittenTime
+    EventData = []
+
+    SysElem = ElemChild(EvtElem, "System")
+    if SysElem is not None:
+        for Kid in SysElem[2]:
+            if isinstance(Kid, str):
+                continue
+            KidName = Kid[0]
+            if KidName == "EventID":
+                try:
+                    EventID = int(ElemText(Kid))
+                except ValueError:
+                    EventID = 0
+            elif KidName == "Provider":
+                Provider = Kid[1].get("Name", "")
+            elif KidName == "TimeCreated":
+                TimeCreated = Kid[1].get("SystemTime", WrittenTime) or WrittenTime
+            elif KidName == "Channel":
+                Channel = ElemText(Kid)
+            elif KidName == "Computer":
+                Computer = ElemText(Kid)
+            elif KidName == "Level":
+                Level = ElemText(Kid)
+            elif KidName == "Task":
+                Task = ElemText(Kid)
+
+    DataElem = ElemChild(EvtElem, "EventData")
+    if DataElem is not None:
+        for Kid in DataElem[2]:
+            if isinstance(Kid, str):
+                if Kid.strip() != "":
+                    EventData.append(("", Kid))
+            else:
+                EventData.append((Kid[1].get("Name", Kid[0]), ElemText(Kid)))
+    else:
+        UserElem = ElemChild(EvtElem, "UserData")
+        if UserElem is not None:
+            for UserKid in UserElem[2]:
+                if not isinstance(UserKid, str):
+                    for Kid in UserKid[2]:
+                        if not isinstance(Kid, str):
+                            EventData.append((Kid[0], ElemText(Kid)))
+
+    return (RecordID, TimeCreated, EventID, Provider, Channel, Computer, Level, Task, EventData)
+
+
+###########################################################################
+# Validate a Chunk - Returns (FreeOff, HeadGood), or None if not a Chunk  #
+#  The Header CRC covers 0-120 and 128-512.  The Records are not held to  #
+#  the Data CRC - Each one is checked on its own (ChunkRecords)           #
+#                                                                         #
+#  A dirty log (Copied while in use, never exported) often has a Chunk    #
+#   whose Header was not updated - The Free Space Offset is not trusted   #
+#   then, and the Records are walked to the end of the Chunk instead      #
+###########################################################################
+def CheckChunk(ChunkData):
+    if len(ChunkData) < RecordStart or ChunkData[0:8] != ChunkSig:
+        return None
+
+    FreeOff = struct.unpack_from("<I", ChunkData, 48)[0]
+    HeadCRC = struct.unpack_from("<I", ChunkData, 124)[0]
+
+    HeadGood = zlib.crc32(ChunkData[0:120] + ChunkData[128:512]) == HeadCRC
+    if not HeadGood or FreeOff < RecordStart or FreeOff > len(ChunkData):
+        FreeOff = len(ChunkData)
+
+    return (FreeOff, HeadGood)
+
+
+###########################################################################
+# Read the Record at RecPos - Returns (RecSize, Event Fields).  RecSize   #
+#  is 0 if there is no valid Record there (Signature and the Size copy    #
+#  at its end), and the Fields are None if its BinXML could not be read   #
+###########################################################################
+def ReadRecord(EvtChunk, RecPos):
+    ChunkData = EvtChunk.Data
+    if RecPos + 24 > len(ChunkData) or ChunkData[RecPos:RecPos + 4] != RecordSig:
+        return 0, None
+
+    RecSize, RecordID, WrittenFT = struct.unpack_from("<IQQ", ChunkData, RecPos + 4)
+    if RecSize < 28 or RecPos + RecSize > len(ChunkData):
+        return 0, None
+    if struct.unpack_from("<I", ChunkData, RecPos + RecSize - 4)[0] != RecSize:
+        return 0, None
+
+    try:
+        RecNodes, RecEnd = EvtChunk.ReadNodes(RecPos + 24, RecPos + RecSize - 4)
+        for EvtElem in RenderNodes(RecNodes, ()):
+            if not isinstance(EvtElem, str) and EvtElem[0] == "Event":
+                return RecSize, EventFields(RecordID, FileTimeText(WrittenFT), EvtElem)
+    except (EvtxError, struct.error, IndexError, ValueError, RecursionError):
+        # One bad record does not spoil the rest of the Chunk
+        pass
+
+    return RecSize, None
+
+
+###########################################################################
+# Parse the Records in one Chunk - Each record is checked, and a bad      #
+#  record ends the Chunk.  This is what keeps dirty or partial            #
+#  (Truncated) Chunks usable.  WithPos returns (RecPos, Fields) pairs     #
+###########################################################################
+def ChunkRecords(ChunkData, WithPos=False):
+    ChunkHead = CheckChunk(ChunkData)
+    if ChunkHead is None:
+        return []
+
+    FreeOff, HeadGood = ChunkHead
+    EvtChunk = EvtxChunk(ChunkData)
+    ChunkRecs = []
+
+    RecPos = RecordStart
+    while RecPos + 24 <= FreeOff:
+        RecSize, EvtRec = ReadRecord(EvtChunk, RecPos)
+        if RecSize == 0:
+            break
+
+        if EvtRec is not None:
+            ChunkRecs.append((RecPos, EvtRec) if WithPos else EvtRec)
+
+        RecPos += RecSize
+
+    return ChunkRecs
+
+
+###########################################################################
+# Parse a Group of Chunks (Runs in the Worker Process)                    #
+#  WithPos returns (File Offset, Fields) pairs                            #
+###########################################################################
+def ParseChunks(EvtxName, FirstChunk, ChunkCount, WithPos=False):
+    GroupRecs = []
+    with open(EvtxName, "rb") as EvtxFile:
+        for ChunkIndx in range(FirstChunk, FirstChunk + ChunkCount):
+            ChunkOff = HeaderSize + ChunkIndx * ChunkSize
+            EvtxFile.seek(ChunkOff)
+            ChunkData = EvtxFile.read(ChunkSize)
+            if len(ChunkData) < RecordStart:
+                break
+            if WithPos:
+                GroupRecs.extend((ChunkOff + RecPos, EvtRec) for RecPos, EvtRec in ChunkRecords(ChunkData, True))
+            else:
+                GroupRecs.extend(ChunkRecords(ChunkData))
+    return GroupRecs
+
+
+###########################################################################
+# Parse only the Records at these (Sorted) File Offsets - The Chunk is    #
+#  read once for all of its Records, and its Templates are still found    #
+#  by their Chunk Offset (No need to walk the Records before them)        #
+###########################################################################
+def ParseOffsets(EvtxName, FileOffs):
+    OffRecs = []
+    ChunkOff = -1
+    EvtChunk = None
+
+    with open(EvtxName, "rb") as EvtxFile:
+        for FileOff in FileOffs:
+            if FileOff < HeaderSize:
+                continue
+
+            NextOff = HeaderSize + ((FileOff - HeaderSize) // ChunkSize) * ChunkSize
+            if NextOff != ChunkOff:
+                ChunkOff = NextOff
+                EvtxFile.seek(ChunkOff)
+                ChunkData = EvtxFile.read(ChunkSize)
+                EvtChunk = EvtxChunk(ChunkData) if CheckChunk(ChunkData) is not None else None
+
+            if EvtChunk is None:
+                continue
+
+            RecSize, EvtRec = ReadRecord(EvtChunk, FileOff - ChunkOff)
+            if EvtRec is not None:
+                OffRecs.append(EvtRec)
+
+    return OffRecs
+
+
+###########################################################################
+# Number of Chunks - Every 64KB block in the File is tried (A dirty log   #
+#  can have more Chunks than its File Header says)                        #
+###########################################################################
+def ChunkCount(EvtxName):
+    with open(EvtxName, "rb") as EvtxFile:
+        if EvtxFile.read(8) != FileSig:
+            return 0
+        FileSize = os.fstat(EvtxFile.fileno()).st_size
+
+    if FileSize <= HeaderSize:
+        return 0
+    return (FileSize - HeaderSize + ChunkSize - 1) // ChunkSize
+
+
+###########################################################################
+# Record Iterator - Yields (RecordID, TimeCreated, EventID, Provider,     #
+#  Channel, Computer, Level, Task, EventData) in File Order               #
+#  Workers < 2 parses the Chunks in this process (mmap)                   #
+#  WithPos yields (File Offset, Fields) pairs                             #
+###########################################################################
+def EvtxRecords(EvtxName, Workers=0, WithPos=False):
+    Chunks = ChunkCount(EvtxName)
+    if Chunks == 0:
+        return
+
+    if Workers < 2 or Chunks <= ChunkGroup:
+        with open(EvtxName, "rb") as EvtxFile:
+            EvtxMap = mmap.mmap(EvtxFile.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                for ChunkIndx in range(Chunks):
+                    ChunkOff = HeaderSize + ChunkIndx * ChunkSize
+                    if WithPos:
+                        for RecPos, EvtRec in ChunkRecords(EvtxMap[ChunkOff:ChunkOff + ChunkSize], True):
+                            yield (ChunkOff + RecPos, EvtRec)
+                    else:
+                        for EvtRec in ChunkRecords(EvtxMap[ChunkOff:ChunkOff + ChunkSize]):
+                            yield EvtRec
+            finally:
+                EvtxMap.close()
+        return
+
+    # Keep only a couple of Chunk Groups per worker in flight to bound memory
+    with concurrent.futures.ProcessPoolExecutor(max_workers=Workers) as EvtxPool:
+        InFlight = collections.deque()
+        NextChunk = 0
+
+        while NextChunk < Chunks or InFlight:
+            while NextChunk < Chunks and len(InFlight) < Workers * 2:
+                InFlight.append(EvtxPool.submit(ParseChunks, EvtxName, NextChunk, min(ChunkGroup, Chunks - NextChunk), WithPos))
+                NextChunk += ChunkGroup
+
+            for EvtRec in InFlight.popleft().result():
+                yield EvtRec
+
+
+###########################################################################
+# Record Iterator over a list of (Sorted) File Offsets - Same Fields and  #
+#  Order as EvtxRecords, but only those Records are parsed                #
+###########################################################################
+def OffsetRecords(EvtxName, FileOffs, Workers=0):
+    if Workers < 2 or len(FileOffs) <= OffsetGroup:
+        for EvtRec in ParseOffsets(EvtxName, FileOffs):
+            yield EvtRec
+        return
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=Workers) as EvtxPool:
+        InFlight = collections.deque()
+        NextOff = 0
+
+        while NextOff < len(FileOffs) or InFlight:
+            while NextOff < len(FileOffs) and len(InFlight) < Workers * 2:
+                InFlight.append(EvtxPool.submit(ParseOffsets, EvtxName, FileOffs[NextOff:NextOff + OffsetGroup]))
+                NextOff += OffsetGroup
+
+            for EvtRec in InFlight.popleft().result():
+                yield EvtRec
+
+
+###########################################################################
+# Records for the Event Extractor (Same as a LogParser Query Row):        #
+#  (Date, EventID, SourceName, EventCategoryName, Strings, Message)       #
+#   There is no Message DLL here - Message is the EventData Name: Value   #
+#   lines, and EventCategoryName is the Task Number                       #
+###########################################################################
+def ReportRecord(EvtRec):
+    RecordID, TimeCreated, EventID, Provider, Channel, Computer, Level, Task, EventData = EvtRec
+    EvtStrs = [DataValue for DataName, DataValue in EventData]
+    EvtMsg = "\n".join(DataName + ": " + DataValue for DataName, DataValue in EventData)
+    return (TimeCreated[:19], EventID, Provider, Task, EvtStrs, EvtMsg)
+
+
+def ReportRecords(EvtxName, Workers=0):
+    for EvtRec in EvtxRecords(EvtxName, Workers):
+        yield ReportRecord(EvtRec)
@@ -0,0 +1,132 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Multi-Pattern IOC Matcher for TriageReport                        #
+#    Built once from the IOC: config lines (Aho-Corasick automaton)   #
+#    and called by every report section.  One scan of the row         #
+#    returns every IOC that hit, and keeps the per-IOC hit counts     #
+#    for the IOC Summary Section.                                     #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#######################################################################
+import re
+
+
+###########################################################################
+# Small IOC Lists are faster with plain substring checks against the      #
+#  (single) lowercased row - Use the Automaton above this many IOCs       #
+###########################################################################
+SmallList = 16
+
+
+class IOCMatcher:
+    def __init__(self, IOCList, MinAuto=SmallList):
+        self.IOCList = [AnyIOC.lower() for AnyIOC in IOCList]
+        self.IOCount = [0] * len(self.IOCList)
+        self.Always = []
+        self.Goto = None
+
+        if len(self.IOCList) > MinAuto:
+            self.Compile()
+
+    ###########################################################################
+    # Build the Trie (Goto), the Failure Links, and the Output Sets           #
+    ###########################################################################
+    def Compile(self):
+        Goto = [{}]
+        Out = [[]]
+
+        for IOCIndx, AnyIOC in enumerate(self.IOCList):
+            if AnyIOC == "":
+                # An empty IOC is "in" every row (Same as the substring check)
+                self.Always.append(IOCIndx)
+                continue
+
+            State = 0
+            for Char in AnyIOC:
+                NxtState = Goto[State].get(Char)
+                if NxtState is None:
+                    NxtState = len(Goto)
+                    Goto.append({})
+                    Out.append([])
+                    Goto[State][Char] = NxtState
+                State = NxtState
+            Out[State].append(IOCIndx)
+
+        # Breadth First to set the Failure Links and merge Outputs
+        Fail = [0] * len(Goto)
+        Queue = list(Goto[0].values())
+        QueIndx = 0
+        while QueIndx < len(Queue):
+            State = Queue[QueIndx]
+            QueIndx += 1
+            for Char, NxtState in Goto[State].items():
+                Queue.append(NxtState)
+                FailState = Fail[State]
+                while FailState and Char not in Goto[FailState]:
+                    FailState = Fail[FailState]
+                Fail[NxtState] = Goto[FailState].get(Char, 0)
+                if Fail[NxtState] == NxtState:
+                    Fail[NxtState] = 0
+                Out[NxtState] = Out[NxtState] + Out[Fail[NxtState]]
+
+        self.Goto = Goto
+        self.Fail = Fail
+        self.Out = [tuple(AnyOut) for AnyOut in Out]
+
+        # Skip ahead (in C) to the next char that can start an IOC
+        FirstChars = "".join(Goto[0].keys())
+        if FirstChars == "":
+            self.FirstRe = None
+        else:
+            self.FirstRe = re.compile("[" + re.escape(FirstChars) + "]")
+
+    ###########################################################################
+    # Return the Indexes of every IOC found in the Row (Does Not Count)       #
+    ###########################################################################
+    def Hits(self, RowString):
+        RowLower = RowString.lower()
+
+        if self.Goto is None:
+            return [IOCIndx for IOCIndx, AnyIOC in enumerate(self.IOCList) if AnyIOC in RowLower]
+
+        Found = set(self.Always)
+        if self.FirstRe is None:
+            return sorted(Found)
+
+        Goto = self.Goto
+        Fail = self.Fail
+        Out = self.Out
+        FirstRe = self.FirstRe
+
+        State = 0
+        Pos = 0
+        RowLen = len(RowLower)
+        while Pos < RowLen:
+            if State == 0:
+                FirstHit = FirstRe.search(RowLower, Pos)
+                if FirstHit is None:
+                    break
+                Pos = FirstHit.start()
+
+            Char = RowLower[Pos]
+            while State and Char not in Goto[State]:
+                State = Fail[State]
+            State = Goto[State].get(Char, 0)
+            if Out[State]:
+                Found.update(Out[State])
+            Pos += 1
+
+        return sorted(Found)
+
+    ###########################################################################
+    # Count the Hits for the IOC Summary, return 1 if any IOC was Found       #
+    ###########################################################################
+    def Check(self, RowString):
+        IOCGotHit = 0
+        for IOCIndx in self.Hits(RowString):
+            self.IOCount[IOCIndx] += 1
+            IOCGotHit = 1
+        return IOCGotHit
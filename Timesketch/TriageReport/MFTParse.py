@@ -0,0 +1,307 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Native NTFS $MFT Parser for TriageReport                          #
+#    mmap the collected $MFT and decode the FILE records in-process   #
+#    (fixups, $STANDARD_INFORMATION, $FILE_NAME, $DATA size).  This   #
+#    removes the need for MFTDump.exe/MFTECmd.exe and the CSV round   #
+#    trip, and runs on any OS.                                        #
+#                                                                     #
+#   Note: Attributes moved to extension records ($ATTRIBUTE_LIST)     #
+#         are not followed - those files will report a Size of 0      #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - MACB Timeline Rows for the ts_Transform $MFT Export       #
+#   v0.03 - Bounds Checks on Resident Content - A Bad Record is       #
+#           Dropped, not the whole Parse                              #
+#######################################################################
+import os
+import mmap
+import struct
+import datetime
+
+
+###########################################################################
+# NTFS Constants                                                          #
+###########################################################################
+AttrSI = 0x10
+AttrFN = 0x30
+AttrData = 0x80
+AttrEnd = 0xFFFFFFFF
+
+FlagInUse = 0x01
+FlagIsDir = 0x02
+
+RootRecord = 5
+NoParent = -1
+
+EpochDiff = 116444736000000000
+EpochTime = datetime.datetime(1970, 1, 1)
+
+
+###########################################################################
+# Convert a FILETIME to the same text the report shows (UTC)              #
+###########################################################################
+def FileTimeStr(FileTime):
+    if FileTime == 0:
+        return ""
+    try:
+        TimeStamp = EpochTime + datetime.timedelta(microseconds=(FileTime - EpochDiff) // 10)
+    except OverflowError:
+        return ""
+    return TimeStamp.strftime("%Y-%m-%d %H:%M:%S")
+
+
+###########################################################################
+# Convert a FILETIME to an ISO 8601 Timestamp (UTC) for Timesketch        #
+###########################################################################
+def FileTimeISO(FileTime):
+    if FileTime == 0:
+        return ""
+    try:
+        TimeStamp = EpochTime + datetime.timedelta(microseconds=(FileTime - EpochDiff) // 10)
+    except OverflowError:
+        return ""
+    return TimeStamp.isoformat(timespec="microseconds") + "+00:00"
+
+
+###########################################################################
+# Apply the Update Sequence Array (Fixups) to a copy of the Record        #
+#  Returns None if the Record is torn (Fixup does not match)              #
+###########################################################################
+def FixupRecord(MFTMap, RecOffset, RecSize):
+    RecBuff = bytearray(MFTMap[RecOffset:RecOffset + RecSize])
+    USAOffset, USACount = struct.unpack_from("<HH", RecBuff, 4)
+    if USACount < 2 or USAOffset + USACount * 2 > RecSize:
+        return None
+
+    USN = RecBuff[USAOffset:USAOffset + 2]
+    for USAIndx in range(1, USACount):
+        SectEnd = USAIndx * 512 - 2
+        if SectEnd + 2 > RecSize:
+            break
+        if RecBuff[SectEnd:SectEnd + 2] != USN:
+            return None
+        FixOff = USAOffset + USAIndx * 2
+        RecBuff[SectEnd:SectEnd + 2] = RecBuff[FixOff:FixOff + 2]
+
+    return RecBuff
+
+
+###########################################################################
+# Decode one FILE Record into its $SI times, best $FN, and $DATA Size     #
+###########################################################################
+def DecodeRecord(RecBuff):
+    AttrOffset = struct.unpack_from("<H", RecBuff, 0x14)[0]
+    RecFlags = struct.unpack_from("<H", RecBuff, 0x16)[0]
+    BaseRef = struct.unpack_from("<Q", RecBuff, 0x20)[0] & 0xFFFFFFFFFFFF
+    RecLen = len(RecBuff)
+
+    SITimes = None
+    FNTimes = None
+    FNName = None
+    FNParent = NoParent
+    FNSpace = -1
+    DataSize = 0
+
+    while AttrOffset + 16 <= RecLen:
+        AttrType, AttrLen = struct.unpack_from("<II", RecBuff, AttrOffset)
+        if AttrType == AttrEnd or AttrLen < 16 or AttrOffset + AttrLen > RecLen:
+            break
+
+        NonResident = RecBuff[AttrOffset + 8]
+        NameLen = RecBuff[AttrOffset + 9]
+
+        if NonResident == 0 and AttrLen >= 0x18:
+            ContSize, ContOff = struct.unpack_from("<IH", RecBuff, AttrOffset + 0x10)
+            ContStart = AttrOffset + ContOff
+
+            # Content must lie inside the Attribute (Skip it if not)
+            if ContOff + ContSize > AttrLen:
+                pass
+
+            elif AttrType == AttrSI and ContSize >= 32:
+                # Created, Modified, MFT Entry Modified, Accessed
+                SITimes = struct.unpack_from("<QQQQ", RecBuff, ContStart)
+
+            elif AttrType == AttrFN and ContSize >= 0x42:
+                ParentRef = struct.unpack_from("<Q", RecBuff, ContStart)[0]
+                FNLen = RecBuff[ContStart + 0x40]
+                NameSpace = RecBuff[ContStart + 0x41]
+                if 0x42 + FNLen * 2 > ContSize:
+                    NameSpace = -1
+
+                # Prefer the Win32 (1) or Win32 & DOS (3) Name over DOS (2) or POSIX (0)
+                if NameSpace == -1:
+                    NameRank = -1
+                elif NameSpace == 2:
+                    NameRank = 0
+                elif NameSpace == 0:
+                    NameRank = 1
+                else:
+                    NameRank = 2
+
+                if NameRank > FNSpace:
+                    FNSpace = NameRank
+                    FNParent = ParentRef & 0xFFFFFFFFFFFF
+                    FNTimes = struct.unpack_from("<QQQQ", RecBuff, ContStart + 8)
+                    FNName = bytes(RecBuff[ContStart + 0x42:ContStart + 0x42 + FNLen * 2]).decode("utf-16-le", errors="replace")
+
+            elif AttrType == AttrData and NameLen == 0:
+                DataSize = ContSize
+
+        elif NonResident != 0 and AttrType == AttrData and NameLen == 0 and AttrLen >= 0x38:
+            StartVCN = struct.unpack_from("<Q", RecBuff, AttrOffset + 0x10)[0]
+            if StartVCN == 0:
+                DataSize = struct.unpack_from("<Q", RecBuff, AttrOffset + 0x30)[0]
+
+        AttrOffset += AttrLen
+
+    return (RecFlags, BaseRef, SITimes, FNTimes, FNName, FNParent, DataSize)
+
+
+###########################################################################
+# Walk the $MFT - Yields (RecNum, DecodeRecord()) for every good FILE     #
+#  record (DirsOnly: Directory records only).  A record that is torn or   #
+#  does not Decode is Dropped - One bad record does not stop the Parse    #
+###########################################################################
+def WalkRecords(MFTMap, DirsOnly=False):
+    MFTSize = len(MFTMap)
+    if MFTSize < 0x20 or MFTMap[0:4] != b"FILE":
+        return
+
+    RecSize = struct.unpack_from("<I", MFTMap, 0x1C)[0]
+    if RecSize not in (1024, 2048, 4096):
+        RecSize = 1024
+
+    RecNum = 0
+    for RecOffset in range(0, MFTSize - RecSize + 1, RecSize):
+        if MFTMap[RecOffset:RecOffset + 4] == b"FILE":
+            try:
+                RecBuff = FixupRecord(MFTMap, RecOffset, RecSize)
+                if RecBuff is not None and (not DirsOnly or struct.unpack_from("<H", RecBuff, 0x16)[0] & FlagIsDir):
+                    DecRec = DecodeRecord(RecBuff)
+                else:
+                    DecRec = None
+            except (struct.error, IndexError):
+                DecRec = None
+
+            if DecRec is not None:
+                yield RecNum, DecRec
+        RecNum += 1
+
+
+###########################################################################
+# Full Entry Iterator:                                                    #
+#  (RecNum, InUse, IsDir, FullPath, SITimes, FNTimes, Size)               #
+#   SITimes/FNTimes are FILETIME tuples: (Created, Modified, MFTModified, #
+#   Accessed) - or None if the attribute is missing                       #
+#                                                                         #
+#  Pass 1 keeps only Directory Names & Parents (Small vs. the whole MFT)  #
+#  Pass 2 decodes every base record and resolves its Full Path            #
+###########################################################################
+def MFTEntries(MFTName):
+    with open(MFTName, "rb") as MFTFile:
+        if os.fstat(MFTFile.fileno()).st_size == 0:
+            return
+        MFTMap = mmap.mmap(MFTFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            DirNames = {}
+            for RecNum, DecRec in WalkRecords(MFTMap, DirsOnly=True):
+                if DecRec[1] == 0 and DecRec[4] is not None:
+                    DirNames[RecNum] = (DecRec[5], DecRec[4])
+
+            DirPaths = {RootRecord: "."}
+
+            def DirPath(DirNum):
+                PathParts = []
+                SeenDirs = set()
+                CurDir = DirNum
+                while CurDir not in DirPaths:
+                    if CurDir in SeenDirs or CurDir not in DirNames:
+                        PathParts.append("$OrphanFiles")
+                        CurPath = "."
+                        break
+                    SeenDirs.add(CurDir)
+                    ParentNum, DirName = DirNames[CurDir]
+                    PathParts.append((CurDir, DirName))
+                    CurDir = ParentNum
+                else:
+                    CurPath = DirPaths[CurDir]
+
+                for PathPart in reversed(PathParts):
+                    if PathPart == "$OrphanFiles":
+                        CurPath = CurPath + "\\" + PathPart
+                    else:
+                        CurPath = CurPath + "\\" + PathPart[1]
+                        DirPaths[PathPart[0]] = CurPath
+                return CurPath
+
+            for RecNum, (RecFlags, BaseRef, SITimes, FNTimes, FNName, FNParent, DataSize) in WalkRecords(MFTMap):
+
+                # Extension Records belong to a Base Record - Skip them
+                if BaseRef != 0 or FNName is None:
+                    continue
+
+                if RecNum == RootRecord:
+                    FullPath = "."
+                else:
+                    FullPath = DirPath(FNParent) + "\\" + FNName
+
+                yield (RecNum, RecFlags & FlagInUse, RecFlags & FlagIsDir, FullPath, SITimes, FNTimes, DataSize)
+
+        finally:
+            MFTMap.close()
+
+
+###########################################################################
+# Normalized Records for the MFT Section Engine (Same as ReadMFTDump):    #
+#  (Deleted, FullPath, Created, Accessed, Modified, Size)                 #
+###########################################################################
+def ReadMFTNative(MFTName):
+    for RecNum, InUse, IsDir, FullPath, SITimes, FNTimes, DataSize in MFTEntries(MFTName):
+        if InUse:
+            Deleted = "0"
+        else:
+            Deleted = "1"
+
+        if SITimes is None:
+            SITimes = FNTimes or (0, 0, 0, 0)
+
+        yield (Deleted, FullPath, FileTimeStr(SITimes[0]), FileTimeStr(SITimes[3]), FileTimeStr(SITimes[1]), str(DataSize))
+
+
+###########################################################################
+# MACB Timeline Rows - One Row per distinct Timestamp in each Attribute:  #
+#  (ISOTime, Attr, MACB, RecNum, InUse, IsDir, FullPath, Size)            #
+#   Attr is "$SI" or "$FN", MACB is like "M.C." (Modified, Accessed,      #
+#   MFT Entry Changed, Born) - Streams one Entry at a time                #
+###########################################################################
+MACBOrder = ((1, "M"), (3, "A"), (2, "C"), (0, "B"))
+
+
+def MFTTimeline(MFTName):
+    for RecNum, InUse, IsDir, FullPath, SITimes, FNTimes, DataSize in MFTEntries(MFTName):
+        for Attr, AttrTimes in (("$SI", SITimes), ("$FN", FNTimes)):
+            if AttrTimes is None:
+                continue
+
+            for FileTime in sorted(set(AttrTimes)):
+                if FileTime == 0:
+                    continue
+
+                ISOTime = FileTimeISO(FileTime)
+                if ISOTime == "":
+                    continue
+
+                MACB = ""
+                for TimeIndx, TimeChar in MACBOrder:
+                    if AttrTimes[TimeIndx] == FileTime:
+                        MACB = MACB + TimeChar
+                    else:
+                        MACB = MACB + "."
+
+                yield (ISOTime, Attr, MACB, RecNum, InUse, IsDir, FullPath, DataSize)
@@ -0,0 +1,311 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Sharded (Parallel) Chainsaw and Hayabusa Runs                     #
+#    The Event Logs are split into Size Balanced Shards (Largest      #
+#    first, into the Shard with the fewest Bytes), and one Tool       #
+#    instance runs per Shard, EvtShrd:n at a time.  Whole Logs are    #
+#    Hard Linked, not Copied.                                         #
+#                                                                     #
+#   SplitLogs (EvtSplt:Yes, Off by Default): A Log bigger than one    #
+#    Shard (The 4GB Security.evtx) is cut into Pieces on its 64KB     #
+#    Chunk boundaries - Every Chunk stands on its own, so each Piece  #
+#    is a valid .evtx (Copied File Header, Chunk Count and CRC fixed  #
+#    up).  But each Piece is seen by a different Tool instance, so    #
+#    Count/Timeframe Rules (Chainsaw login_attacks, Hayabusa Count    #
+#    Rules) can not group Events across a Piece boundary - A Burst    #
+#    split between two Pieces may be missed.                          #
+#                                                                     #
+#   Layout (Under the Work Directory):                                #
+#    Snn\Evtx           - Shard Input (Links and Pieces)              #
+#    Snn\Evtx\Pnn       - One Piece of a Split Log (Same File Name)   #
+#    Snn\<Tool>         - The Tool Output for the Shard               #
+#                                                                     #
+#   The per Shard CSVs are Merged (by File Name) in Time Order, the   #
+#    Shard Paths are put back to the Event Log Directory, and Rows    #
+#    repeated by another Shard (Same Time) are only written once.     #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Merge Dedup only holds the Rows of the current Time, and  #
+#           keeps Rows that one Shard wrote more than once            #
+#   v0.03 - Logs are only Cut into Pieces with SplitLogs (EvtSplt:)   #
+#######################################################################
+import os
+import re
+import csv
+import time
+import heapq
+import itertools
+import shutil
+import struct
+import zlib
+import hashlib
+import subprocess
+import concurrent.futures
+import EvtxParse
+
+
+ShardEvtx = "Evtx"
+
+# Chunks Copied per Read/Write when a Piece is Cut
+CopyChunks = 64
+
+
+def ShardName(ShardNum):
+    return "S{:02d}".format(ShardNum + 1)
+
+
+###########################################################################
+# Number of whole Chunks in a Log (0 if it is not an .evtx)               #
+###########################################################################
+def LogChunks(EvtxName):
+    try:
+        with open(EvtxName, "rb") as EvtxFile:
+            if EvtxFile.read(8) != EvtxParse.FileSig:
+                return 0
+        return (os.path.getsize(EvtxName) - EvtxParse.HeaderSize) // EvtxParse.ChunkSize
+    except OSError:
+        return 0
+
+
+###########################################################################
+# Shard Plan: [[Bytes, [(Log Path, First Chunk, Chunk Count)]]] - A Chunk #
+#  Count of None is the whole Log.  Empty Shards are dropped.  Logs are   #
+#  only Cut into Pieces with SplitLogs (Count Rules can miss Events that  #
+#  are split across Pieces)                                               #
+###########################################################################
+def ShardPlan(EvtxDir, Shards, SplitLogs=0):
+    EvtxFiles = []
+    try:
+        with os.scandir(EvtxDir) as DirEnts:
+            for DirEnt in DirEnts:
+                if DirEnt.is_file() and DirEnt.name.lower().endswith(".evtx"):
+                    EvtxFiles.append((DirEnt.stat().st_size, DirEnt.path))
+    except OSError:
+        return []
+
+    if Shards < 1:
+        Shards = 1
+
+    ###########################################################################
+    # Cut the Logs bigger than one Shard into Chunk Range Pieces              #
+    ###########################################################################
+    ShardBytes = max(sum(EvtxSize for EvtxSize, EvtxName in EvtxFiles) // Shards, EvtxParse.ChunkSize)
+    ShardParts = []
+    for EvtxSize, EvtxName in EvtxFiles:
+        ChunkTotal = LogChunks(EvtxName) if SplitLogs == 1 and EvtxSize > ShardBytes else 0
+        if ChunkTotal < 2:
+            ShardParts.append((EvtxSize, EvtxName, 0, None))
+            continue
+
+        PartChunks = max(ShardBytes // EvtxParse.ChunkSize, 1)
+        for FirstChunk in range(0, ChunkTotal, PartChunks):
+            ChunkCount = min(PartChunks, ChunkTotal - FirstChunk)
+            ShardParts.append((EvtxParse.HeaderSize + ChunkCount * EvtxParse.ChunkSize, EvtxName, FirstChunk, ChunkCount))
+
+    ###########################################################################
+    # Largest first, into the Shard with the fewest Bytes (Min Heap)          #
+    ###########################################################################
+    ShardList = [[0, []] for ShardNum in range(Shards)]
+    ShardHeap = [(0, ShardNum) for ShardNum in range(Shards)]
+    for PartSize, EvtxName, FirstChunk, ChunkCount in sorted(ShardParts, key=lambda ShardPart: ShardPart[0], reverse=True):
+        ShardSize, ShardNum = heapq.heappop(ShardHeap)
+        ShardList[ShardNum][0] += PartSize
+        ShardList[ShardNum][1].append((EvtxName, FirstChunk, ChunkCount))
+        heapq.heappush(ShardHeap, (ShardSize + PartSize, ShardNum))
+
+    return [CurShard for CurShard in ShardList if CurShard[1]]
+
+
+###########################################################################
+# Write one Piece of a Log: The File Header (First/Last Chunk, Chunk      #
+#  Count, Clean Flags, and its CRC fixed up), then the Chunks Verbatim    #
+###########################################################################
+def CutPiece(EvtxName, FirstChunk, ChunkCount, PieceName):
+    with open(EvtxName, "rb") as EvtxFile, open(PieceName, "wb") as PieceFile:
+        FileHead = bytearray(EvtxFile.read(EvtxParse.HeaderSize))
+        struct.pack_into("<QQ", FileHead, 8, 0, ChunkCount - 1)
+        struct.pack_into("<H", FileHead, 42, ChunkCount)
+        struct.pack_into("<I", FileHead, 120, 0)
+        struct.pack_into("<I", FileHead, 124, zlib.crc32(FileHead[0:120]))
+        PieceFile.write(FileHead)
+
+        EvtxFile.seek(EvtxParse.HeaderSize + FirstChunk * EvtxParse.ChunkSize)
+        ChunkLeft = ChunkCount
+        while ChunkLeft > 0:
+            ChunkData = EvtxFile.read(min(ChunkLeft, CopyChunks) * EvtxParse.ChunkSize)
+            if not ChunkData:
+                break
+            PieceFile.write(ChunkData)
+            ChunkLeft -= CopyChunks
+
+
+def LinkLog(EvtxName, LinkName):
+    try:
+        os.link(EvtxName, LinkName)
+    except OSError:
+        # Different Volume (or no Hard Links) - Fall back to a Copy
+        shutil.copyfile(EvtxName, LinkName)
+
+
+###########################################################################
+# Build the Shard Input Directories - Returns the Shard Directories       #
+###########################################################################
+def BuildShards(ShardList, WorkDir):
+    if os.path.isdir(WorkDir):
+        shutil.rmtree(WorkDir, ignore_errors=True)
+
+    ShardDirs = []
+    for ShardNum, (ShardSize, ShardParts) in enumerate(ShardList):
+        ShardDir = os.path.join(WorkDir, ShardName(ShardNum))
+        os.makedirs(os.path.join(ShardDir, ShardEvtx))
+
+        PieceNum = 0
+        for EvtxName, FirstChunk, ChunkCount in ShardParts:
+            if ChunkCount is None:
+                LinkLog(EvtxName, os.path.join(ShardDir, ShardEvtx, os.path.basename(EvtxName)))
+            else:
+                PieceNum += 1
+                PieceDir = os.path.join(ShardDir, ShardEvtx, "P{:02d}".format(PieceNum))
+                os.makedirs(PieceDir)
+                CutPiece(EvtxName, FirstChunk, ChunkCount, os.path.join(PieceDir, os.path.basename(EvtxName)))
+
+        print("[+] Event Log Shard " + ShardName(ShardNum) + ": " + str(len(ShardParts)) + " Logs/Pieces, " + str(ShardSize // (1024 * 1024)) + " MB")
+        ShardDirs.append(ShardDir)
+
+    return ShardDirs
+
+
+###########################################################################
+# Run one Command Line per Shard, Workers at a time - Returns Exit Codes  #
+###########################################################################
+def RunShard(CmdLine):
+    StartTime = time.time()
+    try:
+        ExitCode = subprocess.run(CmdLine, shell=True).returncode
+    except OSError as ShardErr:
+        print("[!] Shard Failed: " + str(ShardErr))
+        ExitCode = -1
+    return ExitCode, time.time() - StartTime
+
+
+def RunShards(CmdLines, Workers):
+    if Workers < 1:
+        Workers = 1
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=Workers) as ShardPool:
+        ShardRuns = list(ShardPool.map(RunShard, CmdLines))
+
+    for ShardNum, (ExitCode, Duration) in enumerate(ShardRuns):
+        if ExitCode == 0:
+            print("[+]   Shard " + ShardName(ShardNum) + ": {:.1f}s".format(Duration))
+        else:
+            print("[!]   Shard " + ShardName(ShardNum) + ": {:.1f}s".format(Duration) + " (Exit Code: " + str(ExitCode) + ")")
+
+    return [ExitCode for ExitCode, Duration in ShardRuns]
+
+
+###########################################################################
+# Rows of one Shard CSV, in the Merged Column Order, with the Shard Input #
+#  Paths (and Piece Directories) put back to the Event Log Directory      #
+###########################################################################
+def ShardRows(CSVName, ShardDir, EvtxDir, Header):
+    ShardPath = re.compile(re.escape(os.path.join(ShardDir, ShardEvtx)) + r"(?:[\\/]P\d\d)?(?=[\\/])")
+    ShardText = os.path.join(ShardDir, ShardEvtx)
+    EvtxDir = EvtxDir.rstrip("\\/")
+
+    with open(CSVName, 'r', encoding='utf8', errors="replace", newline='') as csvfile:
+        csvread = csv.reader((line.replace('\0', '') for line in csvfile), delimiter=',')
+        CSVHead = next(csvread, None)
+        if CSVHead is None:
+            return
+
+        ColMap = None if CSVHead == Header else [Header.index(ColName) for ColName in CSVHead]
+        for csvrow in csvread:
+            csvrow = [ShardPath.sub(lambda PathMatch: EvtxDir, CellText) if ShardText in CellText else CellText for CellText in csvrow]
+
+            if ColMap is not None:
+                MapRow = [""] * len(Header)
+                for ColIndx, CellText in zip(ColMap, csvrow):
+                    MapRow[ColIndx] = CellText
+                csvrow = MapRow
+
+            yield csvrow
+
+
+def TimeColumn(Header):
+    for ColIndx, ColName in enumerate(Header):
+        if ColName.lower() in ("timestamp", "datetime"):
+            return ColIndx
+    return 0
+
+
+###########################################################################
+# Merge the Tool Output of every Shard (ShardDir\OutName) into MergeDir:  #
+#  One CSV per File Name, the Header is the Union of the Shard Headers,   #
+#  the Rows are Merged in Time Order (Each Tool writes its CSVs Sorted),  #
+#  and a Row repeated by another Shard is only written once.  The Shard   #
+#  Output is removed once it is Merged.  Returns {File Name: Row Count}   #
+#                                                                         #
+#  Repeats can only be at the same Time, so RowSeen only holds the Rows   #
+#  of the current Time: Row Hash -> {Shard: Count}.  A Row is written     #
+#  when its Shard has more copies than any other Shard had                #
+###########################################################################
+def MergeCSVs(ShardDirs, OutName, EvtxDir, MergeDir):
+    ShardCSVs = {}
+    for ShardDir in ShardDirs:
+        OutDir = os.path.join(ShardDir, OutName)
+        if not os.path.isdir(OutDir):
+            continue
+        for DirEnt in os.scandir(OutDir):
+            if DirEnt.is_file() and DirEnt.name.lower().endswith(".csv"):
+                ShardCSVs.setdefault(DirEnt.name, []).append((DirEnt.path, ShardDir))
+
+    os.makedirs(MergeDir, exist_ok=True)
+
+    MergeCounts = {}
+    for CSVFile in sorted(ShardCSVs):
+        Header = []
+        for CSVName, ShardDir in ShardCSVs[CSVFile]:
+            with open(CSVName, 'r', encoding='utf8', errors="replace", newline='') as csvfile:
+                for ColName in next(csv.reader((line.replace('\0', '') for line in csvfile), delimiter=','), []):
+                    if ColName not in Header:
+                        Header.append(ColName)
+
+        TimeCol = TimeColumn(Header)
+        RowSeen = {}
+        RowTime = None
+        reccount = 0
+
+        with open(os.path.join(MergeDir, CSVFile), 'w', encoding='utf8', errors="replace", newline='') as csvoutf:
+            csvwrite = csv.writer(csvoutf)
+            csvwrite.writerow(Header)
+
+            ShardIters = [zip(ShardRows(CSVName, ShardDir, EvtxDir, Header), itertools.repeat(ShardNum))
+                          for ShardNum, (CSVName, ShardDir) in enumerate(ShardCSVs[CSVFile])]
+
+            for csvrow, ShardNum in heapq.merge(*ShardIters, key=lambda ShardRow: ShardRow[0][TimeCol] if TimeCol < len(ShardRow[0]) else ""):
+                CurTime = csvrow[TimeCol] if TimeCol < len(csvrow) else ""
+                if CurTime != RowTime:
+                    RowSeen.clear()
+                    RowTime = CurTime
+
+                RowHash = hashlib.blake2b("\x1f".join(csvrow).encode("utf8", errors="replace"), digest_size=16).digest()
+                ShardCounts = RowSeen.setdefault(RowHash, {})
+                PrevMax = max(ShardCounts.values(), default=0)
+                ShardCounts[ShardNum] = ShardCounts.get(ShardNum, 0) + 1
+                if ShardCounts[ShardNum] <= PrevMax:
+                    continue
+
+                csvwrite.writerow(csvrow)
+                reccount = reccount + 1
+
+        print("[+] Merged " + CSVFile + ": " + str(len(ShardCSVs[CSVFile])) + " Shards, " + str(reccount) + " Rows")
+        MergeCounts[CSVFile] = reccount
+
+    for ShardDir in ShardDirs:
+        shutil.rmtree(os.path.join(ShardDir, OutName), ignore_errors=True)
+
+    return MergeCounts
@@ -67,6 +67,45 @@
 #   v1.51 -  Convert Path Separators to os.path.join                  #
 #         -  Replace OS Copy with shutil copy                         #
 #   v1.52 -  Cleanup Leftover Directories                             #
+#   v1.53 -  Single Pass MFT Section Engine - Classify MFTDump.csv    #
+#            into all $MFT Sections and IOCs in one pass (No more     #
+#            MFTDelt.csv, MFTActv.csv, MFTIOCs.csv)                   #
+#   v1.54 -  Compile IOCs once into a Multi-Pattern (Aho-Corasick)    #
+#            Matcher - One scan per row finds every IOC hit           #
+#   v1.55 -  Add Native (In-Process) $MFT Parser - MFTPars:Auto uses  #
+#            MFTDump/MFTECmd on Windows, and Native everywhere else   #
+#   v1.56 -  Parallel Chunked CSV Reader for the large tool CSVs      #
+#            (MFTDump, LECmd, Chainsaw, Hayabusa) - CSVPool:n         #
+#   v1.57 -  Persistent Columnar Artifact Cache (ArtCache) for MFT,   #
+#            Prefetch, Browser, LNK, and Event Log Extracts           #
+#   v1.58 -  Size and Path Index over the $MFT Records - Sections are #
+#            Lookups.  Add Custom $MFT Bands (MFTBand:)               #
+#   v1.59 -  Buffered Table Renderer (ReportTable) - Each Table is    #
+#            described once and Rows use a prebuilt Row Template      #
+#   v1.60 -  Virtual Tables (RptMode:Virtual) - Large Tables go to JS #
+#            Data Files, drawn by virtual-Ach.js as they are scrolled #
+#   v1.61 -  Run the Pre-Processing Tools as Dependency Aware Tasks   #
+#            (TaskDAG) - Workers:n at a time, Sections Wait for Input #
+#   v1.62 -  One LogParser Query per Event Log - Records are split by #
+#            EventID into the Section Extracts (EvtExtract)           #
+#   v1.63 -  Native EVTX Parser (EvtxParse) - EvtPars:Native is used  #
+#            when LogParser is not there (Linux Workers)              #
+#   v1.64 -  EvtRead:InPlace - Read the collected Event Logs where    #
+#            they are (No staging copies or Wevtutil export)          #
+#   v1.65 -  Sidecar EventID Index (EvtIndex) - Native re-runs read   #
+#            only the Records of the Report EventIDs                  #
+#   v1.66 -  Failed Logins use a Streaming Logon Aggregator           #
+#            (LogonStats) - Per Source and Burst (LgnWind:) Tables    #
+#   v1.67 -  Event Log Channel Sweep (Run:EvtChannels) - PowerShell,  #
+#            TaskScheduler and RDP LocalSessionManager Sections       #
+#   v1.68 -  Table Driven Chainsaw/Hayabusa Renderer (Detections) -   #
+#            One Directory Scan instead of a Recursive Glob per CSV   #
+#   v1.69 -  EvtShrd:n - Chainsaw and Hayabusa run n at a time over   #
+#            Size Balanced Event Log Shards (ToolShard), then Merge   #
+#   v1.70 -  Sigma False Positive Suppression Table (SigSupp:) with   #
+#            per Rule Suppressed Counts                               #
+#   v1.71 -  Tool Dates (Nirsoft, Autoruns, LECmd) are shown          #
+#            Normalized (TimeNorm) as YYYY-MM-DD HH:MM:SS             #
 ####################################################################### 
 import os, stat
 import sys
@@ -75,10 +114,23 @@ import time
 import argparse
 import ctypes
 import requests
-import glob
 import shutil
 import datetime
+import functools
+import html
 from zipfile import ZipFile
+import MFTSections
+import MFTParse
+import CSVChunk
+import TimeNorm
+import ArtCache
+import ReportTable
+import TaskDAG
+import EvtExtract
+import LogonStats
+import Detections
+import ToolShard
+from IOCMatch import IOCMatcher
 
 parser = argparse.ArgumentParser(description="Format Triage Collection Output into a Report")
 parser.add_argument("-d", dest="dirname", 
@@ -191,23 +243,28 @@ def main():
         print("[!] Regripper Plugin NOT Found: timezone.pl")
         GotDepend = 0
 
+    ###########################################################################
+    # LogParser is only Required when the Event Logs are Parsed with it       #
+    #  (EvtPars:) - The Native Parser needs no SYS Utilities                  #
+    ###########################################################################
+    GotLgPrs = 1
     if os.path.isfile(os.path.join(dirleft, "SYS","logparser.exe")):
         print("[+] LogParser Found: logparser.exe")
     else:
         print("[!] LogParser NOT Found: logparser.exe")
-        GotDepend = 0
+        GotLgPrs = 0
 
     if os.path.isfile(os.path.join(dirleft, "SYS", "logparser.dll")):
         print("[+] LogParser Found: logparser.dll")
     else:
         print("[!] LogParser NOT Found: logparser.dll")
-        GotDepend = 0
+        GotLgPrs = 0
 
     if os.path.isfile(os.path.join(dirleft, "SYS", "logparser.chm")):
         print("[+] LogParser Found: logparser.chm")
     else:
         print("[!] LogParser NOT Found: logparser.chm")
-        GotDepend = 0
+        GotLgPrs = 0
 
     if GotDepend == 0:
         print("[!] ALL Dependencies Not Met - Now Exiting.\n")
@@ -221,15 +278,28 @@ def main():
     RunSucRDP = RunFaiLgn = RunFBrArc = RunFBrHst = RunIBrHst = RunPrfHst = RunIPCons = 0
     RunUsrAst = RunAutoRn = RunServic = RunScTask = RunDNSInf = RunRcyBin = RunIndIPs = 0
     RunIndHsh = RunIndDom = RunAmCach = RunChnSaw = RunLnkPrs = RunPwsLog = RunShlBag = 0
+    RunEvtChn = 0
     RunPCAsst = 0
 
     HasIOCs = 0
+    IOCList = []
+    MFTFound = 0
 
     SrcMFT = SrcRBin = SrcEvtx = SrcPrf = SrcNTUsr = SrcSysReg = SrcSysTxt = SrcAmCach = 0
     SrcAmCTxt = SrcLnkPrs = SrcPwsLog = 0
 
     Collect = "AChoirX"
     MFTFile = os.path.join("RawData", "MFT-C")
+    MFTPars = "Auto"
+    EvtPars = "Auto"
+    EvtRead = "Copy"
+    CSVPool = 0
+    ArtCach = "Yes"
+    RptMode = "Inline"
+    Workers = 0
+    LgnWind = LogonStats.WindowMins
+    EvtShrd = 0
+    MFTBands = []
     Prefetc = "Prf"
     PCAsist = "PCA"
     LNKFile = "Lnk"
@@ -261,11 +331,6 @@ def main():
     PreConv = ""
     Brander = ""
 
-    PreIOC = " <b><font color=red>"
-    PostIOC = "</font></b> "
-    PreIOC2 = " <b><font color=red>"
-    PostIOC2 = "</font></b> "
-
     print("[+] Checking For Config File...")
     if os.path.isfile(cfgname):
         print("[+] Config File Found (" + cfgname + "), Now Parsing Config Options...")
@@ -380,10 +445,108 @@ def main():
             elif cfgline.startswith("Run:PCAssist"):
                 RunPCAsst = 1
 
+            elif cfgline.startswith("Run:EvtChannels"):
+                RunEvtChn = 1
+
             elif cfgline.startswith("MFTFile:"):
                 MFTFile = cfgline[8:].strip()
                 print("[+] MFT Source File: " + MFTFile)
 
+            elif cfgline.startswith("MFTPars:"):
+                MFTPars = cfgline[8:].strip()
+                print("[+] MFT Parser: " + MFTPars)
+
+            elif cfgline.startswith("EvtPars:"):
+                EvtPars = cfgline[8:].strip()
+                print("[+] Event Log Parser: " + EvtPars)
+
+            elif cfgline.startswith("EvtRead:"):
+                EvtRead = cfgline[8:].strip()
+                print("[+] Event Log Read Mode: " + EvtRead)
+
+            elif cfgline.startswith("CSVPool:"):
+                if cfgline[8:].strip().isdigit():
+                    CSVPool = int(cfgline[8:].strip())
+                    print("[+] CSV Parser Pool: " + str(CSVPool))
+                else:
+                    print("[!] Invalid CSVPool (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("ArtCach:"):
+                ArtCach = cfgline[8:].strip()
+                print("[+] Artifact Cache: " + ArtCach)
+
+            elif cfgline.startswith("Workers:"):
+                if cfgline[8:].strip().isdigit():
+                    Workers = int(cfgline[8:].strip())
+                    print("[+] Tool Workers: " + str(Workers))
+                else:
+                    print("[!] Invalid Workers (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("LgnWind:"):
+                if cfgline[8:].strip().isdigit() and 0 < int(cfgline[8:].strip()) <= 1440:
+                    LgnWind = int(cfgline[8:].strip())
+                    print("[+] Logon Burst Window (Minutes): " + str(LgnWind))
+                else:
+                    print("[!] Invalid LgnWind (Must be 1-1440 Minutes): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("EvtShrd:"):
+                if cfgline[8:].strip().isdigit():
+                    EvtShrd = int(cfgline[8:].strip())
+                    print("[+] Chainsaw/Hayabusa Event Log Shards: " + str(EvtShrd))
+                else:
+                    print("[!] Invalid EvtShrd (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("RptMode:"):
+                RptMode = cfgline[8:].strip()
+                print("[+] Report Table Mode: " + RptMode)
+
+            elif cfgline.startswith("SigSupp:"):
+                ###########################################################################
+                # Sigma Suppression Rule: Title Pattern|Required Channel Pattern          #
+                #  (SigSupp:None drops the Default Rules)                                 #
+                ###########################################################################
+                SuppVals = cfgline[8:].strip().split("|")
+                if cfgline[8:].strip().upper() == "NONE":
+                    Detections.SigmaSupp.Clear()
+                    print("[+] Sigma Suppression Defaults Dropped")
+                elif len(SuppVals) != 2 or SuppVals[0].strip() == "" or SuppVals[1].strip() == "":
+                    print("[!] Invalid SigSupp (TitlePattern|ChannelPattern): " + cfgline[8:].strip())
+                else:
+                    Detections.SigmaSupp.Add(SuppVals[0].strip(), SuppVals[1].strip())
+                    print("[+] Sigma Suppression: " + SuppVals[0].strip() + " (Unless Channel: " + SuppVals[1].strip() + ")")
+
+            elif cfgline.startswith("MFTBand:"):
+                ###########################################################################
+                # Custom $MFT Band: Title|Deleted/Active|MinSize|MaxSize|PathHas|...      #
+                #  Blank (or non numeric) Sizes have no limit, PathHas is optional        #
+                ###########################################################################
+                BandVals = cfgline[8:].strip().split("|")
+                if len(BandVals) < 2 or BandVals[0].strip() == "":
+                    print("[!] Invalid MFTBand (Title|Deleted/Active|MinSize|MaxSize|PathHas): " + cfgline[8:].strip())
+                else:
+                    BandVals = BandVals + [""] * (4 - len(BandVals))
+
+                    if BandVals[1].strip().lower().startswith("del"):
+                        BandDel = "1"
+                    else:
+                        BandDel = "0"
+
+                    if BandVals[2].strip().isdigit():
+                        BandMin = int(BandVals[2].strip())
+                    else:
+                        BandMin = None
+
+                    if BandVals[3].strip().isdigit():
+                        BandMax = int(BandVals[3].strip())
+                    else:
+                        BandMax = None
+
+                    BandPath = tuple(PathStr.strip().lower() for PathStr in BandVals[4:] if PathStr.strip() != "")
+                    BandKey = "Band" + str(len(MFTBands))
+
+                    MFTBands.append((BandVals[0].strip(), MFTSections.MFTSection(BandKey, BandDel, BandMin, BandMax, BandPath)))
+                    print("[+] Custom $MFT Band: " + BandVals[0].strip())
+
             elif cfgline.startswith("RegSoft:"):
                 RegSoft = cfgline[8:].strip()
                 print("[+] Sofware Registry Source File: " + RegSoft)
@@ -486,16 +649,30 @@ def main():
                 if HasIOCs == 0:
                     print("[+] Adding IOCs for Searching...")
                     HasIOCs = 1
-                    IOCList = []
-                    IOCount = []
                 IOCList.append(cfgline[4:].strip().lower())
-                IOCount.append(0)
 
     else:
         print("[!] Config File Not Found (" + cfgname + "), Default Setting Configured.")
         RunAllAll = 1
 
 
+    ###########################################################################
+    # Compile the IOCs once - Every Section uses this Matcher and its counts  #
+    ###########################################################################
+    IOCMatch = IOCMatcher(IOCList)
+    IOCount = IOCMatch.IOCount
+
+
+    ###########################################################################
+    # Artifact Cache - Parsed Artifacts are kept (Columnar) between runs      #
+    #  ArtCach:No turns it off (ArtCDir "" just reads the Tool CSVs)          #
+    ###########################################################################
+    if ArtCach.upper() == "NO":
+        ArtCDir = ""
+    else:
+        ArtCDir = os.path.join(dirtrge, "ArtCache")
+
+
     ###########################################################################
     # Pre-Cleanup to delete any Leftover temp files from failed runs
     ###########################################################################
@@ -542,6 +719,13 @@ def main():
         os.remove(os.path.join(dirtrge, "SecEvt4698.csv"))
     if os.path.isfile(os.path.join(dirtrge, "SecEvt4648.csv")):
         os.remove(os.path.join(dirtrge, "SecEvt4648.csv"))
+    if os.path.isfile(os.path.join(dirtrge, "SecEvtAll.csv")):
+        os.remove(os.path.join(dirtrge, "SecEvtAll.csv"))
+    if os.path.isfile(os.path.join(dirtrge, "SysEvtAll.csv")):
+        os.remove(os.path.join(dirtrge, "SysEvtAll.csv"))
+    for ChnTable in ("EvtChannels", "PShl4104", "TaskSched", "RDPLsm"):
+        if os.path.isfile(os.path.join(dirtrge, ChnTable + ".csv")):
+            os.remove(os.path.join(dirtrge, ChnTable + ".csv"))
     if os.path.isfile(os.path.join(dirtrge, "RBin.dat")):
         os.remove(os.path.join(dirtrge, "RBin.dat"))
     if os.path.isfile(os.path.join(dirtrge, "LNKFiles.csv")):
@@ -555,41 +739,23 @@ def main():
         for curfile in os.listdir(os.path.join(dirtrge, "ShellBags")):
             os.remove(os.path.join(dirtrge, "ShellBags", curfile))
 
+    ###########################################################################
+    # Old Chainsaw Output - One Directory Scan for all of its CSVs            #
+    ###########################################################################
+    ShardWork = os.path.join(dirtrge, "ToolShard")
+    if os.path.isdir(ShardWork):
+        shutil.rmtree(ShardWork, ignore_errors=True)
+    ShardDirs = []
+
     ChSwSubDir = ""
-    for ChName in glob.glob(os.path.join(dirtrge, "**", "account_tampering.csv"), recursive=True):
-        os.remove(os.path.join(dirtrge, ChName))
-        if ChSwSubDir == "":
-            Path_File = os.path.split(os.path.join(dirtrge, ChName))
-            ChSwSubDir = Path_File[0]
-
-    for ChName in glob.glob(os.path.join(dirtrge, "**", "antivirus.csv"), recursive=True):
-        os.remove(os.path.join(dirtrge, ChName))
-        if ChSwSubDir == "":
-            Path_File = os.path.split(os.path.join(dirtrge, ChName))
-            ChSwSubDir = Path_File[0]
-
-    for ChName in glob.glob(os.path.join(dirtrge, "**", "lateral_movement.csv"), recursive=True):
-        os.remove(os.path.join(dirtrge, ChName))
-        if ChSwSubDir == "":
-            Path_File = os.path.split(os.path.join(dirtrge, ChName))
-            ChSwSubDir = Path_File[0]
-
-    for ChName in glob.glob(os.path.join(dirtrge, "**", "log_tampering.csv"), recursive=True):
-        os.remove(os.path.join(dirtrge, ChName))
-        if ChSwSubDir == "":
-            Path_File = os.path.split(os.path.join(dirtrge, ChName))
-            ChSwSubDir = Path_File[0]
-
-    for ChName in glob.glob(os.path.join(dirtrge, "**", "sigma.csv"), recursive=True):
-        os.remove(os.path.join(dirtrge, ChName))
-        if ChSwSubDir == "":
-            Path_File = os.path.split(os.path.join(dirtrge, ChName))
-            ChSwSubDir = Path_File[0]
+    ChFound = Detections.ScanCSVs(dirtrge, Detections.TableFiles(Detections.ChainsawTables) + Detections.ChainsawDelete, ("ArtCache", "ShellBags", "ToolShard"))
+    for ChNames in ChFound.values():
+        for ChName in ChNames:
+            os.remove(ChName)
+            if ChSwSubDir == "":
+                ChSwSubDir = os.path.split(ChName)[0]
 
     if ChSwSubDir != "":
-        ChSwLeftOvers = os.path.join(ChSwSubDir, "**", "*.csv")
-        for ChName in glob.glob(ChSwLeftOvers, recursive=True):
-            os.remove(ChName)
         shutil.rmtree(ChSwSubDir)
 
 
@@ -602,6 +768,13 @@ def main():
         returned_value = os.system(cmdexec)
 
     print("[+] Now Building Additional Data from Sources...")
+
+    ###########################################################################
+    # The Tools run as Tasks (Workers at a time) - Each Report Section Waits  #
+    #  only for the Tasks that write the data it reads                        #
+    ###########################################################################
+    ToolDAG = TaskDAG.TaskDAG(Workers)
+
     print("[+] Generating System Information from Registry...")
     
     ###########################################################################
@@ -615,10 +788,10 @@ def main():
         exeName = os.path.join(dirleft, "RRV", "RegRipper3.0-master", "rip.exe")
         if os.path.isfile(exeName):
             cmdexec = exeName + " -p source_os -r " + os.path.join(dirname, RegSoft[1:]) + " > " + os.path.join(dirtrge, "SysInfo.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("SysOS", cmdexec)
 
             cmdexec = exeName + " -p winver -r " + os.path.join(dirname, RegSoft[1:]) + " >> " + os.path.join(dirtrge, "SysInfo.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("SysVer", cmdexec, ("SysOS",))
 
             SrcSysTxt = 1
         else:
@@ -640,11 +813,12 @@ def main():
 
         exeName = os.path.join(dirleft, "RRV", "RegRipper3.0-master", "rip.exe")
         if os.path.isfile(exeName):
+            # SysInfo.dat is appended to - Wait for the SOFTWARE Entries
             cmdexec = exeName + " -p compname -r " + os.path.join(dirname, RegSyst[1:]) + " >> "  + os.path.join(dirtrge, "SysInfo.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("SysName", cmdexec, ("SysVer",))
 
             cmdexec = exeName + " -p timezone -r " + os.path.join(dirname, RegSyst[1:]) + "  >  " + os.path.join(dirtrge, "TZInfo.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("SysTZ", cmdexec)
 
             SrcSysTxt = 1
         else:
@@ -667,7 +841,7 @@ def main():
         exeName = os.path.join(dirleft, "RRV", "RegRipper3.0-master", "rip.exe")
         if os.path.isfile(exeName):
             cmdexec = exeName + " -p amcache -r " + os.path.join(dirname, AmCache[1:]) + " >  " + os.path.join(dirtrge, "AmCache.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("AmCache", cmdexec)
 
             SrcAmCTxt = 1
         else:
@@ -686,11 +860,14 @@ def main():
         # - use [1:] to ignore path separator                                     #
         ###########################################################################
         exeName = os.path.join(dirleft, "SYS", "WinPrefetchView.exe")
+        PrfSig = ArtCache.SourceSig([os.path.join(dirname, Prefetc[1:])], "WinPrefetchView")
 
-        if os.path.isfile(exeName):
+        if ArtCache.IsCached(ArtCDir, "Prefetch", PrfSig):
+            print("[+] Using Cached Prefetch Data (Artifact Cache)...")
+        elif os.path.isfile(exeName):
             if os.path.isdir(os.path.join(dirname, Prefetc[1:])):
                 cmdexec = exeName + " /folder " + os.path.join(dirname, Prefetc[1:]) + " /scomma  " + os.path.join(dirtrge, "WinPrefetchview.csv")
-                returned_value = os.system(cmdexec)
+                ToolDAG.Add("Prefetch", cmdexec)
             else:
                 print("[!] Prefetch Data Not Found in the Collection: " + os.path.join(dirname, Prefetc[1:]))
                 SrcPrf = 0
@@ -701,6 +878,7 @@ def main():
         print("[+] Bypassing Prefetch Data...")
 
 
+    UsrTasks = []
     if RunAllAll == 1 or SrcNTUsr == 1:
         print("[+] Generating User Assist for Multiple User Profiles...")
 
@@ -725,16 +903,17 @@ def main():
                     astfile.close()
 
                     cmdexec = exeName + " -p shellfolders -r " + curfile + " >> " + curouput
-                    returned_value = os.system(cmdexec)
+                    ToolDAG.Add("ShlFold." + str(reccount), cmdexec)
 
                     cmdexec = exeName + " -p userassist -r " + curfile + " >> " + curouput
-                    returned_value = os.system(cmdexec)
+                    UsrTasks.append(ToolDAG.Add("UsrAsst." + str(reccount), cmdexec, ("ShlFold." + str(reccount),)))
 
                     reccount = reccount + 1
     else:
       print("[+] ByPassing User Assist for Multiple User Profiles...")
 
 
+    EvtSig = ArtCache.SourceSig([], "LogParser")
     if RunAllAll == 1 or SrcEvtx == 1:
         print("[+] Generating Event Log Entries...")
         print("[+] Generating RDP Success and Failure...")
@@ -743,64 +922,134 @@ def main():
         # os.path.join will not work if EVTDir(x) starts with a path separator    #
         # - use [1:] to ignore path separator                                     #
         ###########################################################################
-        EvtName = os.path.join(dirname, EvtDir1[1:], "Security.evtx")
-        if os.path.isfile(EvtName):
-            shutil.copy(EvtName, dirtrge)
+        EvtSrcs = []
+        SecEvtx = os.path.join(dirname, EvtDir1[1:], "Security.evtx")
+        if not os.path.isfile(SecEvtx):
+            SecEvtx = os.path.join(dirname, EvtDir2[1:], "Security.evtx")
+
+        if os.path.isfile(SecEvtx):
+            EvtSrcs.append(SecEvtx)
         else:
-            EvtName = os.path.join(dirname, EvtDir2[1:], "Security.evtx")
-            if os.path.isfile(EvtName):
-                shutil.copy(EvtName, dirtrge)
-            else:
-                SrcEvtx = 0
-                print("[!] Security Event Log Not Found...")
+            SrcEvtx = 0
+            print("[!] Security Event Log Not Found...")
 
 
         print("[+] Generating Service Installed (7045) Messages...")
 
-        EvtName = os.path.join(dirname, EvtDir1[1:], "System.evtx")
-        if os.path.isfile(EvtName):
-            shutil.copy(EvtName, dirtrge)
+        SysEvtx = os.path.join(dirname, EvtDir1[1:], "System.evtx")
+        if not os.path.isfile(SysEvtx):
+            SysEvtx = os.path.join(dirname, EvtDir2[1:], "System.evtx")
+
+        if os.path.isfile(SysEvtx):
+            EvtSrcs.append(SysEvtx)
         else:
-            EvtName = os.path.join(dirname, EvtDir2[1:], "System.evtx")
-            if os.path.isfile(EvtName):
-                shutil.copy(EvtName, dirtrge)
+            SrcEvtx = 0
+            print("[!] System Event Log Not Found...")
+
+
+        ###########################################################################
+        # Auto: Use LogParser on Windows if it is there, otherwise parse the      #
+        #  EVTX natively (Linux, or no SYS utilities)                             #
+        ###########################################################################
+        if EvtPars == "Auto":
+            if os.name == "nt" and GotLgPrs == 1:
+                EvtPars = "LogParser"
+            else:
+                EvtPars = "Native"
+
+        if EvtPars != "Native" and GotLgPrs == 0:
+            print("[!] LogParser Dependencies Not Met (EvtPars:" + EvtPars + ") - Use EvtPars:Native - Now Exiting.\n")
+            quit()
+
+        ###########################################################################
+        # The Event Log Extracts are Cached together - If the Logs have not       #
+        #  changed since the last run, there is no need to export and re-parse    #
+        ###########################################################################
+        EvtSig = ArtCache.SourceSig(EvtSrcs, EvtPars + ":" + str(EvtExtract.SinkFormat))
+        EvtTables = tuple(EvtSink[0] for EvtSink in EvtExtract.EvtSinks if EvtSink[1] in EvtExtract.MainLogs)
+        EvtCached = 1
+        for EvtTable in EvtTables:
+            if not ArtCache.IsCached(ArtCDir, EvtTable, EvtSig):
+                EvtCached = 0
+
+        ###########################################################################
+        # Cache the Extracts once all of the Logs are Split                       #
+        ###########################################################################
+        def CacheEvents():
+            for EvtTable in EvtTables:
+                ArtCache.CacheCSV(ArtCDir, EvtTable, EvtSig, os.path.join(dirtrge, EvtTable + ".csv"))
+
+        if SrcEvtx == 1 and EvtCached == 1:
+            print("[+] Using Cached Event Log Extracts (Artifact Cache)...")
+
+        ###########################################################################
+        # EvtRead:InPlace - Read the collected Logs (Read Only) where they are.   #
+        #  No staging copies, and no Wevtutil export                              #
+        ###########################################################################
+        elif SrcEvtx == 1 and EvtRead.upper() == "INPLACE":
+            print("[+] Reading Event Logs In Place...")
+            if EvtPars == "Native":
+                ToolDAG.Add("SecSplit", functools.partial(EvtExtract.SplitEvtx, SecEvtx, "Security", dirtrge, CSVPool))
+                ToolDAG.Add("SysSplit", functools.partial(EvtExtract.SplitEvtx, SysEvtx, "System", dirtrge, CSVPool))
             else:
-                SrcEvtx = 0
-                print("[!] System Event Log Not Found...")
+                cmdexec = EvtExtract.LogQuery(os.path.join(dirleft, "SYS", "LogParser.exe"), SecEvtx, "Security", os.path.join(dirtrge, "SecEvtAll.csv"))
+                ToolDAG.Add("SecQuery", cmdexec)
+                ToolDAG.Add("SecSplit", functools.partial(EvtExtract.SplitQuery, os.path.join(dirtrge, "SecEvtAll.csv"), "Security", dirtrge, CSVPool), ("SecQuery",))
+
+                cmdexec = EvtExtract.LogQuery(os.path.join(dirleft, "SYS", "LogParser.exe"), SysEvtx, "System", os.path.join(dirtrge, "SysEvtAll.csv"))
+                ToolDAG.Add("SysQuery", cmdexec)
+                ToolDAG.Add("SysSplit", functools.partial(EvtExtract.SplitQuery, os.path.join(dirtrge, "SysEvtAll.csv"), "System", dirtrge, CSVPool), ("SysQuery",))
+
+            ToolDAG.Add("EvtCache", CacheEvents, ("SecSplit", "SysSplit"))
+
+        ###########################################################################
+        # Native EVTX Parser - No Wevtutil export is needed, bad Chunks and       #
+        #  Records are skipped by the Parser                                      #
+        ###########################################################################
+        elif SrcEvtx == 1 and EvtPars == "Native":
+            shutil.copy(SecEvtx, dirtrge)
+            shutil.copy(SysEvtx, dirtrge)
+
+            print("[+] Parsing Security Event Logs (Native)...")
+            ToolDAG.Add("SecSplit", functools.partial(EvtExtract.SplitEvtx, os.path.join(dirtrge, "Security.evtx"), "Security", dirtrge, CSVPool))
+
+            print("[+] Parsing System Event Logs (Native)...")
+            ToolDAG.Add("SysSplit", functools.partial(EvtExtract.SplitEvtx, os.path.join(dirtrge, "System.evtx"), "System", dirtrge, CSVPool))
 
+            ToolDAG.Add("EvtCache", CacheEvents, ("SecSplit", "SysSplit"))
 
         ###########################################################################
         # Use Wevtutil to "export" the event log.  This has the effect of         #
         #  clearing any errors - It makes the Event Log more Stable.              #
         ###########################################################################
-        if SrcEvtx == 1:
+        elif SrcEvtx == 1:
+            shutil.copy(SecEvtx, dirtrge)
+            shutil.copy(SysEvtx, dirtrge)
+
             print("[+] Stabilizing Security Event Logs...")
             cmdexec = "Wevtutil.exe epl " + os.path.join(dirtrge, "Security.evtx") + " " + os.path.join(dirtrge, "Security1.evtx") + " /lf:True"
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("EvtSec", cmdexec)
 
             print("[+] Stabilizing System Event Logs...")
             cmdexec = "Wevtutil.exe epl " + os.path.join(dirtrge, "System.evtx") + " " + os.path.join(dirtrge, "System1.evtx") + " /lf:True"
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("EvtSys", cmdexec)
 
 
             ###########################################################################
-            # Parse the Events                                                        #
+            # Parse the Events - One LogParser Query per Log for every EventID the    #
+            #  Report uses, then one pass splits it into the Section Extracts         #
             ###########################################################################
             print("[+] Parsing Security Event Logs...")
-            cmdexec = os.path.join(dirleft, "SYS", "LogParser.exe") + " \"Select to_utctime(Timegenerated) AS Date, EXTRACT_TOKEN(Strings, 1, '|') as Machine, EXTRACT_TOKEN(Strings, 5, '|') as LoginID, EXTRACT_TOKEN(Strings, 6, '|') as LoginMachine, EXTRACT_TOKEN(Strings, 8, '|') as LogonType, EXTRACT_TOKEN(Strings, 18, '|') as RemoteIP from " + os.path.join(dirtrge, "Security1.evtx") + " where eventid=4624 AND LogonType='10'\" -i:evt -o:csv -q > " + os.path.join(dirtrge, "RDPGood.csv")
-            returned_value = os.system(cmdexec)
-
-            cmdexec = os.path.join(dirleft, "SYS", "LogParser.exe") + " \"Select to_utctime(Timegenerated) AS Date, EXTRACT_TOKEN(Strings, 5, '|') as LoginID from " + os.path.join(dirtrge, "Security1.evtx") + " where eventid=4625\" -i:evt -o:csv -q > " + os.path.join(dirtrge, "SecEvt4625.csv")
-            returned_value = os.system(cmdexec)
-
-            cmdexec = os.path.join(dirleft, "SYS", "LogParser.exe") + " \"Select to_utctime(Timegenerated) AS Date, EXTRACT_TOKEN(strings, 0, '|') AS ServiceName, EXTRACT_TOKEN(strings, 1, '|') AS ServicePath, EXTRACT_TOKEN(strings, 4, '|') AS ServiceUser FROM " + os.path.join(dirtrge, "System1.evtx") + " WHERE EventID = 7045\" -i:evt -o:csv -q > " + os.path.join(dirtrge, "SysEvt7045.csv")
-            returned_value = os.system(cmdexec)
+            cmdexec = EvtExtract.LogQuery(os.path.join(dirleft, "SYS", "LogParser.exe"), os.path.join(dirtrge, "Security1.evtx"), "Security", os.path.join(dirtrge, "SecEvtAll.csv"))
+            ToolDAG.Add("SecQuery", cmdexec, ("EvtSec",))
+            ToolDAG.Add("SecSplit", functools.partial(EvtExtract.SplitQuery, os.path.join(dirtrge, "SecEvtAll.csv"), "Security", dirtrge, CSVPool), ("SecQuery",))
 
-            cmdexec = os.path.join(dirleft, "SYS", "LogParser.exe") + " \"Select to_utctime(Timegenerated) AS Date, SourceName, EventCategoryName, Message FROM " + os.path.join(dirtrge, "Security1.evtx") + " WHERE EventID = 4698\" -i:evt -o:csv -q > " + os.path.join(dirtrge, "SecEvt4698.csv")
-            returned_value = os.system(cmdexec)
+            print("[+] Parsing System Event Logs...")
+            cmdexec = EvtExtract.LogQuery(os.path.join(dirleft, "SYS", "LogParser.exe"), os.path.join(dirtrge, "System1.evtx"), "System", os.path.join(dirtrge, "SysEvtAll.csv"))
+            ToolDAG.Add("SysQuery", cmdexec, ("EvtSys",))
+            ToolDAG.Add("SysSplit", functools.partial(EvtExtract.SplitQuery, os.path.join(dirtrge, "SysEvtAll.csv"), "System", dirtrge, CSVPool), ("SysQuery",))
 
-            cmdexec = os.path.join(dirleft, "SYS", "LogParser.exe") + " \"Select to_utctime(Timegenerated) AS Date, EXTRACT_TOKEN(strings, 1, '|') as accountname, EXTRACT_TOKEN(strings, 2, '|') as domain, EXTRACT_TOKEN(strings, 5, '|') as usedaccount, EXTRACT_TOKEN(strings, 6, '|') as useddomain, EXTRACT_TOKEN(strings, 8, '|') as targetserver, EXTRACT_TOKEN(strings, 9, '|') as extradata, EXTRACT_TOKEN(strings, 11, '|') as procname, EXTRACT_TOKEN(strings, 12, '|') as sourceip FROM " + os.path.join(dirtrge, "Security1.evtx") + " WHERE EventID = 4648\" -i:evt -o:csv -q > " + os.path.join(dirtrge, "SecEvt4648.csv")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("EvtCache", CacheEvents, ("SecSplit", "SysSplit"))
 
         else:
             print("[!] Error Parsing Event Log Entries...")
@@ -808,6 +1057,24 @@ def main():
         print("[+] Bypassing Event Log Entries...")
 
 
+    ###########################################################################
+    # Channel Sweep - Every other .evtx in the Event Log Dirs is parsed       #
+    #  (Native) in a Process Pool, Largest first.  The Channel Sections       #
+    #  (PowerShell, TaskScheduler, RDP LocalSessionManager) are fed from it.  #
+    #  It starts after the Security/System Splits (Their CSVPool Processes),  #
+    #  so the two Process Pools do not oversubscribe the Cores                #
+    ###########################################################################
+    if RunAllAll == 1 or RunEvtChn == 1:
+        ChnFiles = EvtExtract.SweepFiles((os.path.join(dirname, EvtDir1[1:]), os.path.join(dirname, EvtDir2[1:])))
+        if len(ChnFiles) > 0:
+            print("[+] Sweeping " + str(len(ChnFiles)) + " Event Log Channels...")
+            ToolDAG.Add("EvtSweep", functools.partial(EvtExtract.SweepChannels, ChnFiles, dirtrge, ToolDAG.Workers), ("SecSplit", "SysSplit"))
+        else:
+            print("[!] No Event Log Channels Found...")
+    else:
+        print("[+] Bypassing Event Log Channel Sweep...")
+
+
 
     ###########################################################################
     # Parse the Recycle Bin                                                   #
@@ -818,7 +1085,7 @@ def main():
         exeName = os.path.join(dirleft, "SYS", "RBCmd.exe")
         if os.path.isfile(exeName):
             cmdexec = exeName + " --dt \"yyyy-MM-dd HH:mm:ss K\" -d " + os.path.join(dirname, Recycle[1:]) + " >> " + os.path.join(dirtrge, "RBin.dat")
-            returned_value = os.system(cmdexec)
+            ToolDAG.Add("RBin", cmdexec)
         else:
             print("[!] RBCmd Recycle Bin Parser Not Found...")
             SrcRBin = 0
@@ -831,56 +1098,67 @@ def main():
     ###########################################################################
     if RunAllAll == 1 or SrcMFT == 1:
         print("[+] Parsing $MFT...")
-        MFTFound = 0
 
         exeName = os.path.join(dirleft, "DSK", "MFTDump.exe")
         exeNam1 = os.path.join(dirleft, "DSK", "MFTECmd.exe")
-        if os.path.isfile(exeName):
+        MFTName = os.path.join(dirname, MFTFile[1:])
+
+        ###########################################################################
+        # Auto: Use the Windows MFT Parsers if they are there, otherwise parse    #
+        #  the $MFT natively (Linux, or no DSK utilities)                         #
+        ###########################################################################
+        if MFTPars == "Auto":
+            if os.name == "nt" and os.path.isfile(exeName):
+                MFTPars = "MFTDump"
+            elif os.name == "nt" and os.path.isfile(exeNam1):
+                MFTPars = "MFTECmd"
+            else:
+                MFTPars = "Native"
+
+        MFTSig = ArtCache.SourceSig([MFTName], MFTPars)
+
+        if ArtCache.IsCached(ArtCDir, "MFT", MFTSig):
+            ###########################################################################
+            # The $MFT was already parsed (by the same parser) - Use the Cache (-1)   #
+            ###########################################################################
+            iMFTParsr = -1
+            MFTFound = 1
+            print("[+] Using Cached $MFT Records (Artifact Cache)...")
+
+        elif MFTPars == "Native":
+            ###########################################################################
+            # Use the Native (In-Process) MFT Parser (0)                              #
+            ###########################################################################
+            iMFTParsr = 0
+            print("[+] Using the Native $MFT Parser...")
+
+            if os.path.isfile(MFTName):
+                MFTFound = 1
+
+        elif MFTPars == "MFTDump" and os.path.isfile(exeName):
             ###########################################################################
-            # Use Malware Hunters MFT Parser (1) - Setup Columns                      #
+            # Use Malware Hunters MFT Parser (1)                                      #
             ###########################################################################
             iMFTParsr = 1
-            iMFTDelt = 1
-            iMFTSize = 10
-            iMFTPath = 13
-            iMFTFile = 4
-            iMFTCrea = 6
-            iMFTAccs = 7
-            iMFTModf = 8
-            MFTActFlag = "0"
-            MFTDelFlag = "1"
-            MFTDelim = '\t'
-
-            MFTName = os.path.join(dirname, MFTFile[1:])
+
             if os.path.isfile(MFTName):
                 cmdexec = exeName + " /l /d /v --output=" + os.path.join(dirtrge, "MFTDump.csv") + " " + MFTName
-                returned_value = os.system(cmdexec)
+                ToolDAG.Add("MFTDump", cmdexec)
                 MFTFound = 1
 
-        elif os.path.isfile(exeNam1):
+        elif MFTPars == "MFTECmd" and os.path.isfile(exeNam1):
             ###########################################################################
-            # Use Eric Zimmerman MFT Parser (2) - Setup Columns                       #
+            # Use Eric Zimmerman MFT Parser (2)                                       #
             ###########################################################################
             iMFTParsr = 2
-            iMFTDelt = 2
-            iMFTSize = 8
-            iMFTPath = 5
-            iMFTFile = 6
-            iMFTCrea = 19
-            iMFTAccs = 25
-            iMFTModf = 21
-            MFTActFlag = "True"
-            MFTDelFlag = "False"
-            MFTDelim = ','
-
-            MFTName = os.path.join(dirname, MFTFile[1:])
+
             if os.path.isfile(MFTName):
                 cmdexec = exeNam1 + " -f " + MFTName + " --csv " + dirtrge + " --csvf MFTDump.csv"
-                returned_value = os.system(cmdexec)
+                ToolDAG.Add("MFTDump", cmdexec)
                 MFTFound = 1
 
         else:
-            print("[+] MFTDump Parser Not Found...")
+            print("[+] MFTDump Parser Not Found (" + MFTPars + ")...")
             SrcMFT = 0
 
 
@@ -889,44 +1167,33 @@ def main():
             SrcMFT = 0
         else:
             ###########################################################################
-            # Normalize the MFTDump.csv into MFTDelt.csv and MFTActv.csv              #
+            # Single Pass over the Parsed $MFT - Classify every record into all of    #
+            #  the enabled $MFT Sections and the IOC Matches at the same time         #
             ###########################################################################
-            MFTDelfile = open(os.path.join(dirtrge, "MFTDelt.csv"), "w", encoding='utf8', errors="replace")
-            MFTActfile = open(os.path.join(dirtrge, "MFTActv.csv"), "w", encoding='utf8', errors="replace")
-            MFTIOCfile = open(os.path.join(dirtrge, "MFTIOCs.csv"), "w", encoding='utf8', errors="replace")
-
-            with open(os.path.join(dirtrge, "MFTDump.csv"), 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=MFTDelim)
-                for csvrow in csvread:
-                    if len(csvrow) > 13:
-                        # Normalized Full Path
-                        if iMFTParsr == 2:
-                            MFTDisplayPath = os.path.join(csvrow[iMFTPath], csvrow[iMFTFile])
-                        else:
-                            MFTDisplayPath = csvrow[iMFTPath]
-
-                        # Initialize Record
-                        MFTCheckIOCRec = "9, Unknown Record, 0, 0, 0, 0"
-
-                        # Deleted File
-                        if csvrow[iMFTDelt] == MFTDelFlag:
-                            MFTCheckIOCRec = "\"1\",\"" + MFTDisplayPath + "\",\"" + csvrow[iMFTCrea] + "\",\"" + csvrow[iMFTAccs] + "\",\"" + csvrow[iMFTModf] + "\",\"" + csvrow[iMFTSize] + "\"\n"
-                            MFTDelfile.write(MFTCheckIOCRec)
-
-                        # Not a Deleted File
-                        if csvrow[iMFTDelt] == MFTActFlag:
-                            MFTCheckIOCRec = "\"0\",\"" + MFTDisplayPath + "\",\"" + csvrow[iMFTCrea] + "\",\"" + csvrow[iMFTAccs] + "\",\"" + csvrow[iMFTModf] + "\",\"" + csvrow[iMFTSize] + "\"\n"
-                            MFTActfile.write(MFTCheckIOCRec)
-
-                        # Check for IOC Matches in the MFT
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC.lower() in MFTCheckIOCRec.lower():
-                                IOCount[IOCIndx] += 1
-                                MFTIOCfile.write(MFTCheckIOCRec)
-
-            MFTDelfile.close()
-            MFTActfile.close()
-            MFTIOCfile.close()
+            MFTSects = []
+            if RunAllAll == 1 or RunSmlDel == 1:
+                MFTSects.append(MFTSections.MFTSection("SmlDel", "1", 1000000, 10000000))
+            if RunAllAll == 1 or RunMedDel == 1:
+                MFTSects.append(MFTSections.MFTSection("MedDel", "1", 10000000, 100000000))
+            if RunAllAll == 1 or RunLrgDel == 1:
+                MFTSects.append(MFTSections.MFTSection("LrgDel", "1", 100000000))
+            if RunAllAll == 1 or RunLrgAct == 1:
+                MFTSects.append(MFTSections.MFTSection("LrgAct", "0", 100000000))
+            if RunAllAll == 1 or RunTmpAct == 1:
+                MFTSects.append(MFTSections.MFTSection("TmpAct", "0", PathHas=("\\temp\\", ".exe")))
+            if RunAllAll == 1 or RunTmpDel == 1:
+                MFTSects.append(MFTSections.MFTSection("TmpDel", "1", PathHas=("\\temp\\", ".exe")))
+            for BandTitle, BandSect in MFTBands:
+                MFTSects.append(BandSect)
+
+            if iMFTParsr == -1:
+                MFTRecs = MFTSections.LoadMFT(ArtCDir, MFTSig)
+            elif iMFTParsr == 0:
+                MFTRecs = MFTSections.CacheMFT(ArtCDir, MFTSig, MFTParse.ReadMFTNative(MFTName))
+            else:
+                ToolDAG.Wait("MFTDump")
+                MFTRecs = MFTSections.CacheMFT(ArtCDir, MFTSig, MFTSections.ReadMFTDump(os.path.join(dirtrge, "MFTDump.csv"), iMFTParsr, CSVPool))
+            MFTHits = MFTSections.ClassifyMFT(MFTRecs, MFTSects, IOCMatch, ArtCDir, MFTSig)
     else:
         print("[+] Bypass Parsing $MFT...")
 
@@ -936,15 +1203,14 @@ def main():
     # Clean Up.                                                               #
     ###########################################################################
     if RunAllAll == 1 or SrcEvtx == 1:
-        os.chmod(os.path.join(dirtrge, "Security.evtx"), stat.S_IWRITE)
-        os.chmod(os.path.join(dirtrge, "Security1.evtx"), stat.S_IWRITE)
-        os.chmod(os.path.join(dirtrge, "System.evtx"), stat.S_IWRITE)
-        os.chmod(os.path.join(dirtrge, "System1.evtx"), stat.S_IWRITE)
+        # The exported (1) logs are not there if the Extracts came from the Cache
+        def CleanEvents():
+            for EvtTemp in ("Security.evtx", "Security1.evtx", "System.evtx", "System1.evtx"):
+                if os.path.isfile(os.path.join(dirtrge, EvtTemp)):
+                    os.chmod(os.path.join(dirtrge, EvtTemp), stat.S_IWRITE)
+                    os.remove(os.path.join(dirtrge, EvtTemp))
 
-        os.remove(os.path.join(dirtrge, "Security.evtx"))
-        os.remove(os.path.join(dirtrge, "Security1.evtx"))
-        os.remove(os.path.join(dirtrge, "System.evtx"))
-        os.remove(os.path.join(dirtrge, "System1.evtx"))
+        ToolDAG.Add("EvtClean", CleanEvents, ("EvtCache",))
 
 
 
@@ -955,7 +1221,14 @@ def main():
     print("[+] Writing Report: " + htmname)
     print("[+] Generating HTML/CSS...")
 
-    outfile = open(htmname, "w", encoding='utf8', errors="replace")
+    outfile = ReportTable.ReportFile(htmname)
+
+    ###########################################################################
+    # Virtual Tables - Large Tables go to JS Data Files (RptMode:Virtual)     #
+    ###########################################################################
+    if RptMode.upper() == "VIRTUAL":
+        outfile.Virtual(os.path.join(dirtrge, diright + "_Data"), diright + "_Data")
+
     ipsfileall = open(ipsnameall, "w", encoding='utf8', errors="replace")
     domfileall = open(domnameall, "w", encoding='utf8', errors="replace")
     hshfileall = open(hshnameall, "w", encoding='utf8', errors="replace")
@@ -991,16 +1264,19 @@ def main():
     outfile.write(".collapse + label:before {background-color: #4F5150; -webkit-border-radius: 10px; -moz-border-radius: 10px;\n")
     outfile.write(" border-radius: 10px; color: #FFFFFF; content: \"+\"; display: block; float: left; font-weight: bold; height: 20px;\n")
     outfile.write(" line-height: 20px; margin-right: 5px; text-align: center; width: 20px;}\n")
-    outfile.write(".collapse:checked + label:before {content: \"\\2212\";} </style>\n")
+    outfile.write(".collapse:checked + label:before {content: \"\\2212\";}\n")
+    outfile.write(".virtual thead th {position: sticky; top: 0; cursor: pointer;} </style>\n")
 
     outfile.write("<script src=\"sortable-Ach.js\"></script>\n")
+    if outfile.DataDir is not None:
+        outfile.write("<script src=\"virtual-Ach.js\"></script>\n")
     outfile.write("<script>function searchIOC (IOCParm) {var name = prompt(\"IOC Search\", IOCParm); if (name != null) {window.find(name, 0, 0, 1); setTimeout(() => {searchIOC(name);}, 100);}} </script>\n")
 
     outfile.write("<title>Triage Collection Endpoint Report(" + diright + ")</title></head>\n")
 
     outfile.write("<body>\n")
     outfile.write("<p><Center>\n")
-    outfile.write("<a name=Top></a>\n<H1>Triage Collection Endpoint Report (v1.52)</H1>\n")
+    outfile.write("<a name=Top></a>\n<H1>Triage Collection Endpoint Report (v1.71)</H1>\n")
 
     if len(Brander) > 1:
         outfile.write(Brander + "\n")
@@ -1020,6 +1296,9 @@ def main():
     if RunAllAll == 1 or RunTmpAct == 1:
         outfile.write("<td width=5%> <a href=#ExeTemp>Temp</a> </td>\n")
 
+    if len(MFTBands) > 0:
+        outfile.write("<td width=5%> <a href=#MFTBands>Bands</a> </td>\n")
+
     if RunAllAll == 1 or RunFaiLgn == 1:
         outfile.write("<td width=5%> <a href=#Logins>FaiLgn</a> </td>\n")
         outfile.write("<td width=5%> <a href=#AttLogin>AttLgn</a> </td>\n")
@@ -1069,6 +1348,9 @@ def main():
     if RunAllAll == 1 or RunPCAsst == 1:
         outfile.write("<td width=4%> <a href=#PCAsist>PCA</a> </td>\n")
 
+    if RunAllAll == 1 or RunEvtChn == 1:
+        outfile.write("<td width=5%> <a href=#EvtChan>Chnls</a> </td>\n")
+
     if RunAllAll == 1 or RunIndIPs == 1:
         outfile.write("<td width=4%> <a href=#BulkIPs>IOC</a> </td></tr>\n")
 
@@ -1087,6 +1369,7 @@ def main():
         filname = os.path.join(dirname, "info.dat")
         dedname = os.path.join(dirtrge, "SysInfo.dat")
         TZname = os.path.join(dirtrge, "TZInfo.dat")
+        ToolDAG.Wait("SysOS", "SysVer", "SysName", "SysTZ")
 
         if os.path.isfile(filname):
             outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed standard information about\n")
@@ -1241,13 +1524,12 @@ def main():
 
 
     ###########################################################################
-    # Small Deleted Files ($MFT) - (Use Python CSV Reader Module)             #
+    # Small Deleted Files ($MFT) - (From the Single Pass MFT Engine)          #
     ###########################################################################
     if (RunAllAll == 1 or RunSmlDel == 1) and SrcMFT == 1:
         print("[+] Generating Small Deleted Files $MFT Information...")
-        filname = os.path.join(dirtrge, "MFTDelt.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<a name=Deleted></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id03\" type=\"checkbox\" checked>\n")
@@ -1262,45 +1544,14 @@ def main():
             outfile.write("files to see where they were located, and what their File Names were to \n")
             outfile.write("determine if they look suspicious.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FileSize = csvrow[5]
-                        if (FileSize.isdigit and len(FileSize) > 1):
-                            nFileSize = int(FileSize)
-                            if (nFileSize > 1000000 and nFileSize < 10000000):
-
-                                RowString = ' '.join(map(str, csvrow))
-
-                                IOCGotHit = 0 
-                                for IOCIndx, AnyIOC in enumerate(IOCList):
-                                    if AnyIOC in RowString.lower():
-                                        IOCount[IOCIndx] += 1
-                                        IOCGotHit = 1
-
-                                if IOCGotHit == 1:
-                                    PreIOC = " <b><font color=red>"
-                                    PostIOC = "</font></b> "
-                                else: 
-                                    PreIOC = " "
-                                    PostIOC = " "
-
-                                outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                                reccount = reccount + 1
-
-            outfile.write("</tbody></table>\n")
+            for MFTRec in MFTHits["SmlDel"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
+
+            MFTTable.Close()
             # csvfile.close()
 
             if reccount < 1:
@@ -1317,13 +1568,12 @@ def main():
 
 
     ###########################################################################
-    # Medium Deleted Files ($MFT) - (Use Python CSV Reader Module)            #
+    # Medium Deleted Files ($MFT) - (From the Single Pass MFT Engine)         #
     ###########################################################################
     if (RunAllAll == 1 or RunMedDel == 1) and SrcMFT == 1:
         print("[+] Generating Medium Deleted Files $MFT Information...")
-        filname = os.path.join(dirtrge, "MFTDelt.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<input class=\"collapse\" id=\"id04\" type=\"checkbox\" checked>\n")
             outfile.write("<label for=\"id04\">\n")
@@ -1337,45 +1587,14 @@ def main():
             outfile.write("files to see where they were located, and what their File Names were to \n")
             outfile.write("determine if they look suspicious.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FileSize = csvrow[5]
-                        if (FileSize.isdigit and len(FileSize) > 1):
-                            nFileSize = int(FileSize)
-                            if (nFileSize > 10000000 and nFileSize < 100000000):
-
-                                RowString = ' '.join(map(str, csvrow))
-
-                                IOCGotHit = 0 
-                                for IOCIndx, AnyIOC in enumerate(IOCList):
-                                    if AnyIOC in RowString.lower():
-                                        IOCount[IOCIndx] += 1
-                                        IOCGotHit = 1
-
-                                if IOCGotHit == 1:
-                                    PreIOC = " <b><font color=red>"
-                                    PostIOC = "</font></b> "
-                                else: 
-                                    PreIOC = " "
-                                    PostIOC = " "
-
-                                outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                                reccount = reccount + 1
-
-            outfile.write("</tbody></table>\n")
+            for MFTRec in MFTHits["MedDel"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
+
+            MFTTable.Close()
             # csvfile.close()
 
             if reccount < 1:
@@ -1392,13 +1611,12 @@ def main():
 
 
     ###########################################################################
-    # Large Deleted Files ($MFT) - (Use Python CSV Reader Module)             #
+    # Large Deleted Files ($MFT) - (From the Single Pass MFT Engine)          #
     ###########################################################################
     if (RunAllAll == 1 or RunLrgDel == 1) and SrcMFT == 1:
         print("[+] Generating Large Deleted Files $MFT Information...")
-        filname = os.path.join(dirtrge, "MFTDelt.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<input class=\"collapse\" id=\"id05\" type=\"checkbox\" checked>\n")
             outfile.write("<label for=\"id05\">\n")
@@ -1412,45 +1630,14 @@ def main():
             outfile.write("files to see where they were located, and what their File Names were to \n")
             outfile.write("determine if they look suspicious.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FileSize = csvrow[5]
-                        if (FileSize.isdigit and len(FileSize) > 1):
-                            nFileSize = int(FileSize)
-                            if nFileSize > 100000000:
-
-                                RowString = ' '.join(map(str, csvrow))
-
-                                IOCGotHit = 0 
-                                for IOCIndx, AnyIOC in enumerate(IOCList):
-                                    if AnyIOC in RowString.lower():
-                                        IOCount[IOCIndx] += 1
-                                        IOCGotHit = 1
-
-                                if IOCGotHit == 1:
-                                    PreIOC = " <b><font color=red>"
-                                    PostIOC = "</font></b> "
-                                else: 
-                                    PreIOC = " "
-                                    PostIOC = " "
-
-                                outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                                reccount = reccount + 1
-
-            outfile.write("</tbody></table>\n")
+            for MFTRec in MFTHits["LrgDel"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
+
+            MFTTable.Close()
             # csvfile.close()
 
             if reccount < 2:
@@ -1468,13 +1655,12 @@ def main():
 
 
     ###########################################################################
-    # Large Active Files ($MFT) - (Use Python CSV Reader Module)              #
+    # Large Active Files ($MFT) - (From the Single Pass MFT Engine)           #
     ###########################################################################
     if (RunAllAll == 1 or RunLrgAct == 1) and SrcMFT == 1:
         print("[+] Generating Large Active Files $MFT Information...")
-        filname = os.path.join(dirtrge, "MFTActv.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<a name=Active></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id06\" type=\"checkbox\" checked>\n")
@@ -1489,45 +1675,14 @@ def main():
             outfile.write("files to see where they were located, and what their File Names were to \n")
             outfile.write("determine if they look suspicious.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FileSize = csvrow[5]
-                        if (FileSize.isdigit and len(FileSize) > 1):
-                            nFileSize = int(FileSize)
-                            if nFileSize > 100000000:
-
-                                RowString = ' '.join(map(str, csvrow))
-
-                                IOCGotHit = 0 
-                                for IOCIndx, AnyIOC in enumerate(IOCList):
-                                    if AnyIOC in RowString.lower():
-                                        IOCount[IOCIndx] += 1
-                                        IOCGotHit = 1
-
-                                if IOCGotHit == 1:
-                                    PreIOC = " <b><font color=red>"
-                                    PostIOC = "</font></b> "
-                                else: 
-                                    PreIOC = " "
-                                    PostIOC = " "
-
-                                outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                                outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                                reccount = reccount + 1
-
-            outfile.write("</tbody></table>\n")
+            for MFTRec in MFTHits["LrgAct"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
+
+            MFTTable.Close()
             # csvfile.close()
 
             if reccount < 1:
@@ -1545,13 +1700,12 @@ def main():
 
 
     ###########################################################################
-    # Active Exe Files in Temp Directories - (Use Python CSV Reader Module)   #
+    # Active Exe Files in Temp Directories - (Single Pass MFT Engine)         #
     ###########################################################################
     if (RunAllAll == 1 or RunTmpAct == 1) and SrcMFT == 1:
         print("[+] Generating Active Files in Temp Directories...")
-        filname = os.path.join(dirtrge, "MFTActv.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<a name=ExeTemp></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id07\" type=\"checkbox\" checked>\n")
@@ -1566,49 +1720,14 @@ def main():
             outfile.write("files to see if they appear to be malicious - a good indicator is if the executable has a \n")
             outfile.write("name that appears to be randomly generated.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FullPath = csvrow[1]
-                        lFullPath = FullPath.lower()
-                        if "\\temp\\" in lFullPath and ".exe" in lFullPath:
-                            FileSize = csvrow[5]
-                            if (FileSize.isdigit and len(FileSize) > 1):
-                                nFileSize = int(FileSize)
-                            else:
-                                nFileSize = 0
-
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                            reccount = reccount + 1
+            for MFTRec in MFTHits["TmpAct"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            MFTTable.Close()
 
             if reccount < 1:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -1625,13 +1744,12 @@ def main():
 
 
     ###########################################################################
-    # Deleted Exe Files in Temp Directories - (Use Python CSV Reader Module)  #
+    # Deleted Exe Files in Temp Directories - (Single Pass MFT Engine)        #
     ###########################################################################
     if (RunAllAll == 1 or RunTmpDel == 1) and SrcMFT == 1:
         print("[+] Generating Deleted Files in Temp Directories...")
-        filname = os.path.join(dirtrge, "MFTDelt.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<a name=DelExeTemp></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id08\" type=\"checkbox\" checked>\n")
@@ -1646,49 +1764,14 @@ def main():
             outfile.write("files to see if they appear to be malicious - a good indicator is if the deleted executable has a \n")
             outfile.write("name that appears to be randomly generated.<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=40%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
+            MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+            MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        FullPath = csvrow[1]
-                        lFullPath = FullPath.lower()
-                        if "\\temp\\" in lFullPath and ".exe" in lFullPath:
-                            FileSize = csvrow[5]
-                            if (FileSize.isdigit and len(FileSize) > 1):
-                                nFileSize = int(FileSize)
-                            else:
-                                nFileSize = 0
-
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            outfile.write("<tr><td width=40%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                            outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                            reccount = reccount + 1
+            for MFTRec in MFTHits["TmpDel"]:
+                MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            MFTTable.Close()
 
             if reccount < 1:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -1705,13 +1788,55 @@ def main():
 
 
     ###########################################################################
-    # IOCs found in the $MFT - (Use Python CSV Reader Module)                 #
+    # Custom $MFT Bands (MFTBand:) - Lookups in the MFT Index                 #
+    ###########################################################################
+    if len(MFTBands) > 0 and SrcMFT == 1:
+        print("[+] Generating Custom $MFT Bands...")
+
+        outfile.write("<a name=MFTBands></a>\n")
+        outfile.write("<input class=\"collapse\" id=\"id38\" type=\"checkbox\" checked>\n")
+        outfile.write("<label for=\"id38\">\n")
+        outfile.write("<H2>Custom $MFT Bands</H2>\n")
+        outfile.write("</label><div><hr>\n")
+
+        outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed information about the Custom \n")
+        outfile.write("Size and Path Bands in the config file (MFTBand:).  Each band lists the Deleted or Active files \n")
+        outfile.write("in its size range whose Full Path contains all of its path strings.\n")
+        outfile.write("<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
+
+        for BandTitle, BandSect in MFTBands:
+            reccount = 0
+            outfile.write("<H3>" + BandTitle + "</H3>\n")
+
+            if MFTFound == 1:
+                MFTTable = ReportTable.ReportTable(outfile, ("40%", "15%", "15%", "15%", "15%"), IOCMatch)
+                MFTTable.Titles(("Full Path", "Created", "Accessed", "Modified", "Size"))
+
+                for MFTRec in MFTHits[BandSect[0]]:
+                    MFTTable.Add((MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), ' '.join(MFTRec[:6]))
+                    reccount = reccount + 1
+
+                MFTTable.Close()
+
+            if reccount < 1:
+                outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+            else:
+                outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+        outfile.write("</div>\n")
+
+    else:
+        print("[+] Bypassing Custom $MFT Bands...")
+
+
+
+    ###########################################################################
+    # IOCs found in the $MFT - (From the Single Pass MFT Engine)              #
     ###########################################################################
     if MFTFound == 1 and SrcMFT == 1:
         print("[+] Generating IOC Matches in the Master File Table ($MFT)...")
-        filname = os.path.join(dirtrge, "MFTIOCs.csv")
 
-        if os.path.isfile(filname):
+        if MFTFound == 1:
             reccount = 0
             outfile.write("<a name=MFTIOCMatch></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id35\" type=\"checkbox\" checked>\n")
@@ -1725,35 +1850,15 @@ def main():
             outfile.write("at your IOCs to see if they can be made more specific.\n")
             outfile.write("<font color=gray size=-1><br><br>Source: Parsed $MFT, TZ is UTC</font></font></i></p>\n")
 
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=5%> Del (+/-)</th>\n")
-            outfile.write("<th width=35%> Full Path (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Accessed (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Size (+/-)</th></tr></thead><tbody>\n")
-
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    FileSize = csvrow[5]
-                    if (FileSize.isdigit and len(FileSize) > 1):
-                        nFileSize = int(FileSize)
-                    else:
-                        nFileSize = 0
-
-                    PreIOC = " <b><font color=red>"
-                    PostIOC = "</font></b> "
+            MFTTable = ReportTable.ReportTable(outfile, ("5%", "35%", "15%", "15%", "15%", "15%"))
+            MFTTable.Titles(("Del", "Full Path", "Created", "Accessed", "Modified", "Size"))
 
-                    outfile.write("<tr><td width=5%>" + PreIOC + csvrow[0] + PostIOC + "</td>\n")
-                    outfile.write("<td width=35%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                    outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                    outfile.write("<td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                    outfile.write("<td width=15%>" + PreIOC + csvrow[4] + PostIOC + "</td>\n")
-                    outfile.write("<td width=15%>" + PreIOC + "{:,}".format(nFileSize) + PostIOC + "</td></tr>\n")
-                    reccount = reccount + 1
+            # Every Record here is an IOC Hit
+            for MFTRec in MFTHits["IOC"]:
+                MFTTable.Add((MFTRec[0], MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], "{:,}".format(MFTRec[6])), IOCGotHit=1)
+                reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            MFTTable.Close()
 
             if reccount < 1:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -1774,12 +1879,6 @@ def main():
     if RunAllAll == 1 or SrcMFT == 1:
         if os.path.isfile(os.path.join(dirtrge, "MFTDump.csv")):
             os.remove(os.path.join(dirtrge, "MFTDump.csv"))
-        if os.path.isfile(os.path.join(dirtrge, "MFTDelt.csv")):
-            os.remove(os.path.join(dirtrge, "MFTDelt.csv"))
-        if os.path.isfile(os.path.join(dirtrge, "MFTActv.csv")):
-            os.remove(os.path.join(dirtrge, "MFTActv.csv"))
-        if os.path.isfile(os.path.join(dirtrge, "MFTIOCs.csv")):
-            os.remove(os.path.join(dirtrge, "MFTIOCs.csv"))
         if os.path.isfile(os.path.join(dirtrge, "MFTDump.log")):
             os.remove(os.path.join(dirtrge, "MFTDump.log"))
 
@@ -1804,55 +1903,32 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "RDPGood.csv")
+        ToolDAG.Wait("EvtCache")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "RDPGood", EvtSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 4:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
+        ###########################################################################
+        # The 4624s are also Counted per Remote IP and Time Window (LogonStats)   #
+        ###########################################################################
+        RDPStats = LogonStats.LogonStats(LgnWind)
 
-                        outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=15%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=15%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + "></tr>\n")
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("20%", "15%", "15%", "20%", "10%", "20%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 4:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add(csvrow[:6], ' '.join(map(str, csvrow)))
 
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
+                    # Write out IP Address for Bulk Lookup 
+                    ipsfileall.write(csvrow[5] + "\n")
 
-                        # Write out IP Address for Bulk Lookup 
-                        ipsfileall.write(csvrow[5] + "\n")
+                    if reccount > 0 or csvrow[0].lower() != "date":
+                        RDPStats.Add(csvrow[0], csvrow[2], LogonStats.SourceText("", csvrow[5]))
 
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+            RptTable.Close()
+            if os.path.isfile(filname):
+                os.remove(filname)
 
             if reccount < 2:
                 print("[!] No RDP Logins Found...")
@@ -1860,6 +1936,12 @@ def main():
             else:
                 outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
 
+            if RDPStats.Events > 0:
+                LogonStats.SourceTable(outfile, IOCMatch, RDPStats, "RDP Logins by Source (Remote IP)")
+                LogonStats.BurstTable(outfile, IOCMatch, RDPStats, "RDP Login Bursts", "RDP Logins", "Logins",
+                                      "Many RDP Logins in a short time, or many UserIds from one Source, can show \n"
+                                      "automated or shared access.", Patterns=0)
+
         else:
             print("[!] No RDP Login Information Found...")
             outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -1892,66 +1974,47 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "SecEvt4625.csv")
+        ToolDAG.Wait("EvtCache")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "SecEvt4625", EvtSig, filname, Workers=CSVPool)
 
-        dedupCol = []
-        dedupCnt = []
-
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=75%> Attempted UserId (+/-)</th>\n")
-            outfile.write("<th width=25%> Count (+/-)</th></tr></thead><tbody>\n")
-
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    ldedupKey = csvrow[1].lower()
-                    if csvrow[0].lower() == "date":
-                        pass
-                    elif ldedupKey in dedupCol:
-                        reccount = reccount + 1
-                        curCnt = dedupCnt[dedupCol.index(ldedupKey)]
-                        curCnt += 1
-                        dedupCnt[dedupCol.index(ldedupKey)] = curCnt
-                    else:
-                        dedupCol.append(ldedupKey)
-                        dedupCnt.append(1)
-
-            if reccount > 0:
-                reccount = 0
-                dedupCnt, dedupCol = list(zip(*sorted(zip(dedupCnt, dedupCol), reverse=True)))
+        ###########################################################################
+        # One pass over the 4625s - Counts per UserId, Source and Time Window     #
+        ###########################################################################
+        FailStats = LogonStats.LogonStats(LgnWind)
 
-                totIdx = len(dedupCol)
-                for curIdx in range(0, totIdx):
-                    # Is it in our IOC List?
-                    RowString = dedupCol[curIdx]
+        if ArtRows is not None:
+            for csvrow in ArtRows:
+                if len(csvrow) < 2 or csvrow[0].lower() == "date":
+                    continue
 
-                    IOCGotHit = 0 
-                    for IOCIndx, AnyIOC in enumerate(IOCList):
-                        if AnyIOC in RowString.lower():
-                            IOCount[IOCIndx] += 1
-                            IOCGotHit = 1
+                if len(csvrow) > 3:
+                    FailStats.Add(csvrow[0], csvrow[1], LogonStats.SourceText(csvrow[2], csvrow[3]))
+                else:
+                    FailStats.Add(csvrow[0], csvrow[1])
 
-                    if IOCGotHit == 1:
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
+            if os.path.isfile(filname):
+                os.remove(filname)
 
-                    outfile.write("<tr><td width=75%>" + PreIOC + dedupCol[curIdx] + PostIOC + "</td>\n")
-                    outfile.write("<td width=25%>" + PreIOC + str(dedupCnt[curIdx]) + PostIOC + "</td></tr>\n")
+        if FailStats.Events > 0:
+            RptTable = ReportTable.ReportTable(outfile, ("40%", "10%", "10%", "20%", "20%"), IOCMatch)
+            RptTable.Titles(("Attempted UserId", "Count", "Sources", "First", "Last"))
 
-                    reccount = reccount + 1
+            for UserKey, UserCount, UserSrcs, FirstDate, LastDate in FailStats.UserCounts():
+                # Is it in our IOC List? (The Table Highlights the Hits)
+                RptTable.Add((UserKey, str(UserCount), str(UserSrcs), FirstDate, LastDate), UserKey)
+                reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+            RptTable.Close()
 
-            if reccount < 2:
-                outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-            else:
-                outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
-        else:
+        if reccount < 1:
             outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+        else:
+            outfile.write("<p>Records Found: " + str(reccount) + " (" + str(FailStats.Events) + " Failed Logins)</p>\n")
+
+            LogonStats.SourceTable(outfile, IOCMatch, FailStats, "Failed Logins by Source (Workstation / IP)")
+            LogonStats.BurstTable(outfile, IOCMatch, FailStats, "Failed Login Bursts", "Failed Logins", "Failed",
+                                  "Many different UserIds in one Window looks like PASSWORD SPRAYING, many attempts on one \n"
+                                  "UserId looks like BRUTE FORCE.")
 
         outfile.write("</div>\n")
 
@@ -1976,58 +2039,41 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "SecEvt4648.csv")
+        ToolDAG.Wait("EvtCache")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "SecEvt4648", EvtSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 7:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
+        ###########################################################################
+        # The 4648s are also Counted per Used Account, Source and Time Window     #
+        ###########################################################################
+        ExpStats = LogonStats.LogonStats(LgnWind)
 
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "17%", "18%", "20%", "10%", "20%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 7:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[0], csvrow[2] + "\\" + csvrow[1], csvrow[4] + "\\" + csvrow[3], csvrow[5], csvrow[8], csvrow[7]), ' '.join(map(str, csvrow)))
 
-                        outfile.write("<tr><" + tdtr + " width=15%>"+ PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=17%>"+ PreIOC + csvrow[2] + "\\" + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=18%>"+ PreIOC + csvrow[4] + "\\" + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=20%>"+ PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>"+ PreIOC + csvrow[8] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=20%>"+ PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
+                    if (reccount > 0 or csvrow[0].lower() != "date") and len(csvrow) > 8:
+                        ExpStats.Add(csvrow[0], csvrow[4] + "\\" + csvrow[3], LogonStats.SourceText(csvrow[2] + "\\" + csvrow[1], csvrow[8]))
 
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
-
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+            RptTable.Close()
+            if os.path.isfile(filname):
+                os.remove(filname)
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
             else:
                 outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
 
+            if ExpStats.Events > 0:
+                LogonStats.SourceTable(outfile, IOCMatch, ExpStats, "Explicit Logins by Source (Account / IP)", "Source Account / IP")
+                LogonStats.BurstTable(outfile, IOCMatch, ExpStats, "Explicit Login Bursts", "Explicit Logins", "Logins",
+                                      "Many different Used Accounts in one Window (UserIds are the Used Accounts) can show \n"
+                                      "credentials being tried for lateral movement.", Patterns=0)
+
         outfile.write("</div>\n")
 
     else:
@@ -2056,55 +2102,24 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirname, Browser[1:])
+        BrwSig = ArtCache.SourceSig([filname], "CSV")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "Browser", BrwSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 7:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        fullURL = csvrow[0]
-
-
-                        if fullURL.startswith("file:///") or reccount == 0:
-                            if ".rar" in fullURL or ".tgz" in fullURL or ".gz" in fullURL or ".tar" in fullURL or ".cab" in fullURL or ".zip" in fullURL or ".arc" in fullURL or ".7z" in fullURL or ".cab" in fullURL or reccount == 0:
-                                # Is it in our IOC List?
-                                RowString = ' '.join(map(str, csvrow))
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "5%", "60%", "10%", "10%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 7:
+                    fullURL = csvrow[0]
 
-                                IOCGotHit = 0 
-                                for IOCIndx, AnyIOC in enumerate(IOCList):
-                                    if AnyIOC in RowString.lower():
-                                        IOCount[IOCIndx] += 1
-                                        IOCGotHit = 1
 
-                                if IOCGotHit == 1:
-                                    PreIOC = " <b><font color=red>"
-                                    PostIOC = "</font></b> "
-                                else: 
-                                    PreIOC = " "
-                                    PostIOC = " "
+                    if fullURL.startswith("file:///") or reccount == 0:
+                        if ".rar" in fullURL or ".tgz" in fullURL or ".gz" in fullURL or ".tar" in fullURL or ".cab" in fullURL or ".zip" in fullURL or ".arc" in fullURL or ".7z" in fullURL or ".cab" in fullURL or reccount == 0:
+                            # Is it in our IOC List? (The Table Highlights the Hits)
+                            RptTable.Add((TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[2]), csvrow[3], csvrow[0], csvrow[6], csvrow[7]), ' '.join(map(str, csvrow)))
 
-                                if reccount == 0:
-                                    outfile.write("<thead>\n")
-                                    PostIOC += " (+/-)"
-
-                                outfile.write("<tr><" + tdtr + " width=15%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=60%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                                if reccount == 0:
-                                    outfile.write("</thead><tbody\n")
-
-                                reccount = reccount + 1
+                            reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2144,59 +2159,25 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirname, Browser[1:])
+        BrwSig = ArtCache.SourceSig([filname], "CSV")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "Browser", BrwSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 7:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        fullURL = csvrow[0]
-
-                        if fullURL.startswith("file:///") or reccount == 0:
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "5%", "60%", "10%", "10%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 7:
+                    fullURL = csvrow[0]
 
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
+                    if fullURL.startswith("file:///") or reccount == 0:
 
-                            outfile.write("<tr><" + tdtr + " width=15%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=60%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[2]), csvrow[3], csvrow[0], csvrow[6], csvrow[7]), ' '.join(map(str, csvrow)))
 
-                            if reccount == 0:
-                                outfile.write("</thead><tbody\n")
-
-                            reccount = reccount + 1
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
+                        reccount = reccount + 1
 
-                            reccount = reccount + 1
+                        reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2236,64 +2217,30 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirname, Browser[1:])
+        BrwSig = ArtCache.SourceSig([filname], "CSV")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "Browser", BrwSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 7:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        fullURL = csvrow[0]
-
-                        if not fullURL.startswith("file:///"):
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "5%", "60%", "10%", "10%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 7:
+                    fullURL = csvrow[0]
 
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
+                    if not fullURL.startswith("file:///"):
 
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[2]), csvrow[3], csvrow[0], csvrow[6], csvrow[7]), ' '.join(map(str, csvrow)))
 
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=15%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=60%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody\n")
-
-                            reccount = reccount + 1
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
+                        reccount = reccount + 1
 
-                            # Write out Domain for Bulk Lookup 
-                            url_split = csvrow[0].split('/')
-                            if len(url_split) > 2:
-                                domfileall.write(url_split[2] + "\n")
+                        # Write out Domain for Bulk Lookup 
+                        url_split = csvrow[0].split('/')
+                        if len(url_split) > 2:
+                            domfileall.write(url_split[2] + "\n")
 
-                            reccount = reccount + 1
+                        reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2332,62 +2279,27 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirname, Downlod[1:])
+        DwnSig = ArtCache.SourceSig([filname], "CSV")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "Downlod", DwnSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 14:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("25%", "35%", "10%", "10%", "10%", "10%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 14:
 
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[14], csvrow[1], TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[5]), csvrow[9], csvrow[8], csvrow[11]), ' '.join(map(str, csvrow)))
 
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
-
-                        outfile.write("<tr><" + tdtr + " width=25%>" + PreIOC + csvrow[14] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=35%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[9] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[11] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                        if reccount == 0:
-                            outfile.write("</thead><tbody\n")
-
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
+                    # Write out Domain for Bulk Lookup 
+                    url_split = csvrow[1].split('/')
+                    if len(url_split) > 2:
+                        domfileall.write(url_split[2] + "\n")
 
-                        # Write out Domain for Bulk Lookup 
-                        url_split = csvrow[1].split('/')
-                        if len(url_split) > 2:
-                            domfileall.write(url_split[2] + "\n")
-
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2427,47 +2339,23 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "WinPrefetchView.csv")
+        ToolDAG.Wait("Prefetch")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "Prefetch", PrfSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=20%> FileName (+/-)</th>\n")
-            outfile.write("<th width=15%> Created (+/-)</th>\n")
-            outfile.write("<th width=15%> Modified (+/-)</th>\n")
-            outfile.write("<th width=15%> Last Run (+/-)</th>\n")
-            outfile.write("<th width=5%> Times (+/-)</th>\n")
-            outfile.write("<th width=30%> Path (+/-)</th></tr></thead><tbody>\n")
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("20%", "15%", "15%", "15%", "5%", "30%"), IOCMatch, RowTag="<tr bgcolor=E0E0E0>")
+            RptTable.Titles(("FileName", "Created", "Modified", "Last Run", "Times", "Path"))
 
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 7:
-                        reccount = reccount + 1
+            for csvrow in ArtRows:
+                if len(csvrow) > 7:
+                    reccount = reccount + 1
 
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        outfile.write("<tr bgcolor=E0E0E0><td width=20%>" + PreIOC + csvrow[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + csvrow[7] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + csvrow[6] + PostIOC + "</td>\n")
-                        outfile.write("<td width=30%>" + PreIOC + csvrow[5] + PostIOC + "</td></tr>\n")
-
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[0], TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[1]), TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[2]), TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[7]), csvrow[6], csvrow[5]), ' '.join(map(str, csvrow)))
+
+            RptTable.Close()
+            if os.path.isfile(filname):
+                os.remove(filname)
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2506,9 +2394,8 @@ def main():
 
         if os.path.isfile(filname):
             print("[+] Parsing Windows 11 Program Compatibility Assistant Data...")
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=20%> Date (+/-)</th>\n")
-            outfile.write("<th width=80%> Process Path (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("20%", "80%"), IOCMatch, RowTag="<tr bgcolor=E0E0E0>")
+            RptTable.Titles(("Date", "Process Path"))
 
             with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter='|')
@@ -2516,27 +2403,11 @@ def main():
                     if len(csvrow) > 0:
                         reccount = reccount + 1
 
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((csvrow[1], csvrow[0]), ' '.join(map(str, csvrow)))
 
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
 
-                        outfile.write("<tr bgcolor=E0E0E0><td width=20%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=80%>" + PreIOC + csvrow[0] + PostIOC + "</td></tr>\n")
-
-
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No PCA Data Found! </font></b></p>\n")
@@ -2577,16 +2448,8 @@ def main():
 
         if os.path.isfile(filname):
             print("[+] Reading CPorts Output File...")
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=13%> Process (+/-)</th>\n")
-            outfile.write("<th width=5%> Prot. (+/-)</th>\n")
-            outfile.write("<th width=10%> Local IP (+/-)</th>\n")
-            outfile.write("<th width=5%> LPort (+/-)</th>\n")
-            outfile.write("<th width=10%> Remote IP (+/-)</th>\n")
-            outfile.write("<th width=5%> RPort (+/-)</th>\n")
-            outfile.write("<th width=15%> RHost (+/-)</th>\n")
-            outfile.write("<th width=7%> State (+/-)</th>\n")
-            outfile.write("<th width=30%> Process Path (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("13%", "5%", "10%", "5%", "10%", "5%", "15%", "7%", "30%"), IOCMatch, RowTag="<tr bgcolor=E0E0E0>")
+            RptTable.Titles(("Process", "Prot.", "Local IP", "LPort", "Remote IP", "RPort", "RHost", "State", "Process Path"))
 
             with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
@@ -2594,45 +2457,22 @@ def main():
                     if len(csvrow) > 11:
                         reccount = reccount + 1
 
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        outfile.write("<tr bgcolor=E0E0E0><td width=13%>" + PreIOC + csvrow[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                        outfile.write("<td width=10%>" + PreIOC + csvrow[5] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                        outfile.write("<td width=10%> <A href=https://www.virustotal.com/#/search/" + csvrow[8] + ">" + PreIOC + csvrow[8] + PostIOC + "</a> </td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + csvrow[6] + PostIOC + "</td>\n")
-
                         ###########################################################################
                         # Velociraptor Artifact does not have resolved IP - So Ignore this column #
                         ###########################################################################
                         if Collect.startswith("AChoir"):
-                            outfile.write("<td width=15%>" + PreIOC + csvrow[9] + PostIOC + "</td>\n")
+                            RHost = csvrow[9]
                         else:
-                            outfile.write("<td width=15%> Not Resolved </td>\n")
+                            RHost = "Not Resolved"
 
-                        outfile.write("<td width=7%>" + PreIOC + csvrow[10] + PostIOC + "</td>\n")
-                        outfile.write("<td width=30%>" + PreIOC + csvrow[11] + PostIOC + "</td></tr>\n")
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((csvrow[0], csvrow[2], csvrow[5], csvrow[3], ReportTable.VTLink(csvrow[8]), csvrow[6], RHost, csvrow[10], csvrow[11]), ' '.join(map(str, csvrow)))
 
                         # Write out IP Address for Bulk Lookup 
                         ipsfileall.write(csvrow[8] + "\n")
 
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No CPorts Data Found! </font></b></p>\n")
@@ -2651,73 +2491,52 @@ def main():
 
         if os.path.isfile(filname):
             print("[+] Reading Netstat -abno Output File...")
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><th width=5%> Prot. (+/-)</th>\n")
-            outfile.write("<th width=15%> Local IP (+/-)</th>\n")
-            outfile.write("<th width=5%> Local Port (+/-)</th>\n")
-            outfile.write("<th width=15%> Remote IP (+/-)</th>\n")
-            outfile.write("<th width=5%> Remote Port (+/-)</th>\n")
-            outfile.write("<th width=10%> State (+/-)</th>\n")
-            outfile.write("<th width=5%> PID </th>\n")
-            outfile.write("<th width=20%> Component </th>\n")
-            outfile.write("<th width=20%> Process (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("5%", "15%", "5%", "15%", "5%", "10%", "5%", "20%", "20%"), IOCMatch)
+            RptTable.Titles(("Prot.", "Local IP", "Local Port", "Remote IP", "Remote Port", "State", "PID", "Component", "Process"))
+
+            ###########################################################################
+            # Each Connection is followed by its Component and [Process] lines, so    #
+            #  hold the Connection until the next one starts, then write the Row      #
+            ###########################################################################
+            ConnLine = ""
+            ConnCells = []
+            ConnTrail = []
 
             innfile = open(filname, encoding='utf8', errors="replace")
             for innline in innfile:
                 if innline.startswith("  TCP ") or innline.startswith("  UDP "):
+                    if len(ConnCells) > 0:
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add(ConnCells + [" ".join(ConnTrail[:-1]), "".join(ConnTrail[-1:])], ConnLine)
+                        ConnCells = []
 
-                    # Is it in our IOC List?
-                    IOCGotHit = 0 
-                    for IOCIndx, AnyIOC in enumerate(IOCList):
-                        if AnyIOC in innline.lower():
-                            IOCount[IOCIndx] += 1
-                            IOCGotHit = 1
-
-                    if IOCGotHit == 1:
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
+                    ConnTrail = []
 
                     # Parse out individual pieces
                     ConnSplit = innline.split()
                     if len(ConnSplit) == 5:
-                        if reccount > 0:
-                            outfile.write("</tr>\n")
-
                         LocSplit = ConnSplit[1].rsplit(':',1)
                         RmtSplit = ConnSplit[2].rsplit(':',1)
 
-                        outfile.write("<tr><td width=5%>" + PreIOC + ConnSplit[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + LocSplit[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + LocSplit[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%> <A href=https://www.virustotal.com/#/search/" + RmtSplit[0] + ">" + PreIOC + RmtSplit[0] + PostIOC + "</a> </td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + RmtSplit[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=10%>" + PreIOC + ConnSplit[3] + PostIOC +  "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + ConnSplit[4] + PostIOC +  "</td>\n")
+                        ConnCells = [ConnSplit[0], LocSplit[0], LocSplit[1], ReportTable.VTLink(RmtSplit[0]), RmtSplit[1], ConnSplit[3], ConnSplit[4]]
+                        ConnLine = innline
                         reccount = reccount + 1
 
                     elif len(ConnSplit) == 4:
-                        if reccount > 0:
-                            outfile.write("</tr>\n")
-
                         LocSplit = ConnSplit[1].rsplit(':',1)
                         RmtSplit = ConnSplit[2].rsplit(':',1)
 
-                        outfile.write("</tr><tr><td width=5%>" + PreIOC + ConnSplit[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + LocSplit[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + LocSplit[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=15%>" + PreIOC + RmtSplit[0] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + RmtSplit[1] + PostIOC + "</td>\n")
-                        outfile.write("<td width=10%>" + PreIOC + "-" + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + ConnSplit[3] + PostIOC + "</td>\n")
+                        ConnCells = [ConnSplit[0], LocSplit[0], LocSplit[1], RmtSplit[0], RmtSplit[1], "-", ConnSplit[3]]
+                        ConnLine = innline
                         reccount = reccount + 1
                 else:
-                    if reccount > 0:
-                        outfile.write("<td width=20%>" + innline +  "</td>\n")
+                    if len(ConnCells) > 0 and len(innline.strip()) > 0:
+                        ConnTrail.append(innline.strip())
 
-            outfile.write("</tr></tbody></table>\n")
+            if len(ConnCells) > 0:
+                RptTable.Add(ConnCells + [" ".join(ConnTrail[:-1]), "".join(ConnTrail[-1:])], ConnLine)
+
+            RptTable.Close()
             innfile.close()
 
         else:
@@ -2752,61 +2571,46 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "AmCache.dat")
+        ToolDAG.Wait("AmCache")
         AmCName = " "
         AmCLast = " "
 
         if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-
-            outfile.write("<thead><th width=10%> Last (+/-)</th>\n")
-            outfile.write("<th width=60%> Name (+/-)</th>\n")
-            outfile.write("<th width=30%> Hash (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("10%", "60%", "30%"), IOCMatch)
+            RptTable.Titles(("Last", "Name", "Hash"))
 
             innfile = open(filname, encoding='utf8', errors="replace")
             for innline in innfile:
                 reccount = reccount + 1
 
-                # Is it in our IOC List?
-                IOCGotHit = 0 
-                for IOCIndx, AnyIOC in enumerate(IOCList):
-                    if AnyIOC in innline.lower():
-                        IOCount[IOCIndx] += 1
-                        IOCGotHit = 1
-
-                if IOCGotHit == 1:
-                    PreIOC = " <b><font color=red>"
-                    PostIOC = "</font></b> "
-                else: 
-                    PreIOC = " "
-                    PostIOC = " "
-
                 strIndex = innline.find("LastWrite")
                 if strIndex > 0:
                     AmCLast = innline[strIndex+10:]
                     AmCName = innline[0:strIndex]
                 elif innline.startswith("Hash: "):
-                    outfile.write("<tr><td width=10%>" + PreIOC + AmCLast + PostIOC + "</td>\n")
-                    outfile.write("<td width=50%>" + PreIOC + AmCName + PostIOC + "</td>\n")
-
                     if len(innline) > 32:
-                        outfile.write("<td width=30%> <A href=https://www.virustotal.com/#/search/" + innline[6:].strip() + ">" + PreIOC + innline[6:].strip() + PostIOC + "</a></td></tr>\n")
-                        AmCName = " "
-                        AmCLast = " "
+                        AmCHash = ReportTable.VTLink(innline[6:].strip())
                     else:
-                        outfile.write("<td width=30%> Unknown</td></tr>\n")
-                        AmCName = " "
-                        AmCLast = " "
+                        AmCHash = "Unknown"
+
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((AmCLast, AmCName, AmCHash), innline)
+                    AmCName = " "
+                    AmCLast = " "
 
                     reccount = reccount + 1
 
                 else:
                     if len(innline) > 1:
-                        outfile.write("<td Colspan=\"3\" style=\"text-align:left\" width=100%>" + PreIOC + innline.strip() + PostIOC + "</td></tr>\n")
+                        # Is it in our IOC List?
+                        IOCGotHit = IOCMatch.Check(innline)
+
+                        RptTable.Span(innline.strip(), IOCGotHit)
                         reccount = reccount + 1
                         AmCName = " "
                         AmCLast = " "
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
             innfile.close()
             os.remove(filname)
 
@@ -2851,10 +2655,8 @@ def main():
         filname = os.path.join(dirname, UsrAsst[1:])
 
         if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=13%> Modified Time (+/-)</th>\n")
-            outfile.write("<th width=5%> Modified Count (+/-)</th>\n")
-            outfile.write("<th width=30%> Item Name (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "5%", "30%"), IOCMatch, RowTag="<tr bgcolor=E0E0E0>")
+            RptTable.Titles(("Modified Time", "Modified Count", "Item Name"))
 
             with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
@@ -2862,27 +2664,10 @@ def main():
                     if len(csvrow) > 3:
                         reccount = reccount + 1
 
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((csvrow[3], csvrow[2], csvrow[0]), ' '.join(map(str, csvrow)))
 
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        outfile.write("<tr bgcolor=E0E0E0><td width=15%>" + PreIOC + csvrow[3] + PostIOC + "</td>\n")
-                        outfile.write("<td width=5%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                        outfile.write("<td width=30%>" + PreIOC + csvrow[0] + PostIOC + "</td></tr>\n")
-
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -2906,6 +2691,7 @@ def main():
         outfile.write("</label><div><font color=gray size=-1>Source: User Registry Hives, Dates ending with a Z denote UTC Time Zone</font><hr>\n")
 
         filcount = 0
+        ToolDAG.Wait(*UsrTasks)
 
         for curfile in os.listdir(dirtrge):
             if curfile.startswith("shlasst."):
@@ -2924,26 +2710,14 @@ def main():
                 reccount = 0 
                 innfile = open(os.path.join(dirtrge, curfile), encoding='utf8', errors="replace")
                 for innline in innfile:
-                    # Is it in our IOC List?
-                    IOCGotHit = 0 
-                    for IOCIndx, AnyIOC in enumerate(IOCList):
-                        if AnyIOC in innline.lower():
-                            IOCount[IOCIndx] += 1
-                            IOCGotHit = 1
-
-                    if IOCGotHit == 1:
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
-
                     if innline.startswith("shellfolders "):
                         outfile.write("<h2>" + innline.strip()  + "</h2><br>\n")
                     elif innline.startswith("UserAssist"):
                         outfile.write("<hr><h2>" + innline.strip()  + "</h2><br>\n")
                     else:
-                        outfile.write(PreIOC + innline.strip() + PostIOC + "<br>\n")
+                        # Is it in our IOC List?
+                        IOCGotHit = IOCMatch.Check(innline)
+                        outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "<br>\n")
                     reccount = reccount + 1
 
                 innfile.close()
@@ -3003,20 +2777,8 @@ def main():
                     innfile = open(curfile, encoding='utf8', errors="replace")
                     for innline in innfile:
                         # Is it in our IOC List?
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in innline.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        outfile.write(PreIOC + innline.strip() + PostIOC + "<br>\n")
+                        IOCGotHit = IOCMatch.Check(innline)
+                        outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "<br>\n")
                         reccount = reccount + 1
 
                     innfile.close()
@@ -3087,66 +2849,39 @@ def main():
             curdir = os.path.join(dirname, LNKFile[1:])
             filname = "LNKFiles.csv"
             fulname = os.path.join(dirtrge, filname)
-            cmdexec = exeName + " -q -d " + curdir + " --dt \"yyyy-MM-dd HH:mm:ss K\" --csv " + dirtrge + " --csvf " + filname 
-            returned_value = os.system(cmdexec)
+            LnkSig = ArtCache.SourceSig([curdir], "LECmd")
+
+            if ArtCache.IsCached(ArtCDir, "LNKFiles", LnkSig):
+                print("[+] Using Cached LNK File Data (Artifact Cache)...")
+            else:
+                cmdexec = exeName + " -q -d " + curdir + " --dt \"yyyy-MM-dd HH:mm:ss K\" --csv " + dirtrge + " --csvf " + filname 
+                returned_value = os.system(cmdexec)
 
             print("[+] Reading Desktop and Recent LNK Files from Multiple User Profiles...")
 
             reccount = 0
+            ArtRows = ArtCache.CachedCSV(ArtCDir, "LNKFiles", LnkSig, fulname, Workers=CSVPool)
 
-            if os.path.isfile(fulname):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                with open(fulname, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 18:
-                            if reccount == 0:
-                                tdtr = "th"
-                                csvrow[1] = "Source<br>Create"
-                                csvrow[2] = "Source<br>Modify"
-                                csvrow[3] = "Source<br>Access"
-                                csvrow[4] = "Target<br>Create"
-                                csvrow[5] = "Target<br>Modify"
-                                csvrow[6] = "Target<br>Access"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=25%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=23%>" + PreIOC + csvrow[15] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[18] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=7%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
+            if ArtRows is not None:
+                RptTable = ReportTable.ReportTable(outfile, ("25%", "23%", "10%", "7%", "7%", "7%", "7%", "7%", "7%"), IOCMatch, HeadRow=1)
+                for csvrow in ArtRows:
+                    if len(csvrow) > 18:
+                        if reccount == 0:
+                            csvrow[1] = "Source<br>Create"
+                            csvrow[2] = "Source<br>Modify"
+                            csvrow[3] = "Source<br>Access"
+                            csvrow[4] = "Target<br>Create"
+                            csvrow[5] = "Target<br>Modify"
+                            csvrow[6] = "Target<br>Access"
 
-                            reccount = reccount + 1
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((csvrow[0], csvrow[15], csvrow[18], TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[1]), TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[2]), TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[3]), TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[4]), TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[5]), TimeNorm.ShowTime(TimeNorm.ZoneTime, csvrow[6])), ' '.join(map(str, csvrow)))
+
+                        reccount = reccount + 1
 
-                outfile.write("</tbody></table>\n")
-                os.remove(fulname)
+                RptTable.Close()
+                if os.path.isfile(fulname):
+                    os.remove(fulname)
 
                 if reccount < 2:
                     print("[!] No LNK File Data Found...")
@@ -3192,49 +2927,25 @@ def main():
         filname = os.path.join(dirname, AutoRun[1:])
 
         if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=10%> Time (+/-)</th>\n")
-            outfile.write("<th width=30%> Entry Location  (+/-)</th>\n")
-            outfile.write("<th width=10%> Entry  (+/-)</th>\n")
-            outfile.write("<th width=30%> Image Path  (+/-)<hr> Launch String</th>\n")
-            outfile.write("<th width=15%> MD5  (+/-)</th>\n")
-            outfile.write("<th width=5%> Enabled  (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("10%", "30%", "10%", "30%", "15%", "5%"), IOCMatch)
+            RptTable.Titles(("Time", "Entry Location", "Entry", "Image Path <hr> Launch String", "MD5", "Enabled"))
 
             with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
                 for csvrow in csvread:
                     if len(csvrow) > 10:
                         if "currentversion\\run" in csvrow[1].lower():
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            outfile.write("<tr><td width=10%>" + PreIOC + csvrow[0] + PostIOC + "</td>\n")
-                            outfile.write("<td width=30%>" + PreIOC + csvrow[1] + PostIOC + "</td>\n")
-                            outfile.write("<td width=10%>" + PreIOC + csvrow[2] + PostIOC + "</td>\n")
-                            outfile.write("<td width=30%>" + PreIOC + csvrow[8] + PostIOC + "<hr>" + csvrow[10] + "</td>\n")
                             if len(csvrow) > 11:
-                                outfile.write("<td width=15%> <A href=https://www.virustotal.com/#/search/" + csvrow[11] + ">" + PreIOC + csvrow[11] + PostIOC + "</a> </td>\n")
+                                Hash = ReportTable.VTLink(csvrow[11])
                             else:
-                                outfile.write("<td width=15%> No MD5 Available </td>\n")
-                            outfile.write("<td width=5%>" + PreIOC + csvrow[3] + PostIOC + "</td></tr>\n")
+                                Hash = "No MD5 Available"
+
+                            # Is it in our IOC List? (The Table Highlights the Hits)
+                            RptTable.Add((TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[0]), csvrow[1], csvrow[2], csvrow[8] + "<hr>" + csvrow[10], Hash, csvrow[3]), ' '.join(map(str, csvrow)))
 
                             reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 print("[!] No Run or RunOnce Information Found...")
@@ -3271,59 +2982,27 @@ def main():
         filname = os.path.join(dirname, AutoRun[1:])
 
         if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("10%", "30%", "10%", "30%", "15%", "5%"), IOCMatch, HeadRow=1)
             with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
                 for csvrow in csvread:
                     if len(csvrow) > 10:
                         if reccount == 0:
-                            tdtr = "th"
                             Hash = "MD5"
-                        else:
-                            tdtr = "td"
-                            Hash = "No MD5 Available"
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
-
-
-                        outfile.write("<tr><" + tdtr + " width=10%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=30%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=30%>" + PreIOC + csvrow[8] + "<hr>" + csvrow[10] + PostIOC + "</" + tdtr + ">\n")
-                        if len(csvrow) > 11:
-                            outfile.write("<" + tdtr + " width=15%> <A href=https://www.virustotal.com/#/search/" + csvrow[11] + ">" + PreIOC + csvrow[11] + PostIOC + "</a> </td>\n")
+                        elif len(csvrow) > 11:
+                            Hash = ReportTable.VTLink(csvrow[11])
 
                             # Write out Hash for Bulk Lookup 
                             hshfileall.write(csvrow[11] + "\n")
                         else:
-                            outfile.write("<" + tdtr + " width=15%> " + Hash + " </td>\n")
+                            Hash = "No MD5 Available"
 
-                        outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
+                        # Is it in our IOC List? (The Table Highlights the Hits)
+                        RptTable.Add((TimeNorm.ShowTime(TimeNorm.NirsoftTime, csvrow[0]), csvrow[1], csvrow[2], csvrow[8] + "<hr>" + csvrow[10], Hash, csvrow[3]), ' '.join(map(str, csvrow)))
 
                         reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 print("[!] No Autoruns Information Found...")
@@ -3363,50 +3042,21 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "SysEvt7045.csv")
+        ToolDAG.Wait("EvtCache")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "SysEvt7045", EvtSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 3:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "30%", "45%", "10%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 3:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[0], csvrow[1], csvrow[2], csvrow[3]), ' '.join(map(str, csvrow)))
 
-                        outfile.write("<tr><" + tdtr + " width=15%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=30%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=45%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
-
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+            RptTable.Close()
+            if os.path.isfile(filname):
+                os.remove(filname)
 
             if reccount < 2:
                 print("[!] No  Installed Services Found...")
@@ -3448,50 +3098,21 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "SecEvt4698.csv")
+        ToolDAG.Wait("EvtCache")
+        ArtRows = ArtCache.CachedCSV(ArtCDir, "SecEvt4698", EvtSig, filname, Workers=CSVPool)
 
-        if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 3:
-                        if reccount == 0:
-                            tdtr = "th"
-                        else:
-                            tdtr = "td"
-
-                        # Is it in our IOC List?
-                        RowString = ' '.join(map(str, csvrow))
-
-                        IOCGotHit = 0 
-                        for IOCIndx, AnyIOC in enumerate(IOCList):
-                            if AnyIOC in RowString.lower():
-                                IOCount[IOCIndx] += 1
-                                IOCGotHit = 1
-
-                        if IOCGotHit == 1:
-                            PreIOC = " <b><font color=red>"
-                            PostIOC = "</font></b> "
-                        else: 
-                            PreIOC = " "
-                            PostIOC = " "
-
-                        if reccount == 0:
-                            outfile.write("<thead>\n")
-                            PostIOC += " (+/-)"
-
-                        outfile.write("<tr><" + tdtr + " width=15%>"+ PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=25%>"+ PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=30%>"+ PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                        outfile.write("<" + tdtr + " width=30%>"+ PreIOC + csvrow[3] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                        if reccount == 0:
-                            outfile.write("</thead><tbody>\n")
+        if ArtRows is not None:
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "25%", "30%", "30%"), IOCMatch, HeadRow=1)
+            for csvrow in ArtRows:
+                if len(csvrow) > 3:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[0], csvrow[1], csvrow[2], csvrow[3]), ' '.join(map(str, csvrow)))
 
-                        reccount = reccount + 1
+                    reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
-            os.remove(filname)
+            RptTable.Close()
+            if os.path.isfile(filname):
+                os.remove(filname)
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -3526,10 +3147,8 @@ def main():
             curdir = curCdir
 
         if os.path.isdir(curdir):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=20%> File (+/-)</th>\n")
-            outfile.write("<th width=40%> URI (+/-)</th>\n")
-            outfile.write("<th width=40%> Command (+/-)</th></tr></thead><tbody>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("style=\"text-align: left\" width=20%", "style=\"text-align: left\" width=40%", "style=\"text-align: left\" width=40%"), IOCMatch)
+            RptTable.Titles(("File", "URI", "Command"))
 
             for root, dirs, files in os.walk(curdir):
                 for fname in files:
@@ -3564,29 +3183,12 @@ def main():
                     except Exception as e:
                         print(f"[!] Error Openning XML File: {e}")
 
-                    # Is it in our IOC List?
-                    RowString = task_URI + task_Command 
-
-                    IOCGotHit = 0 
-                    for IOCIndx, AnyIOC in enumerate(IOCList):
-                        if AnyIOC in RowString.lower():
-                            IOCount[IOCIndx] += 1
-                            IOCGotHit = 1
-
-                    if IOCGotHit == 1:
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
-
-                    outfile.write("<tr><td style=\"text-align: left\" width=20%>" + PreIOC + fname + PostIOC + "</td>\n")
-                    outfile.write("<td style=\"text-align: left\" width=40%>" + PreIOC + task_URI + PostIOC + "</td>\n")
-                    outfile.write("<td style=\"text-align: left\" width=40%>" + PreIOC + task_Command + PostIOC + "</td></tr>\n")
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((fname, task_URI, task_Command), task_URI + task_Command)
 
                     reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -3604,6 +3206,166 @@ def main():
 
 
 
+    ###########################################################################
+    # Write the Event Log Channels (Channel Sweep)                            #
+    ###########################################################################
+    if RunAllAll == 1 or RunEvtChn == 1:
+        print("[+] Generating Event Log Channels...")
+        ToolDAG.Wait("EvtSweep")
+
+        outfile.write("<a name=EvtChan></a>\n")
+        outfile.write("<input class=\"collapse\" id=\"id39\" type=\"checkbox\" checked>\n")
+        outfile.write("<label for=\"id39\">\n")
+        outfile.write("<H2>Event Log Channels</H2>\n")
+        outfile.write("</label><div><hr>\n")
+
+        outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed every collected Event Log \n")
+        outfile.write("Channel (Other than Security and System) and lists its Size, Record Count, and the Time \n")
+        outfile.write("Range of its Records.  A Channel with a short Time Range, or very few Records, may have \n")
+        outfile.write("been cleared.<font color=gray size=-1><br><br>Source: Parsed Event Logs, TZ is UTC</font></font></i></p>\n")
+
+        reccount = 0
+        filname = os.path.join(dirtrge, "EvtChannels.csv")
+        if os.path.isfile(filname):
+            RptTable = ReportTable.ReportTable(outfile, ("40%", "10%", "10%", "10%", "15%", "15%"), IOCMatch)
+            RptTable.Titles(("Channel", "Size", "Records", "EventIDs", "First", "Last"))
+
+            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
+                csvread = csv.reader(csvfile)
+                for csvrow in csvread:
+                    if len(csvrow) > 6 and csvrow[0] != "Channel":
+                        if csvrow[6] != "":
+                            RptTable.Add((csvrow[0], "{:,}".format(int(csvrow[1])), "Error: " + csvrow[6], "", "", ""), csvrow[0])
+                        else:
+                            RptTable.Add((csvrow[0], "{:,}".format(int(csvrow[1])), "{:,}".format(int(csvrow[2])), csvrow[3], csvrow[4], csvrow[5]), csvrow[0])
+                        reccount = reccount + 1
+
+            RptTable.Close()
+            os.remove(filname)
+
+        if reccount < 1:
+            print("[!] No Event Log Channels Found (No Input Data)...")
+            outfile.write("<p><b><font color = red> No Input Data Found! </font></b></p>\n")
+        else:
+            outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+        outfile.write("</div>\n")
+
+
+        print("[+] Generating PowerShell Operational Script Blocks...")
+        outfile.write("<a name=PShlOp></a>\n")
+        outfile.write("<input class=\"collapse\" id=\"id40\" type=\"checkbox\" checked>\n")
+        outfile.write("<label for=\"id40\">\n")
+        outfile.write("<H2>PowerShell Operational (Script Blocks)</H2>\n")
+        outfile.write("</label><div><hr>\n")
+
+        outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed information about \n")
+        outfile.write("PowerShell Script Block Logging.  These are EventID 4104 events in the \n")
+        outfile.write("Microsoft-Windows-PowerShell/Operational Event Log.  Long Scripts are logged in Parts \n")
+        outfile.write("(Same ScriptBlockId).  Focus on Encoded Commands, Download Cradles (Net.WebClient, \n")
+        outfile.write("Invoke-WebRequest, IEX), and AMSI or Logging Bypasses.<font color=gray size=-1><br><br>Source: Parsed PowerShell Operational Event Log, TZ is UTC</font></font></i></p>\n")
+
+        reccount = 0
+        filname = os.path.join(dirtrge, "PShl4104.csv")
+        if os.path.isfile(filname):
+            RptTable = ReportTable.ReportTable(outfile, ("12%", "10%", "5%", "13%", "style=\"text-align: left\" width=60%"), IOCMatch)
+            RptTable.Titles(("Date", "ScriptBlockId", "Part", "Path", "ScriptBlockText"))
+
+            for csvrow in CSVChunk.ReadCSV(filname, Workers=CSVPool):
+                if len(csvrow) > 5 and csvrow[0] != "Date":
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add((csvrow[0], csvrow[1], csvrow[2] + "/" + csvrow[3], csvrow[4], html.escape(csvrow[5])), ' '.join(csvrow))
+                    reccount = reccount + 1
+
+            RptTable.Close()
+            os.remove(filname)
+
+        if reccount < 1:
+            outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+        else:
+            outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+        outfile.write("</div>\n")
+
+
+        print("[+] Generating Task Scheduler Operational Events...")
+        outfile.write("<a name=TaskOp></a>\n")
+        outfile.write("<input class=\"collapse\" id=\"id41\" type=\"checkbox\" checked>\n")
+        outfile.write("<label for=\"id41\">\n")
+        outfile.write("<H2>Task Scheduler Operational</H2>\n")
+        outfile.write("</label><div><hr>\n")
+
+        outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed information about \n")
+        outfile.write("Scheduled Task activity in the Microsoft-Windows-TaskScheduler/Operational Event Log: \n")
+        outfile.write("106 (Task Registered - Detail is the User), 140 (Task Updated), 141 (Task Deleted), and \n")
+        outfile.write("200 (Action Started - Detail is the Action).  Unlike 4698, these do not need Object \n")
+        outfile.write("Access Auditing.  Focus on Tasks that were Registered and Deleted close together, and \n")
+        outfile.write("on unusual Task Names.<font color=gray size=-1><br><br>Source: Parsed TaskScheduler Operational Event Log, TZ is UTC</font></font></i></p>\n")
+
+        reccount = 0
+        filname = os.path.join(dirtrge, "TaskSched.csv")
+        if os.path.isfile(filname):
+            RptTable = ReportTable.ReportTable(outfile, ("15%", "10%", "40%", "35%"), IOCMatch, HeadRow=1)
+            for csvrow in CSVChunk.ReadCSV(filname, Workers=CSVPool):
+                if len(csvrow) > 3:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add(csvrow[:4], ' '.join(csvrow))
+                    reccount = reccount + 1
+
+            RptTable.Close()
+            os.remove(filname)
+
+        if reccount < 2:
+            outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+        else:
+            outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+        outfile.write("</div>\n")
+
+
+        print("[+] Generating RDP Local Session Manager Events...")
+        outfile.write("<a name=RDPLsm></a>\n")
+        outfile.write("<input class=\"collapse\" id=\"id42\" type=\"checkbox\" checked>\n")
+        outfile.write("<label for=\"id42\">\n")
+        outfile.write("<H2>RDP Local Session Manager</H2>\n")
+        outfile.write("</label><div><hr>\n")
+
+        outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed information about \n")
+        outfile.write("Logon Sessions in the Microsoft-Windows-TerminalServices-LocalSessionManager/Operational \n")
+        outfile.write("Event Log: 21 (Logon), 22 (Shell Start), 23 (Logoff), 24 (Disconnect), and 25 (Reconnect). \n")
+        outfile.write("These are kept much longer than the Security Log 4624s on most endpoints.  Focus on the \n")
+        outfile.write("Source Addresses and on Sessions at unusual times.<font color=gray size=-1><br><br>Source: Parsed LocalSessionManager Operational Event Log, TZ is UTC</font></font></i></p>\n")
+
+        reccount = 0
+        filname = os.path.join(dirtrge, "RDPLsm.csv")
+        if os.path.isfile(filname):
+            RptTable = ReportTable.ReportTable(outfile, ("20%", "10%", "30%", "10%", "30%"), IOCMatch, HeadRow=1)
+            for csvrow in CSVChunk.ReadCSV(filname, Workers=CSVPool):
+                if len(csvrow) > 4:
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add(csvrow[:5], ' '.join(csvrow))
+
+                    # Write out IP Address for Bulk Lookup
+                    if reccount > 0 and csvrow[4] not in ("", "LOCAL"):
+                        ipsfileall.write(csvrow[4] + "\n")
+
+                    reccount = reccount + 1
+
+            RptTable.Close()
+            os.remove(filname)
+
+        if reccount < 2:
+            outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
+        else:
+            outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+        outfile.write("</div>\n")
+
+    else:
+        print("[+] Bypassing Event Log Channels...")
+
+
+
     ###########################################################################
     # Write DNS Cache Data = Flat File.                                       #
     ###########################################################################
@@ -3634,11 +3396,8 @@ def main():
         csvname = os.path.join(dirname, DNSCach[1:])
 
         if os.path.isfile(filname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-            outfile.write("<thead><tr><th width=25%> DNS Request (+/-)</th>\n")
-            outfile.write("<th width=25%> Record Name (+/-)</th>\n")
-            outfile.write("<th width=25%> Resolution (+/-)</th>\n")
-            outfile.write("<th width=25%> Record Type (+/-)</th></tr></thead><tbody\n")
+            RptTable = ReportTable.ReportTable(outfile, ("25%", "25%", "25%", "25%"), IOCMatch)
+            RptTable.Titles(("DNS Request", "Record Name", "Resolution", "Record Type"))
 
             innfile = open(filname, encoding='utf8', errors="replace")
             for innline in innfile:
@@ -3667,62 +3426,25 @@ def main():
                     RecType = innline[28:]
                     writeRow = 4
 
-                # Is it in our IOC List?
-                IOCGotHit = 0 
-                for IOCIndx, AnyIOC in enumerate(IOCList):
-                    if AnyIOC in RecType.strip().lower():
-                        IOCount[IOCIndx] += 1
-                        IOCGotHit = 1
-
-                if IOCGotHit == 1:
-                    PreIOC = " <b><font color=red>"
-                    PostIOC = "</font></b> "
-                else: 
-                    PreIOC = " "
-                    PostIOC = " "
-
-                IOCGotHit = 0 
-                for IOCIndx, AnyIOC in enumerate(IOCList):
-                    if AnyIOC in RecName.strip().lower():
-                        IOCount[IOCIndx] += 1
-                        IOCGotHit = 1
-
-                if IOCGotHit == 1:
-                    PreIOC2 = " <b><font color=red>"
-                    PostIOC2 = "</font></b> "
-                else: 
-                    PreIOC2 = " "
-                    PostIOC2 = " "
-
-
                 if writeRow > 0:
-                    outfile.write("<tr><td width=25%>" + DNSRecName.strip() + "</td>\n")
-
                     if writeRow == 1:
-                        outfile.write("<td width=25%>" + PreIOC2 + RecName.strip() + PostIOC2 + "</td>\n")
-                        outfile.write("<td width=25%>" + PreIOC + RecType.strip() + PostIOC + "</td>\n")
-                        outfile.write("<td width=25%> NA </td></tr>\n")
+                        DNSCells = (DNSRecName.strip(), RecName.strip(), RecType.strip(), "NA")
                     elif writeRow == 2:
-                        outfile.write("<td width=25%> <A href=https://www.virustotal.com/#/search/" + RecName.strip().lower() + ">" + PreIOC2 + RecName.strip() + PostIOC2 + "</a> </td>\n")
-                        outfile.write("<td width=25%> <A href=https://www.virustotal.com/#/search/" + RecType.strip() + ">" + PreIOC + RecType.strip() + PostIOC + "</a> </td>\n")
-                        outfile.write("<td width=25%> A (Host) </td></tr>\n")
+                        DNSCells = (DNSRecName.strip(), ReportTable.VTLink(RecName.strip().lower(), RecName.strip()), ReportTable.VTLink(RecType.strip()), "A (Host)")
 
                         ipsfileall.write(RecType.strip() + "\n")
 
                         # Write out Domain for Bulk Lookup 
                         domfileall.write(RecName.strip() + "\n")
                     elif writeRow == 3:
-                        outfile.write("<td width=25%>" + PreIOC2 + RecName.strip() + PostIOC2 + "</td>\n")
-                        outfile.write("<td width=25%>" + PreIOC + RecType.strip() + PostIOC + "</td>\n")
-                        outfile.write("<td width=25%> SRV Record </td></tr>\n")
+                        DNSCells = (DNSRecName.strip(), RecName.strip(), RecType.strip(), "SRV Record")
                     elif writeRow == 4:
-                        outfile.write("<td width=25%> <A href=https://www.virustotal.com/#/search/" + RecName.strip().lower() + ">" + PreIOC2 + RecName.strip() + PostIOC2 + "</a> </td>\n")
-                        outfile.write("<td width=25%> <A href=https://www.virustotal.com/#/search/" + RecType.strip() + ">" + PreIOC + RecType.strip() + PostIOC + "</a> </td>\n")
-                        outfile.write("<td width=25%> PTR Record </td></tr>\n")
+                        DNSCells = (DNSRecName.strip(), ReportTable.VTLink(RecName.strip().lower(), RecName.strip()), ReportTable.VTLink(RecType.strip()), "PTR Record")
                     else:
-                        outfile.write("<td width=25%>" + PreIOC2 + RecName.strip() + PostIOC2 + "</td>\n")
-                        outfile.write("<td width=25%>" + PreIOC + RecType.strip() + PostIOC + "</td>\n")
-                        outfile.write("<td width=25%> Unknown </td></tr>\n")
+                        DNSCells = (DNSRecName.strip(), RecName.strip(), RecType.strip(), "Unknown")
+
+                    # Is it in our IOC List? (The Table Highlights the Hits)
+                    RptTable.Add(DNSCells, RecName.strip() + " " + RecType.strip())
 
                     RecName = ""                
                     RecType = ""                
@@ -3730,48 +3452,20 @@ def main():
 
                 LastRec = innline.strip()
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
             innfile.close()
 
         elif os.path.isfile(csvname):
-            outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
+            RptTable = ReportTable.ReportTable(outfile, ("35%", "10%", "10%", "10%", "35%"), IOCMatch)
             with open(csvname, 'r', encoding='utf8', errors="replace") as csvfile:
                 csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
                 for csvrow in csvread:
                     if len(csvrow) > 4:
                         if reccount == 0:
-                            tdtr = "th"
+                            RptTable.Titles(csvrow[:5])
                         else:
-                            tdtr = "td"
-
-                        if reccount == 0:
-                            outfile.write("<thead><tr><" + tdtr + " width=35%> " + csvrow[0] + " (+/-)</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + csvrow[1] + " (+/-)</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + csvrow[2] + " (+/-)</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + csvrow[3] + " (+/-)</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=35%> " + csvrow[4] + " (+/-)</" + tdtr + "></tr></thead><tbody>\n")
-                        else:
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC2 = " <b><font color=red>"
-                                PostIOC2 = "</font></b> "
-                            else: 
-                                PreIOC2 = " "
-                                PostIOC2 = " "
-
-                            outfile.write("<tr><" + tdtr + " width=35%> <A href=https://www.virustotal.com/#/search/" + csvrow[0] + ">" + PreIOC2 + csvrow[0] + PostIOC2 + "</a> </" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + PreIOC2 + csvrow[1] + PostIOC2 + " </" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + PreIOC2 + csvrow[2] + PostIOC2 + " </" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%> " + PreIOC2 + csvrow[3] + PostIOC2 + " </" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=35%> <A href=https://www.virustotal.com/#/search/" + csvrow[4] + ">" + PreIOC2 + csvrow[4] + PostIOC2 + "</a> </" + tdtr + "></tr>\n")
+                            # Is it in our IOC List? (The Table Highlights the Hits)
+                            RptTable.Add((ReportTable.VTLink(csvrow[0]), csvrow[1], csvrow[2], csvrow[3], ReportTable.VTLink(csvrow[4])), ' '.join(map(str, csvrow)))
 
                             # Write out Domain for Bulk Lookup 
                             domfileall.write(csvrow[0].strip() + "\n")
@@ -3781,7 +3475,7 @@ def main():
 
                         reccount = reccount + 1
 
-            outfile.write("</tbody></table>\n")
+            RptTable.Close()
 
             if reccount < 2:
                 outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
@@ -3813,6 +3507,7 @@ def main():
 
         reccount = 0
         filname = os.path.join(dirtrge, "RBin.dat")
+        ToolDAG.Wait("RBin")
 
         if os.path.isfile(filname): 
             outfile.write("<p><i><font color=firebrick>In this section, AChoir has parsed the Recycle Bin\n")
@@ -3828,37 +3523,26 @@ def main():
             innfile = open(filname, encoding='utf8', errors="replace")
             for innline in innfile:
                 # Is it in our IOC List?
-                IOCGotHit = 0 
-                for IOCIndx, AnyIOC in enumerate(IOCList):
-                    if AnyIOC in innline.lower():
-                        IOCount[IOCIndx] += 1
-                        IOCGotHit = 1
-
-                if IOCGotHit == 1:
-                    PreIOC = " <b><font color=red>"
-                    PostIOC = "</font></b> "
-                else: 
-                    PreIOC = " "
-                    PostIOC = " "
+                IOCGotHit = IOCMatch.Check(innline)
 
                 if innline.startswith("Source file: "):
                     outfile.write("<tr><td style=\"text-align: left\">\n")
-                    outfile.write("<b>" + PreIOC + innline.strip() + PostIOC + "</b><br>\n")
+                    outfile.write("<b>" + ReportTable.Highlight(innline.strip(), IOCGotHit) + "</b><br>\n")
                     reccount = reccount + 1
 
                 elif innline.startswith("Version: "):
-                    outfile.write(PreIOC + innline.strip() + PostIOC + "<br>\n")
+                    outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "<br>\n")
 
                 elif innline.startswith("File size: "):
-                    outfile.write(PreIOC + innline.strip() + PostIOC + "<br>\n")
+                    outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "<br>\n")
 
                 elif innline.startswith("File name: "):
-                    outfile.write(PreIOC + innline.strip() + PostIOC + "<br>\n")
+                    outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "<br>\n")
 
                 elif innline.startswith("Deleted on:"):
-                    outfile.write(PreIOC + innline.strip() + PostIOC + "</td></tr>\n")
+                    outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "</td></tr>\n")
 
-            outfile.write(PreIOC + innline.strip() + PostIOC + "</table>\n")
+            outfile.write(ReportTable.Highlight(innline.strip(), IOCGotHit) + "</table>\n")
 
             innfile.close()
             os.remove(filname)
@@ -3940,50 +3624,19 @@ def main():
 
                     if SBName.endswith(".csv"):
                         outfile.write("<p><i><font color=firebrick>Processing: " + SBName + " </font></i></p>\n")
-                        outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
+                        RptTable = ReportTable.ReportTable(outfile, ("11%", "50%", "13%", "13%", "13%"), IOCMatch, HeadRow=1)
 
                         reccount = 0
                         with open(os.path.join(dirtrge, "ShellBags", SBName), 'r', encoding='utf8', errors="replace") as csvfile:
                             csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
                             for csvrow in csvread:
                                 if len(csvrow) > 3:
-                                    if reccount == 0:
-                                        tdtr = "th"
-                                    else:
-                                        tdtr = "td"
-
-                                    # Is it in our IOC List?
-                                    RowString = ' '.join(map(str, csvrow))
-
-                                    IOCGotHit = 0 
-                                    for IOCIndx, AnyIOC in enumerate(IOCList):
-                                        if AnyIOC in RowString.lower():
-                                            IOCount[IOCIndx] += 1
-                                            IOCGotHit = 1
-
-                                    if IOCGotHit == 1:
-                                        PreIOC = " <b><font color=red>"
-                                        PostIOC = "</font></b> "
-                                    else: 
-                                        PreIOC = " "
-                                        PostIOC = " "
-
-                                    if reccount == 0:
-                                        outfile.write("<thead>\n")
-                                        PostIOC += " (+/-)"
-
-                                    outfile.write("<tr><" + tdtr + " width=11%>" + PreIOC + csvrow[5] + "</" + tdtr + ">\n")
-                                    outfile.write("<" + tdtr + " width=50%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                                    outfile.write("<" + tdtr + " width=13%>" + PreIOC + csvrow[15] + PostIOC + "</" + tdtr + ">\n")
-                                    outfile.write("<" + tdtr + " width=13%>" + PreIOC + csvrow[16] + PostIOC + "</" + tdtr + ">\n")
-                                    outfile.write("<" + tdtr + " width=13%>" + PreIOC + csvrow[11] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                                    if reccount == 0:
-                                        outfile.write("</thead><tbody>\n")
+                                    # Is it in our IOC List? (The Table Highlights the Hits)
+                                    RptTable.Add((csvrow[5], csvrow[4], csvrow[15], csvrow[16], csvrow[11]), ' '.join(map(str, csvrow)))
 
                                     reccount = reccount + 1
 
-                        outfile.write("</tbody></table>\n")
+                        RptTable.Close()
                         os.remove(os.path.join(dirtrge, "ShellBags", SBName))
 
                         if reccount < 2:
@@ -4047,8 +3700,26 @@ def main():
             ChSwSubDir = ""
 
             EvtName = os.path.join(dirname, EvtDir1[1:])
-            cmdexec = os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt --skip-errors --timezone UTC --full --csv --output " + os.path.join(dirtrge, "ChainCSV") + " --mapping " +  os.path.join(dirleft, "chainsaw", "mappings", "sigma-event-logs-all.yml") + " --rule " + os.path.join(dirleft, "chainsaw", "rules") + " --sigma " + os.path.join(dirleft, "chainsaw", "sigma") + " " + EvtName
-            returned_value = os.system(cmdexec)
+            ChSwArgs = " --mapping " +  os.path.join(dirleft, "chainsaw", "mappings", "sigma-event-logs-all.yml") + " --rule " + os.path.join(dirleft, "chainsaw", "rules") + " --sigma " + os.path.join(dirleft, "chainsaw", "sigma")
+
+            if EvtShrd > 1:
+                ###########################################################################
+                # Sharded: One Chainsaw per Shard (EvtShrd at a time), and the Shard CSVs #
+                #  are Merged into ChainCSV - The same place a single run writes them     #
+                ###########################################################################
+                if len(ShardDirs) == 0:
+                    ShardDirs = ToolShard.BuildShards(ToolShard.ShardPlan(EvtName, EvtShrd), ShardWork)
+
+                print("[+] Running Chainsaw over " + str(len(ShardDirs)) + " Event Log Shards...")
+                CmdLines = []
+                for ShardDir in ShardDirs:
+                    CmdLines.append(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt --skip-errors --timezone UTC --full --csv --output " + os.path.join(ShardDir, "Chainsaw") + ChSwArgs + " " + os.path.join(ShardDir, ToolShard.ShardEvtx))
+                ToolShard.RunShards(CmdLines, EvtShrd)
+                ToolShard.MergeCSVs(ShardDirs, "Chainsaw", EvtName, os.path.join(dirtrge, "ChainCSV"))
+
+            else:
+                cmdexec = os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt --skip-errors --timezone UTC --full --csv --output " + os.path.join(dirtrge, "ChainCSV") + ChSwArgs + " " + EvtName
+                returned_value = os.system(cmdexec)
 
             outfile.write("<a name=ChainSaw></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id28\" type=\"checkbox\" checked>\n")
@@ -4064,715 +3735,29 @@ def main():
 
 
             ###########################################################################
-            # Chainsaw: Log Tampering                                                 #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "log_tampering.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Log Tampering:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 3:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: Account Tampering                                             #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "account_tampering.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Account Tampering:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 3:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=15%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=15%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: Login Attacks                                                 #
+            # Chainsaw: Every Detection CSV (Detections.ChainsawTables) - Found in    #
+            #  one Directory Scan, and Rendered by the same Table Driven Renderer     #
             ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "login_attacks.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Login Attacks:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 3:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
+            ChFound = Detections.ScanCSVs(dirtrge, Detections.TableFiles(Detections.ChainsawTables) + Detections.ChainsawDelete, ("ArtCache", "ShellBags", "ToolShard"))
 
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
+            for ChTable in Detections.ChainsawTables:
+                for ChName in ChFound.get(ChTable[0], []):
+                    Detections.RenderCSV(outfile, ChName, ChTable, IOCMatch, CSVPool)
+                    os.remove(ChName)
 
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=40%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: Antivirus Detections                                          #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "antivirus.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Antivirus Detections:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=5%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[9] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-
-            ###########################################################################
-            # Chainsaw: Lateral Movement                                              #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "lateral_movement.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Lateral Movement Detections:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=5%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: Log Tampering (v1.45)                                         #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "log_tampering.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Log Tampering:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: Powershell Script (v1.45)                                     #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "powershell_script.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Powershell Script:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=30%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-            ###########################################################################
-            # Chainsaw: RDP Attacks (v1.45)                                           #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "rdp_attacks.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>RDP Attacks:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=15%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[9] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-
-            ###########################################################################
-            # Chainsaw: RDP Events (v1.45)                                            #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "rdp_events.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>RDP Events:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-
-            ###########################################################################
-            # Chainsaw: Service Installation (v1.45)                                  #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "service_installation.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Service Installation:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 5:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[0] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[6] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " valign=top width=10%>" + PreIOC + csvrow[9] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
-
-
-
-            ###########################################################################
-            # Chainsaw: Sigma Detections                                              #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "sigma.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>Sigma Rule(s) Detections:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 3:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            ###########################################################################
-                            # Sigma Rules - Sanity check detection start                              #
-                            ###########################################################################
-                            if "defender" in csvrow[1].lower() and "defender" not in csvrow[3].lower():
-                                continue
-
-                            if "sysmon" in csvrow[1].lower() and "sysmon" not in csvrow[3].lower():
-                                continue
-
-                            if "file was not allowed to run" in csvrow[1].lower() and "applocker" not in csvrow[3].lower():
-                                continue
-
-                            ###########################################################################
-                            # Sigma Rules - Sanity check detection end                                #
-                            ###########################################################################
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=10%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                            outfile.write("<" + tdtr + " width=30%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                            if reccount == 0:
-                                outfile.write("</thead><tbody>\n")
-
-                            reccount = reccount + 1
-
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
-
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
+                    if ChSwSubDir == "":
+                        ChSwSubDir = os.path.split(ChName)[0]
 
             outfile.write("</div>\n")
+            Detections.SigmaSupp.Report()
 
 
             ###########################################################################
             # Chainsaw: Just Delete These                                              #
             ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "microsoft_rds_events_-_user_profile_disk.csv"), recursive=True):
-                os.remove(ChName)
+            for ChDelete in Detections.ChainsawDelete:
+                for ChName in ChFound.get(ChDelete, []):
+                    os.remove(ChName)
 
 
 
@@ -4780,12 +3765,12 @@ def main():
             # Chainsaw: See if we have any Unprocessed Files                          #
             ###########################################################################
             reccount = 0
-            ChSwLeftOvers = os.path.join(ChSwSubDir, "**", "*.csv")
 
             if ChSwSubDir != "":
-                for ChName in glob.glob(ChSwLeftOvers, recursive=True):
-                    print("[!] Unprocessed F-Secure Countercept Chainsaw File: " + ChName)
-                    reccount = reccount + 1
+                for ChNames in Detections.ScanCSVs(ChSwSubDir).values():
+                    for ChName in ChNames:
+                        print("[!] Unprocessed F-Secure Countercept Chainsaw File: " + ChName)
+                        reccount = reccount + 1
 
             if reccount == 0:
                 print("[+] No Unprocessed Chainsaw Files. Deleting ChainSaw Directory: " + ChSwSubDir)
@@ -4840,11 +3825,28 @@ def main():
             print("[+] Hayabusa executable found")
             print("[+] Running Hayabusa against all Event Logs...")
 
-            ChSwSubDir = ""
             EvtName = os.path.join(dirname, EvtDir1[1:])
-            returned_value = os.system("mkdir " + os.path.join(dirtrge, "Hayabusa"))
-            cmdexec = os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + EvtName + " -o " + os.path.join(dirtrge, "Hayabusa", "Hayabusa.csv")
-            returned_value = os.system(cmdexec)
+
+            if EvtShrd > 1:
+                ###########################################################################
+                # Sharded: One Hayabusa per Shard (EvtShrd at a time), and the Shard CSVs #
+                #  are Merged into the Hayabusa Directory                                 #
+                ###########################################################################
+                if len(ShardDirs) == 0:
+                    ShardDirs = ToolShard.BuildShards(ToolShard.ShardPlan(EvtName, EvtShrd), ShardWork)
+
+                print("[+] Running Hayabusa over " + str(len(ShardDirs)) + " Event Log Shards...")
+                CmdLines = []
+                for ShardDir in ShardDirs:
+                    os.makedirs(os.path.join(ShardDir, "Hayabusa"), exist_ok=True)
+                    CmdLines.append(os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + os.path.join(ShardDir, ToolShard.ShardEvtx) + " -o " + os.path.join(ShardDir, "Hayabusa", "Hayabusa.csv"))
+                ToolShard.RunShards(CmdLines, EvtShrd)
+                ToolShard.MergeCSVs(ShardDirs, "Hayabusa", EvtName, os.path.join(dirtrge, "Hayabusa"))
+
+            else:
+                returned_value = os.system("mkdir " + os.path.join(dirtrge, "Hayabusa"))
+                cmdexec = os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + EvtName + " -o " + os.path.join(dirtrge, "Hayabusa", "Hayabusa.csv")
+                returned_value = os.system(cmdexec)
 
             outfile.write("<a name=Hayabusa></a>\n")
             outfile.write("<input class=\"collapse\" id=\"id36\" type=\"checkbox\" checked>\n")
@@ -4862,66 +3864,12 @@ def main():
             ###########################################################################
             # Hayabusa: High and Critical Detections                                  #
             ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "hayabusa.csv"), recursive=True):
-                outfile.write("<table class=\"sortable\" border=1 cellpadding=5 width=100%>\n")
-                outfile.write("<p><i><font color=firebrick>High and Critical Detections:</font></i></p>\n")
-
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 7:
-                            if reccount == 0:
-                                tdtr = "th"
-                            else:
-                                tdtr = "td"
-
-                            # Is it in our IOC List?
-                            RowString = ' '.join(map(str, csvrow))
-
-                            IOCGotHit = 0 
-                            for IOCIndx, AnyIOC in enumerate(IOCList):
-                                if AnyIOC in RowString.lower():
-                                    IOCount[IOCIndx] += 1
-                                    IOCGotHit = 1
-
-                            if IOCGotHit == 1:
-                                PreIOC = " <b><font color=red>"
-                                PostIOC = "</font></b> "
-                            else: 
-                                PreIOC = " "
-                                PostIOC = " "
-
-                            if reccount == 0:
-                                outfile.write("<thead>\n")
-                                PostIOC += " (+/-)"
-
-                            if csvrow[2] == "Level" or csvrow[2] == "high" or csvrow[2] == "crit":
-                                outfile.write("<tr><" + tdtr + " width=20%>" + PreIOC + csvrow[0] + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[1] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[2] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[3] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[4] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=5%>" + PreIOC + csvrow[5] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[7] + PostIOC + "</" + tdtr + ">\n")
-                                outfile.write("<" + tdtr + " width=20%>" + PreIOC + csvrow[8] + PostIOC + "</" + tdtr + "></tr>\n")
-
-                                if reccount == 0:
-                                    outfile.write("</thead><tbody>\n")
-
-                                reccount = reccount + 1
-
-                outfile.write("</tbody></table>\n")
-                os.remove(ChName)
-
-                if ChSwSubDir == "":
-                    Path_File = os.path.split(ChName)
-                    ChSwSubDir = Path_File[0]
+            HyFound = Detections.ScanCSVs(os.path.join(dirtrge, "Hayabusa"), Detections.TableFiles(Detections.HayabusaTables))
 
-                if reccount < 2:
-                    outfile.write("<p><b><font color = red> No Data Found! </font></b></p>\n")
-                else:
-                    outfile.write("<p>Records Found: " + str(reccount) + "</p><hr>\n")
+            for HyTable in Detections.HayabusaTables:
+                for ChName in HyFound.get(HyTable[0], []):
+                    Detections.RenderCSV(outfile, ChName, HyTable, IOCMatch, CSVPool)
+                    os.remove(ChName)
 
             outfile.write("</div>\n")
             shutil.rmtree(os.path.join(dirtrge, "Hayabusa"), ignore_errors=False, onerror=None)
@@ -4932,6 +3880,9 @@ def main():
     else:
         print("[!] Bypassing Hayabusa Processing...")
 
+    if os.path.isdir(ShardWork):
+        shutil.rmtree(ShardWork, ignore_errors=True)
+
 
     ###########################################################################
     # Write Uniq IP and Hash Files                                            #
@@ -4964,14 +3915,12 @@ def main():
             for ipsline in ipsfileall:
                 if ipsline != "\n" and ipsline != "0.0.0.0\n" and ipsline != "::\n" and ipsline not in ipsset:
                     # Is it in our IOC List?
-                    if any(AnyIOC in ipsline.lower() for AnyIOC in IOCList):
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
+                    if len(IOCMatch.Hits(ipsline)) > 0:
+                        IOCGotHit = 1
+                    else:
+                        IOCGotHit = 0
 
-                    outfile.write(PreIOC + ipsline + PostIOC + "<br>")
+                    outfile.write(ReportTable.Highlight(ipsline, IOCGotHit) + "<br>")
 
                     ipsset.add(ipsline)
                     reccount = reccount + 1
@@ -5016,14 +3965,12 @@ def main():
             for hshline in hshfileall:
                 if hshline != "\n" and hshline != "MD5\n" and hshline not in hshset:
                     # Is it in our IOC List?
-                    if any(AnyIOC in hshline.lower() for AnyIOC in IOCList):
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
+                    if len(IOCMatch.Hits(hshline)) > 0:
+                        IOCGotHit = 1
+                    else:
+                        IOCGotHit = 0
 
-                    outfile.write(PreIOC + hshline + PostIOC + "<br>")
+                    outfile.write(ReportTable.Highlight(hshline, IOCGotHit) + "<br>")
 
                     hshset.add(hshline)
                     reccount = reccount + 1
@@ -5068,14 +4015,12 @@ def main():
             for domline in domfileall:
                 if domline != "\n" and domline != "MD5\n" and domline not in domset:
                     # Is it in our IOC List?
-                    if any(AnyIOC in domline.lower() for AnyIOC in IOCList):
-                        PreIOC = " <b><font color=red>"
-                        PostIOC = "</font></b> "
-                    else: 
-                        PreIOC = " "
-                        PostIOC = " "
+                    if len(IOCMatch.Hits(domline)) > 0:
+                        IOCGotHit = 1
+                    else:
+                        IOCGotHit = 0
 
-                    outfile.write(PreIOC + domline + PostIOC + "<br>")
+                    outfile.write(ReportTable.Highlight(domline, IOCGotHit) + "<br>")
 
                     domset.add(domline)
                     reccount = reccount + 1
@@ -5145,6 +4090,7 @@ def main():
     outfile.write("</body></html>\n")
     outfile.close() 
 
+    ToolDAG.Close()
     print("[+] AChoir Report Processing Complete!\n")
 
 
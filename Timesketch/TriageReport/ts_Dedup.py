@@ -0,0 +1,181 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Event Level Dedup for the ts_*.csv Timelines                      #
+#    The same Event shows up more than once (Browser History Rows     #
+#    repeat across Profiles, $MFT and Tool Rows overlap) - A Row      #
+#    whose 64 Bit Fingerprint of (datetime, Normalized message,       #
+#    data_type) was already seen, in any ts File, is Dropped.         #
+#                                                                     #
+#   Fingerprints are kept in a Compact Hash Set (8 Bytes a Slot) or,  #
+#    for very large Timelines, a Bloom Filter (A few Bytes a Row - A  #
+#    False Positive, BloomErr, drops a Row that was not a Duplicate)  #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#######################################################################
+import os
+import csv
+import math
+import array
+import hashlib
+import CSVChunk
+import TimeNorm
+
+
+BloomRows = 8000000
+BloomErr = 0.000001
+
+
+###########################################################################
+# 64 Bit Fingerprint - Dates through TimeNorm, Messages Lowercased with   #
+#  the Whitespace Collapsed                                               #
+###########################################################################
+def Fingerprint(RowTime, Message, DataType):
+    FingerKey = TimeNorm.ZoneTime(RowTime) + "\x1f" + " ".join(Message.lower().split()) + "\x1f" + DataType
+    return int.from_bytes(hashlib.blake2b(FingerKey.encode("utf8", errors="replace"), digest_size=8).digest(), "little")
+
+
+###########################################################################
+# Compact Hash Set - Open Addressing (Linear Probe) in an array of 64 Bit #
+#  Slots, Doubled at half full.  Slot 0 means Empty (A 0 Fingerprint is   #
+#  stored as 1)                                                           #
+###########################################################################
+class FingerSet:
+    def __init__(self, Capacity=1024):
+        SlotCount = 1024
+        while SlotCount < Capacity * 2:
+            SlotCount *= 2
+        self.Slots = array.array('Q', bytes(8 * SlotCount))
+        self.Mask = SlotCount - 1
+        self.Count = 0
+
+    def Add(self, Finger):
+        # True if the Fingerprint is New
+        Finger = Finger or 1
+        Slots = self.Slots
+        SlotIndx = Finger & self.Mask
+        while True:
+            SlotVal = Slots[SlotIndx]
+            if SlotVal == 0:
+                break
+            if SlotVal == Finger:
+                return False
+            SlotIndx = (SlotIndx + 1) & self.Mask
+
+        Slots[SlotIndx] = Finger
+        self.Count += 1
+        if self.Count * 2 > len(Slots):
+            self.Grow()
+        return True
+
+    def Grow(self):
+        OldSlots = self.Slots
+        self.Slots = array.array('Q', bytes(16 * len(OldSlots)))
+        self.Mask = len(self.Slots) - 1
+        for Finger in OldSlots:
+            if Finger != 0:
+                SlotIndx = Finger & self.Mask
+                while self.Slots[SlotIndx] != 0:
+                    SlotIndx = (SlotIndx + 1) & self.Mask
+                self.Slots[SlotIndx] = Finger
+
+    def Bytes(self):
+        return len(self.Slots) * 8
+
+
+###########################################################################
+# Bloom Filter sized for Capacity Rows at ErrRate - The Bit Positions are #
+#  two Halves of the Fingerprint (Double Hashing)                         #
+###########################################################################
+class FingerBloom:
+    def __init__(self, Capacity, ErrRate=BloomErr):
+        Capacity = max(Capacity, 1024)
+        self.BitCount = int(-Capacity * math.log(ErrRate) / (math.log(2) ** 2)) | 7
+        self.HashCount = max(1, round(self.BitCount / Capacity * math.log(2)))
+        self.Bits = bytearray((self.BitCount + 7) // 8)
+        self.Count = 0
+
+    def Add(self, Finger):
+        # True if the Fingerprint is (Probably) New
+        Bits = self.Bits
+        HashOne = Finger & 0xFFFFFFFF
+        HashTwo = (Finger >> 32) | 1
+        IsNew = False
+        for HashNum in range(self.HashCount):
+            BitIndx = (HashOne + HashNum * HashTwo) % self.BitCount
+            BitMask = 1 << (BitIndx & 7)
+            if not Bits[BitIndx >> 3] & BitMask:
+                Bits[BitIndx >> 3] |= BitMask
+                IsNew = True
+
+        if IsNew:
+            self.Count += 1
+        return IsNew
+
+    def Bytes(self):
+        return len(self.Bits)
+
+
+###########################################################################
+# The Fingerprint Table for about TotalRows Rows - Mode is Set, Bloom, or #
+#  Auto (A Bloom Filter above BloomRows Rows)                             #
+###########################################################################
+def FingerTable(Mode, TotalRows):
+    if Mode.upper() == "BLOOM" or (Mode.upper() != "SET" and TotalRows > BloomRows):
+        print("[+] Dedup Fingerprints: Bloom Filter (" + str(TotalRows) + " Rows)")
+        return FingerBloom(TotalRows)
+
+    print("[+] Dedup Fingerprints: Hash Set")
+    return FingerSet(TotalRows)
+
+
+###########################################################################
+# Dedup one ts File in place - Returns (Rows Kept, Duplicates Dropped).   #
+#  Files without a datetime or message Column are left as they are, and   #
+#  NoData Rows are always Kept.  Bulk (BulkSink.BulkWriter) gets the Rows #
+#  that are Kept, and is Closed here                                      #
+###########################################################################
+def DedupCSV(CSVName, Fingers, Bulk=None):
+    RowsKept = RowsDrop = 0
+    TempName = CSVName + ".dedup"
+
+    CSVRows = CSVChunk.ReadCSV(CSVName)
+    HeadRow = next(CSVRows, None)
+    if HeadRow is None or "datetime" not in HeadRow or "message" not in HeadRow:
+        print("[!] No datetime/message Columns, Not Deduped: " + os.path.basename(CSVName))
+        if Bulk is not None:
+            Bulk.Close()
+        return 0, 0
+
+    TimeCol = HeadRow.index("datetime")
+    MesgCol = HeadRow.index("message")
+    TypeCol = HeadRow.index("data_type") if "data_type" in HeadRow else None
+    MinCols = max(Col for Col in (TimeCol, MesgCol, TypeCol) if Col is not None)
+
+    if Bulk is not None:
+        Bulk.Head(HeadRow)
+
+    with open(TempName, "w", encoding='utf8', errors="replace", newline='') as csvoutf:
+        csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL)
+        csvwrite.writerow(HeadRow)
+
+        for csvrow in CSVRows:
+            if len(csvrow) > MinCols:
+                DataType = csvrow[TypeCol] if TypeCol is not None else ""
+                if not DataType.startswith("NoData") and not Fingers.Add(Fingerprint(csvrow[TimeCol], csvrow[MesgCol], DataType)):
+                    RowsDrop += 1
+                    continue
+
+            csvwrite.writerow(csvrow)
+            if Bulk is not None:
+                Bulk.Add(csvrow)
+            RowsKept += 1
+
+    CSVRows.close()
+    os.replace(TempName, CSVName)
+    if Bulk is not None:
+        Bulk.Close()
+
+    return RowsKept, RowsDrop
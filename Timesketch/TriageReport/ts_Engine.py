@@ -0,0 +1,260 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Declarative Transform Engine for ts_Transform                     #
+#    Each Artifact (Prefetch, AutoRuns, LNK, LastActivity, Browser    #
+#    History and Downloads, SRUM, Chainsaw) is one Spec: the Output   #
+#    Columns, each with its Header and its Value.  Every Spec is      #
+#    written by the same streaming Engine, on csv.writer (QUOTE_ALL)  #
+#    - The Field Values pass through intact (Commas and Quotes are    #
+#    Quoted, not rewritten) and no Row is built by concatenation.     #
+#                                                                     #
+#   Column Header: int - That Column of the Input Header Row          #
+#                  str - A Literal Name                               #
+#   Column Value:  int - That Column of the Row                       #
+#                  str - A Constant                                   #
+#                  Function - Called with the Row (IsoTime, Joined)   #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Dates go through TimeNorm (Slicing Parsers with a Memo)   #
+#           instead of strptime - Every Date Column, Blank and Bad    #
+#           Dates are NoDataTime                                      #
+#   v0.03 - Bulk= (BulkSink.BulkWriter) gets the same Rows as the CSV #
+#   v0.04 - DataRow is Compiled per Spec, and the Header Row is read  #
+#           before the Row Loop (Not Checked on every Row)            #
+#######################################################################
+import csv
+import operator
+import CSVChunk
+import Detections
+import TimeNorm
+
+
+NoDataTime = TimeNorm.NoDataTime
+
+
+###########################################################################
+# Value Functions                                                         #
+###########################################################################
+def IsoTime(ColIndx, TimeParse):
+    # Tool Date to ISO 8601 (TimeParse is a TimeNorm Parser) - Blank or Bad Dates are NoDataTime
+    return lambda csvrow: TimeParse(csvrow[ColIndx])
+
+
+def Joined(*Parts):
+    # int Parts are Columns, str Parts are Literal Text
+    PartCols = [Part for Part in Parts if isinstance(Part, int)]
+    PartFmt = "".join("{" + str(PartCols.index(Part)) + "}" if isinstance(Part, int) else Part.replace("{", "{{").replace("}", "}}") for Part in Parts)
+    PartGet = operator.itemgetter(*PartCols)
+    if len(PartCols) == 1:
+        return lambda csvrow: PartFmt.format(PartGet(csvrow))
+    return lambda csvrow: PartFmt.format(*PartGet(csvrow))
+
+
+###########################################################################
+# Transform Spec: (Header, Value) per Output Column                       #
+#  InHead   - The Input starts with a Header Row (Used for the int        #
+#             Headers, never written as Data)                             #
+#  MinCols  - Rows must have more Columns than this (Raised to the        #
+#             highest Column the Spec reads, so a short Row is skipped)   #
+#  RowCheck - Return False to leave the Row out                           #
+#                                                                         #
+#  The Spec is compiled once into a Pick (operator.itemgetter) over the   #
+#   Row + the Function Values + the Constants, so an Output Row is one C  #
+#   call - Functions and Constants are at the end (Negative Indexes).     #
+#   DataRow is Compiled the same way: Most Specs have one Function (The   #
+#   datetime) or none, so no Function list is built for them              #
+###########################################################################
+class TransformSpec:
+    def __init__(self, Name, Columns, InHead=True, MinCols=0, RowCheck=None):
+        self.Name = Name
+        self.Columns = Columns
+        self.InHead = InHead
+        self.RowCheck = RowCheck
+
+        self.Funcs = [Value for Head, Value in Columns if not isinstance(Value, (int, str))]
+        self.Consts = [Value for Head, Value in Columns if isinstance(Value, str)]
+
+        MaxCol = MinCols
+        PickCols = []
+        FuncIndx = -(len(self.Funcs) + len(self.Consts))
+        ConstIndx = -len(self.Consts)
+        for Head, Value in Columns:
+            if isinstance(Value, int):
+                PickCols.append(Value)
+                MaxCol = max(MaxCol, Value)
+            elif isinstance(Value, str):
+                PickCols.append(ConstIndx)
+                ConstIndx += 1
+            else:
+                PickCols.append(FuncIndx)
+                FuncIndx += 1
+            if isinstance(Head, int):
+                MaxCol = max(MaxCol, Head)
+
+        self.MinCols = MaxCol
+        self.Pick = operator.itemgetter(*PickCols) if len(PickCols) > 1 else (lambda ExtRow: (ExtRow[PickCols[0]],))
+
+        Pick = self.Pick
+        Funcs = self.Funcs
+        Consts = self.Consts
+        if len(Funcs) == 0:
+            self.DataRow = lambda csvrow: Pick(csvrow + Consts)
+        elif len(Funcs) == 1:
+            FuncOne = Funcs[0]
+            self.DataRow = lambda csvrow: Pick(csvrow + [FuncOne(csvrow)] + Consts)
+        else:
+            self.DataRow = lambda csvrow: Pick(csvrow + [Func(csvrow) for Func in Funcs] + Consts)
+
+    def HeadRow(self, csvrow):
+        return [csvrow[Head] if isinstance(Head, int) else Head for Head, Value in self.Columns]
+
+    ###########################################################################
+    # The Row written when there is No Data: Literal datetime, message, and   #
+    #  data_type Columns are marked, the rest are NoData                      #
+    ###########################################################################
+    def NoDataRow(self):
+        NoData = {"datetime": NoDataTime, "message": "No Data Parsed From Input", "data_type": "NoData:Input"}
+        return [NoData.get(Head, "NoData") if isinstance(Head, str) else "NoData" for Head, Value in self.Columns]
+
+
+###########################################################################
+# Stream the Input Rows (One or more Sources) through the Spec into       #
+#  FilNout.  Only the first Header Row is written.  Returns the count of  #
+#  Data Rows written (Not the Header, or the NoData Row)                  #
+#                                                                         #
+#  Rows are written as csv.writer (QUOTE_ALL) writes them - A Row with no #
+#   Quote (") in any Value is joined directly, a Row with one goes to the #
+#   csv.writer to be escaped                                              #
+#                                                                         #
+#  Bulk - A BulkSink.BulkWriter that gets the Header and every Row too    #
+#   (OpenSearch _bulk Batches) - It is Closed here                        #
+###########################################################################
+def WriteCSV(FilNout, ArtSpec, *RowSources, Bulk=None):
+    reccount = 0
+    HeadDone = not ArtSpec.InHead
+    MinCols = ArtSpec.MinCols
+    RowCheck = ArtSpec.RowCheck
+    DataRow = ArtSpec.DataRow
+    QuoteCount = 2 * len(ArtSpec.Columns)
+    JoinCells = '","'.join
+
+    with open(FilNout, "w", encoding='utf8', errors="replace", newline='') as csvoutf:
+        csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL, lineterminator="\n")
+        WriteLine = csvoutf.write
+
+        if not ArtSpec.InHead:
+            csvwrite.writerow([Head for Head, Value in ArtSpec.Columns])
+            if Bulk is not None:
+                Bulk.Head([Head for Head, Value in ArtSpec.Columns])
+
+        for ArtRows in RowSources:
+            ArtRows = iter(ArtRows)
+            if ArtSpec.InHead:
+                # Each Source starts with its own Header Row
+                for csvrow in ArtRows:
+                    if len(csvrow) > MinCols:
+                        if not HeadDone:
+                            csvwrite.writerow(ArtSpec.HeadRow(csvrow))
+                            if Bulk is not None:
+                                Bulk.Head(ArtSpec.HeadRow(csvrow))
+                            HeadDone = True
+                        break
+
+            for csvrow in ArtRows:
+                if len(csvrow) <= MinCols or (RowCheck is not None and not RowCheck(csvrow)):
+                    continue
+
+                Cells = DataRow(csvrow)
+                RowLine = '"' + JoinCells(Cells) + '"\n'
+                if RowLine.count('"') == QuoteCount:
+                    WriteLine(RowLine)
+                else:
+                    csvwrite.writerow(Cells)
+                if Bulk is not None:
+                    Bulk.Add(Cells)
+                reccount = reccount + 1
+
+        if reccount < 1:
+            print("[!] No Records Processed: " + ArtSpec.Name)
+            csvwrite.writerow(ArtSpec.NoDataRow())
+            if Bulk is not None:
+                if not HeadDone:
+                    Bulk.Head([Head if isinstance(Head, str) else "column_" + str(Head) for Head, Value in ArtSpec.Columns])
+                Bulk.Add(ArtSpec.NoDataRow())
+        else:
+            print("[+] Records Processed: " + str(reccount))
+
+    if Bulk is not None:
+        Bulk.Close()
+
+    return reccount
+
+
+def ReadRows(FilName, Workers=0):
+    return CSVChunk.ReadCSV(FilName, Workers=Workers)
+
+
+###########################################################################
+# Artifact Specs (Tool Column Layouts as parsed by ts_Transform)          #
+###########################################################################
+def Passed(*ColIndxs):
+    # Columns that pass through, Header and Value from the same Input Column
+    return tuple((ColIndx, ColIndx) for ColIndx in ColIndxs)
+
+
+PrefetchSpec = TransformSpec("Prefetch", (
+    ("filename", 0), ("created_time", 1), ("modified_time", 2), ("file_size", 3), ("Process_exe", 4),
+    ("process_path", 5), ("run_count", 6), ("last_run", 7), ("missing_process", 8),
+    ("message", Joined(0, " - ", 5)), ("datetime", IsoTime(2, TimeNorm.NirsoftTime)),
+    ("timestamp_desc", "prefetch_lastmod"), ("data_type", "prefetch:lastmod")), InHead=False)
+
+AutoRunSpec = TransformSpec("AutoRuns",
+    (("datetime", IsoTime(0, TimeNorm.NirsoftTime)),) + Passed(1, 2, 3, 4, 5) +
+    (("message", Joined(6, " - ", 10)),) + Passed(7, 8, 9, 10, 11, 12, 13, 14, 15, 16) +
+    (("timestamp_desc", "autorun_date"), ("data_type", "autoruns:autorun")))
+
+LnkFileSpec = TransformSpec("LNK Files",
+    (("message", 0),) + Passed(*range(26)) +
+    (("datetime", IsoTime(2, TimeNorm.ZoneTime)), ("timestamp_desc", "LNKFileMod"), ("data_type", "LinkFile:Modified")))
+
+
+def LastActMessage(csvrow):
+    if len(csvrow[4]) < 1:
+        return csvrow[1] + " - Path: " + csvrow[3]
+    return csvrow[1] + " - Path: " + csvrow[3] + " - MoreInfo: " + csvrow[4]
+
+
+LastActSpec = TransformSpec("LastActivityView",
+    (("datetime", IsoTime(0, TimeNorm.NirsoftTime)),) + Passed(1, 2, 3, 4, 5, 6) +
+    (("message", LastActMessage), ("timestamp_desc", "LastActivty"), ("data_type", "Activity:last")))
+
+
+def BrowseDesc(csvrow):
+    return "fileOpen" if csvrow[0].startswith("file:///") else "websiteVisit"
+
+
+def BrowseType(csvrow):
+    return "browser:file" if csvrow[0].startswith("file:///") else "browser:visit"
+
+
+BrowserSpec = TransformSpec("Browser History",
+    (("message", 0),) + Passed(*range(1, 14)) +
+    (("datetime", IsoTime(2, TimeNorm.NirsoftTime)), ("timestamp_desc", BrowseDesc), ("data_type", BrowseType)))
+
+DownlodSpec = TransformSpec("Browser Downloads",
+    ((0, 0), ("message", 1)) + Passed(*range(2, 20)) +
+    (("datetime", IsoTime(5, TimeNorm.NirsoftTime)), ("timestamp_desc", "webDownload"), ("data_type", "browser:download")))
+
+
+SrumNetSpec = TransformSpec("SrumECmd_NetworkUsages_Output.csv",
+    ((0, 0), ("datetime", IsoTime(1, TimeNorm.ZoneTime)), ("message", Joined(2, " - Bytes In: ", 10, " - Bytes Out: ", 11))) + Passed(*range(3, 17)) +
+    (("timestamp_desc", "srumnetusage"), ("data_type", "srum:netusage")))
+
+
+# Chainsaw v2.9 sigma.csv - Rows go through the Sigma Suppression Table
+ChainsawSpec = TransformSpec("Chainsaw Sigma",
+    (("datetime", IsoTime(0, TimeNorm.ZoneTime)), ("message", 1)) + Passed(2, 3, 4, 5, 6, 7, 8) +
+    (("timestamp_desc", "chainsaw_sigma"), ("data_type", "chainsaw:sigma")), RowCheck=Detections.SigmaSupp.Keep)
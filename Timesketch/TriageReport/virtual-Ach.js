@@ -0,0 +1,164 @@
+/*
+ * Virtual Tables for TriageReport (RptMode:Virtual)
+ *  Each large Report Table is a JS Data File that calls AchVirt.Load() with
+ *  its Rows as Arrays: [Hit, Cell, Cell...] - Hit is 1 for an IOC Hit, +2
+ *  for a Span (Colspan) Row.  Only the Rows in view are in the page, and
+ *  Sort (Click a Header) and Filter run over the Arrays in memory.
+ */
+var AchVirt = (function () {
+  var PreIOC = " <b><font color=red>", PostIOC = "</font></b> ";
+  var OverScan = 20;
+
+  function StripTags(CellHTML) {
+    return String(CellHTML).replace(/<[^>]*>/g, "").replace(/&nbsp;/g, " ").trim();
+  }
+
+  function SortKey(VTbl, RowIndx, ColIndx) {
+    var Keys = VTbl.Keys[ColIndx];
+    if (!Keys) {
+      Keys = VTbl.Keys[ColIndx] = new Array(VTbl.Rows.length);
+    }
+    if (Keys[RowIndx] === undefined) {
+      var Row = VTbl.Rows[RowIndx];
+      Keys[RowIndx] = (Row[0] & 2) ? "" : StripTags(Row[ColIndx + 1] == null ? "" : Row[ColIndx + 1]);
+    }
+    return Keys[RowIndx];
+  }
+
+  function RowText(VTbl, RowIndx) {
+    if (VTbl.Text[RowIndx] === undefined) {
+      VTbl.Text[RowIndx] = StripTags(VTbl.Rows[RowIndx].slice(1).join(" ")).toLowerCase();
+    }
+    return VTbl.Text[RowIndx];
+  }
+
+  function RowHTML(VTbl, Row) {
+    var Pre = (Row[0] & 1) ? PreIOC : " ", Post = (Row[0] & 1) ? PostIOC : " ";
+    if (Row[0] & 2) {
+      return "<tr><td Colspan=\"" + VTbl.Opts.Attrs.length + "\" style=\"text-align:left\" width=100%>" + Pre + Row[1] + Post + "</td></tr>";
+    }
+    var Cells = [];
+    for (var ColIndx = 0; ColIndx < VTbl.Opts.Attrs.length; ColIndx++) {
+      Cells.push("<td" + VTbl.Opts.Attrs[ColIndx] + ">" + Pre + (Row[ColIndx + 1] == null ? "" : Row[ColIndx + 1]) + Post + "</td>");
+    }
+    return VTbl.Opts.Row + Cells.join("\n") + "</tr>";
+  }
+
+  function Spacer(VTbl, SpaceHigh) {
+    return "<tr style=\"height:" + SpaceHigh + "px\"><td Colspan=\"" + VTbl.Opts.Attrs.length + "\" style=\"padding:0; border:0\"></td></tr>";
+  }
+
+  /* Render only the Rows in view - The Spacers stand in for the rest */
+  function Render(VTbl) {
+    var ViewLen = VTbl.View.length;
+    var First = Math.max(0, Math.floor(VTbl.Scroll.scrollTop / VTbl.RowHigh) - OverScan);
+    var Last = Math.min(ViewLen, First + Math.ceil(VTbl.Scroll.clientHeight / VTbl.RowHigh) + OverScan * 2);
+
+    var BodyHTML = [];
+    if (First > 0) {
+      BodyHTML.push(Spacer(VTbl, First * VTbl.RowHigh));
+    }
+    for (var ViewIndx = First; ViewIndx < Last; ViewIndx++) {
+      BodyHTML.push(RowHTML(VTbl, VTbl.Rows[VTbl.View[ViewIndx]]));
+    }
+    if (Last < ViewLen) {
+      BodyHTML.push(Spacer(VTbl, (ViewLen - Last) * VTbl.RowHigh));
+    }
+    VTbl.Body.innerHTML = BodyHTML.join("\n");
+
+    /* Keep the Row Height estimate close to the real (average) Row Height */
+    if (Last > First) {
+      var DrawHigh = 0;
+      var BodyRows = VTbl.Body.rows;
+      for (var BodyIndx = (First > 0 ? 1 : 0); BodyIndx < BodyRows.length - (Last < ViewLen ? 1 : 0); BodyIndx++) {
+        DrawHigh += BodyRows[BodyIndx].offsetHeight;
+      }
+      if (DrawHigh > 0) {
+        VTbl.RowHigh = Math.max(16, Math.round(DrawHigh / (Last - First)));
+      }
+    }
+    VTbl.Count.textContent = " " + ViewLen.toLocaleString() + " of " + VTbl.Rows.length.toLocaleString() + " Rows";
+  }
+
+  function Filter(VTbl) {
+    var FindText = VTbl.Find.value.trim().toLowerCase();
+    VTbl.View = [];
+    for (var RowIndx = 0; RowIndx < VTbl.Rows.length; RowIndx++) {
+      if (FindText === "" || RowText(VTbl, RowIndx).indexOf(FindText) !== -1) {
+        VTbl.View.push(RowIndx);
+      }
+    }
+    if (VTbl.SortCol !== null) {
+      Sort(VTbl);
+    }
+    VTbl.Scroll.scrollTop = 0;
+    Render(VTbl);
+  }
+
+  function Sort(VTbl) {
+    var ColIndx = VTbl.SortCol, SortDir = VTbl.SortDir;
+    VTbl.View.sort(function (RowA, RowB) {
+      var KeyA = SortKey(VTbl, RowA, ColIndx), KeyB = SortKey(VTbl, RowB, ColIndx);
+      var NumA = KeyA.replace(/,/g, ""), NumB = KeyB.replace(/,/g, "");
+      var SortVal;
+      if (NumA.length && NumB.length && !isNaN(NumA - NumB)) {
+        SortVal = NumA - NumB;
+      } else {
+        SortVal = KeyA.localeCompare(KeyB);
+      }
+      return (SortVal * SortDir) || (RowA - RowB);
+    });
+  }
+
+  function Load(TblId, Opts, Rows) {
+    var Box = document.getElementById(TblId);
+    if (!Box) {
+      return;
+    }
+
+    Box.innerHTML = "<p>Filter: <input type=\"text\" size=40><span></span></p>" +
+      "<div style=\"max-height:70vh; overflow-y:auto\">" + Opts.Table +
+      "<thead>" + Opts.Head + "</thead><tbody></tbody></table></div>";
+
+    var VTbl = {
+      Opts: Opts, Rows: Rows, View: [], Keys: [], Text: [],
+      RowHigh: 28, SortCol: null, SortDir: 1,
+      Find: Box.getElementsByTagName("input")[0],
+      Count: Box.getElementsByTagName("span")[0],
+      Scroll: Box.getElementsByTagName("div")[0],
+      Body: Box.getElementsByTagName("tbody")[0]
+    };
+
+    var FindTimer = null;
+    VTbl.Find.addEventListener("input", function () {
+      clearTimeout(FindTimer);
+      FindTimer = setTimeout(function () { Filter(VTbl); }, 250);
+    });
+
+    var ScrollWait = false;
+    VTbl.Scroll.addEventListener("scroll", function () {
+      if (!ScrollWait) {
+        ScrollWait = true;
+        requestAnimationFrame(function () { ScrollWait = false; Render(VTbl); });
+      }
+    });
+
+    Box.getElementsByTagName("thead")[0].addEventListener("click", function (ClickEvt) {
+      var HeadCell = ClickEvt.target;
+      while (HeadCell && HeadCell.nodeName !== "TH") {
+        HeadCell = HeadCell.parentNode;
+      }
+      if (!HeadCell) {
+        return;
+      }
+      VTbl.SortDir = (VTbl.SortCol === HeadCell.cellIndex) ? -VTbl.SortDir : 1;
+      VTbl.SortCol = HeadCell.cellIndex;
+      Sort(VTbl);
+      Render(VTbl);
+    });
+
+    Filter(VTbl);
+  }
+
+  return { Load: Load };
+})();
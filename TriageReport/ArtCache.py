@@ -0,0 +1,337 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Persistent Columnar Artifact Cache for TriageReport/ts_Transform  #
+#    Normalized artifacts (MFT, Prefetch, Browser History, LNK, and   #
+#    Event Log Extracts) are written once per collection under        #
+#    <Collection>\TriageReport\ArtCache.  Re-runs mmap the cache      #
+#    instead of re-running the parsers and re-reading their CSVs.     #
+#                                                                     #
+#   Layout (per Table):                                               #
+#    <Name>.json      - Manifest: Source Signature, Types, Row Count  #
+#    <Name>.<n>.q     - Numeric Column: Packed int64 array            #
+#    <Name>.<n>.off   - String Column: uint64 Offset Table (Rows+1)   #
+#    <Name>.<n>.str   - String Column: UTF-8 Blob                     #
+#    <Name>.w.q       - Ragged (CSV) Tables: Columns in each Row      #
+#                                                                     #
+#   Note: The Manifest is written last - A run that is interrupted    #
+#         leaves no Manifest, and the Table is simply rebuilt.        #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Random Access to Rows (OpenTable) for the MFT Index       #
+#   v0.03 - String Offsets are streamed to their .off File too (Not   #
+#           held in Memory until Close)                               #
+#######################################################################
+import os
+import sys
+import json
+import mmap
+import array
+import CSVChunk
+
+
+###########################################################################
+# Bump this if the on-disk Layout changes (Old Caches are then rebuilt)   #
+###########################################################################
+CacheFormat = 1
+
+# String Offsets buffered per Column before they are written
+OffBatch = 65536
+
+
+###########################################################################
+# Source Signature: Size and Modified Time of every Source File (Dirs are #
+#  walked), plus the Parser used - Any change invalidates the Table       #
+###########################################################################
+def SourceSig(SrcPaths, Parser=""):
+    SrcSig = [CacheFormat, Parser]
+    for SrcPath in SrcPaths:
+        if os.path.isdir(SrcPath):
+            for SrcRoot, SrcDirs, SrcFiles in os.walk(SrcPath):
+                SrcDirs.sort()
+                for SrcFile in sorted(SrcFiles):
+                    SrcStat = os.stat(os.path.join(SrcRoot, SrcFile))
+                    SrcSig.append([os.path.join(SrcRoot, SrcFile), SrcStat.st_size, SrcStat.st_mtime_ns])
+        elif os.path.isfile(SrcPath):
+            SrcStat = os.stat(SrcPath)
+            SrcSig.append([SrcPath, SrcStat.st_size, SrcStat.st_mtime_ns])
+        else:
+            SrcSig.append([SrcPath, -1, 0])
+    return SrcSig
+
+
+def TablePath(CacheDir, Name, Part):
+    return os.path.join(CacheDir, Name + "." + Part)
+
+
+###########################################################################
+# Return the Manifest if the Table is current for this Source, else None  #
+###########################################################################
+def LoadManifest(CacheDir, Name, SrcSig):
+    if CacheDir == "":
+        return None
+
+    try:
+        with open(TablePath(CacheDir, Name, "json"), 'r', encoding='utf8') as ManFile:
+            Manifest = json.load(ManFile)
+    except (OSError, ValueError):
+        return None
+
+    if Manifest.get("Source") != SrcSig or Manifest.get("ByteOrder") != sys.byteorder:
+        return None
+    return Manifest
+
+
+def IsCached(CacheDir, Name, SrcSig):
+    return LoadManifest(CacheDir, Name, SrcSig) is not None
+
+
+###########################################################################
+# Table Writer - Numeric columns go to packed arrays, String columns are  #
+#  streamed to their Blob and their Offset Table (.str.tmp/.off.tmp, in   #
+#  OffBatch Offsets at a time), which are renamed at Close                #
+#  Types: "q" (int) or "s" (str) per column - None for a Ragged Table     #
+###########################################################################
+class CacheWriter:
+    def __init__(self, CacheDir, Name, Types=None):
+        os.makedirs(CacheDir, exist_ok=True)
+        self.CacheDir = CacheDir
+        self.Name = Name
+        self.Ragged = Types is None
+        self.Types = []
+        self.ColData = []
+        self.StrFile = []
+        self.OffFile = []
+        self.StrPos = []
+        self.RowCount = 0
+        self.Widths = array.array('q')
+
+        # Invalidate the old Table before any of its files are replaced
+        if os.path.isfile(TablePath(CacheDir, Name, "json")):
+            os.remove(TablePath(CacheDir, Name, "json"))
+
+        for ColType in (Types or ""):
+            self.AddColumn(ColType)
+
+    def AddColumn(self, ColType):
+        ColIndx = len(self.Types)
+        self.Types.append(ColType)
+        if ColType == "q":
+            self.ColData.append(array.array('q', bytes(8 * self.RowCount)))
+            self.StrFile.append(None)
+            self.OffFile.append(None)
+            self.StrPos.append(0)
+        else:
+            # Rows before this column was seen are empty strings (Offset 0)
+            self.ColData.append(array.array('Q', bytes(8 * (self.RowCount + 1))))
+            self.StrFile.append(open(TablePath(self.CacheDir, self.Name, str(ColIndx) + ".str.tmp"), 'wb'))
+            self.OffFile.append(open(TablePath(self.CacheDir, self.Name, str(ColIndx) + ".off.tmp"), 'wb'))
+            self.StrPos.append(0)
+
+    def Add(self, Row):
+        if self.Ragged:
+            while len(self.Types) < len(Row):
+                self.AddColumn("s")
+            self.Widths.append(len(Row))
+
+        for ColIndx, ColType in enumerate(self.Types):
+            if ColType == "q":
+                self.ColData[ColIndx].append(Row[ColIndx] if ColIndx < len(Row) else 0)
+                continue
+
+            if ColIndx < len(Row):
+                ColBytes = Row[ColIndx].encode('utf8', errors="replace")
+                self.StrFile[ColIndx].write(ColBytes)
+                self.StrPos[ColIndx] += len(ColBytes)
+
+            OffData = self.ColData[ColIndx]
+            OffData.append(self.StrPos[ColIndx])
+            if len(OffData) >= OffBatch:
+                OffData.tofile(self.OffFile[ColIndx])
+                del OffData[:]
+
+        self.RowCount += 1
+
+    def Close(self, SrcSig):
+        for ColIndx, ColType in enumerate(self.Types):
+            if ColType == "q":
+                with open(TablePath(self.CacheDir, self.Name, str(ColIndx) + ".q"), 'wb') as ColFile:
+                    self.ColData[ColIndx].tofile(ColFile)
+            else:
+                self.StrFile[ColIndx].close()
+                os.replace(TablePath(self.CacheDir, self.Name, str(ColIndx) + ".str.tmp"),
+                           TablePath(self.CacheDir, self.Name, str(ColIndx) + ".str"))
+                self.ColData[ColIndx].tofile(self.OffFile[ColIndx])
+                self.OffFile[ColIndx].close()
+                os.replace(TablePath(self.CacheDir, self.Name, str(ColIndx) + ".off.tmp"),
+                           TablePath(self.CacheDir, self.Name, str(ColIndx) + ".off"))
+
+        if self.Ragged:
+            with open(TablePath(self.CacheDir, self.Name, "w.q"), 'wb') as ColFile:
+                self.Widths.tofile(ColFile)
+
+        Manifest = {"Format": CacheFormat, "Source": SrcSig, "ByteOrder": sys.byteorder,
+                    "Types": "".join(self.Types), "Ragged": self.Ragged, "Rows": self.RowCount}
+
+        with open(TablePath(self.CacheDir, self.Name, "json.tmp"), 'w', encoding='utf8') as ManFile:
+            json.dump(Manifest, ManFile)
+        os.replace(TablePath(self.CacheDir, self.Name, "json.tmp"), TablePath(self.CacheDir, self.Name, "json"))
+
+    def Abort(self):
+        for ColFile in self.StrFile + self.OffFile:
+            if ColFile is not None:
+                ColFile.close()
+                if os.path.isfile(ColFile.name):
+                    os.remove(ColFile.name)
+
+
+###########################################################################
+# mmap a Table file (An empty file can not be mapped)                     #
+###########################################################################
+def MapFile(FilePath, OpenMaps):
+    with open(FilePath, 'rb') as MapSrc:
+        if os.fstat(MapSrc.fileno()).st_size == 0:
+            return b""
+        FileMap = mmap.mmap(MapSrc.fileno(), 0, access=mmap.ACCESS_READ)
+    OpenMaps.append(FileMap)
+    return FileMap
+
+
+###########################################################################
+# Open Table - Random Access to any Row by its Row Number                 #
+###########################################################################
+class CacheTable:
+    def __init__(self, CacheDir, Name, Manifest, UnpackFunc=None):
+        self.Manifest = Manifest
+        self.RowCount = Manifest["Rows"]
+        self.UnpackFunc = UnpackFunc
+        self.OpenMaps = []
+        self.OpenViews = []
+        self.ColReads = []
+        self.Widths = None
+
+        try:
+            for ColIndx, ColType in enumerate(Manifest["Types"]):
+                if ColType == "q":
+                    ColView = memoryview(MapFile(TablePath(CacheDir, Name, str(ColIndx) + ".q"), self.OpenMaps)).cast('q')
+                    self.OpenViews.append(ColView)
+                    self.ColReads.append((ColView, None))
+                else:
+                    OffView = memoryview(MapFile(TablePath(CacheDir, Name, str(ColIndx) + ".off"), self.OpenMaps)).cast('Q')
+                    self.OpenViews.append(OffView)
+                    self.ColReads.append((OffView, MapFile(TablePath(CacheDir, Name, str(ColIndx) + ".str"), self.OpenMaps)))
+
+            if Manifest["Ragged"]:
+                self.Widths = memoryview(MapFile(TablePath(CacheDir, Name, "w.q"), self.OpenMaps)).cast('q')
+                self.OpenViews.append(self.Widths)
+        except Exception:
+            self.Close()
+            raise
+
+    def Row(self, RowIndx):
+        Row = []
+        for ColView, ColBlob in self.ColReads:
+            if ColBlob is None:
+                Row.append(ColView[RowIndx])
+            else:
+                Row.append(ColBlob[ColView[RowIndx]:ColView[RowIndx + 1]].decode('utf8', errors="replace"))
+
+        if self.Widths is not None:
+            return Row[:self.Widths[RowIndx]]
+        elif self.UnpackFunc is None:
+            return tuple(Row)
+        else:
+            return self.UnpackFunc(Row)
+
+    def Close(self):
+        # Views have to be released before their mmap can be closed
+        for OpenView in self.OpenViews:
+            OpenView.release()
+        for FileMap in self.OpenMaps:
+            FileMap.close()
+        self.OpenViews = []
+        self.OpenMaps = []
+
+
+###########################################################################
+# Read a Table: Yields each Row (list for Ragged Tables, else tuple)      #
+###########################################################################
+def ReadTable(CacheDir, Name, Manifest, UnpackFunc=None):
+    ReadTbl = CacheTable(CacheDir, Name, Manifest, UnpackFunc)
+    try:
+        for RowIndx in range(ReadTbl.RowCount):
+            yield ReadTbl.Row(RowIndx)
+    finally:
+        ReadTbl.Close()
+
+
+###########################################################################
+# Open a current Table for Random Access (None if missing or stale)       #
+###########################################################################
+def OpenTable(CacheDir, Name, SrcSig, UnpackFunc=None):
+    Manifest = LoadManifest(CacheDir, Name, SrcSig)
+    if Manifest is None:
+        return None
+    return CacheTable(CacheDir, Name, Manifest, UnpackFunc)
+
+
+###########################################################################
+# Pass the Rows through while they are written to the Cache - The Table   #
+#  is only kept if every Row was read (PackFunc converts for Types)       #
+###########################################################################
+def StoreRows(CacheDir, Name, SrcSig, Types, Rows, PackFunc=None):
+    CacheOut = CacheWriter(CacheDir, Name, Types)
+    CacheDone = 0
+    try:
+        for Row in Rows:
+            if PackFunc is None:
+                CacheOut.Add(Row)
+            else:
+                CacheOut.Add(PackFunc(Row))
+            yield Row
+        CacheOut.Close(SrcSig)
+        CacheDone = 1
+    finally:
+        if CacheDone == 0:
+            CacheOut.Abort()
+
+
+###########################################################################
+# Typed Table from the Cache (None if it is missing or stale)             #
+###########################################################################
+def LoadRows(CacheDir, Name, SrcSig, UnpackFunc=None):
+    Manifest = LoadManifest(CacheDir, Name, SrcSig)
+    if Manifest is None:
+        return None
+    return ReadTable(CacheDir, Name, Manifest, UnpackFunc)
+
+
+###########################################################################
+# Tool CSV Rows: From the Cache if it is current, otherwise read the CSV  #
+#  (and Cache it) - Returns None if there is no Cache and no CSV          #
+#  CacheDir "" turns the Cache off and just reads the CSV                 #
+###########################################################################
+def CachedCSV(CacheDir, Name, SrcSig, CSVName, Delim=',', Workers=0):
+    Manifest = LoadManifest(CacheDir, Name, SrcSig)
+    if Manifest is not None:
+        return ReadTable(CacheDir, Name, Manifest)
+
+    if not os.path.isfile(CSVName):
+        return None
+
+    CSVRows = CSVChunk.ReadCSV(CSVName, Delim=Delim, Workers=Workers)
+    if CacheDir == "":
+        return CSVRows
+    return StoreRows(CacheDir, Name, SrcSig, None, CSVRows)
+
+
+###########################################################################
+# Cache a Tool CSV right away (For Tables read by more than one section)  #
+###########################################################################
+def CacheCSV(CacheDir, Name, SrcSig, CSVName, Delim=',', Workers=0):
+    if CacheDir == "" or not os.path.isfile(CSVName):
+        return
+    for Row in StoreRows(CacheDir, Name, SrcSig, None, CSVChunk.ReadCSV(CSVName, Delim=Delim, Workers=Workers)):
+        pass
@@ -0,0 +1,207 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   OpenSearch Bulk (NDJSON) Sink for ts_Transform                    #
+#    Every Timesketch Row is also written as a _bulk Action and       #
+#    Document (Field Names from the CSV Header Row), in gzip Batches  #
+#    of about BatchBytes (Uncompressed): Bulk\ts_xxx_nnnn.ndjson.gz   #
+#    Ingest needs no CSV re-parsing - A Batch is one _bulk Request.   #
+#                                                                     #
+#   BulkUpload Posts the Batches to OpenSearch (Optional), Workers    #
+#    at a time, with Retries on Connection Errors, 429 and 5xx.       #
+#                                                                     #
+#   Timesketch Fields: Every Document has "timestamp" (Epoch          #
+#    Microseconds of the datetime Column, through TimeNorm) so it can #
+#    be Sorted and Filtered, and - when a Timeline ID is given        #
+#    (BulkTID:) - the "__ts_timeline_id" of the Timesketch Timeline   #
+#    the Index belongs to (Timesketch only shows the Events of a      #
+#    Timeline that carry its ID).                                     #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - timestamp and __ts_timeline_id Fields for Timesketch      #
+#######################################################################
+import os
+import glob
+import gzip
+import json
+import time
+import base64
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import concurrent.futures
+import TimeNorm
+
+
+BatchDefault = 8 * 1048576
+PostWorkers = 4
+PostTries = 5
+PostWait = 30
+
+# The Timesketch Timeline ID Field (BulkTID: sets its Value)
+TimelineIdField = "__ts_timeline_id"
+
+
+###########################################################################
+# The Batch Files written for one Timesketch CSV (In Batch Order)         #
+###########################################################################
+def BatchFiles(BulkDir, CSVName):
+    CSVStem = os.path.splitext(os.path.basename(CSVName))[0]
+    return sorted(glob.glob(os.path.join(BulkDir, glob.escape(CSVStem) + "_[0-9][0-9][0-9][0-9].ndjson.gz")))
+
+
+###########################################################################
+# Bulk Writer for one Timesketch CSV - Head() gets the Header Row, Add()  #
+#  each Row, and Close() writes the last Batch.  Each Document also has   #
+#  the Timeline (The CSV Name, like ts_autoruns), the timestamp (Epoch    #
+#  Microseconds), and the TimelineID (If there is one)                    #
+###########################################################################
+class BulkWriter:
+    def __init__(self, BulkDir, IndexName, CSVName, BatchBytes=BatchDefault, TimelineID=""):
+        self.BulkDir = BulkDir
+        self.Timeline = os.path.splitext(os.path.basename(CSVName))[0]
+        self.BatchBytes = max(BatchBytes, 65536)
+        self.Action = (json.dumps({"index": {"_index": IndexName}}, separators=(",", ":")) + "\n").encode("utf8")
+        self.HeadNames = None
+        self.TimeCol = None
+        self.ExtraNames = ("timeline", "timestamp")
+        self.ExtraVals = (self.Timeline,)
+        if str(TimelineID) != "":
+            self.ExtraNames = self.ExtraNames + (TimelineIdField,)
+            self.ExtraVals = self.ExtraVals + (int(TimelineID) if str(TimelineID).isdigit() else TimelineID,)
+        self.Lines = []
+        self.LineBytes = 0
+        self.Batches = 0
+        self.Docs = 0
+        self.Encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+        os.makedirs(BulkDir, exist_ok=True)
+        for OldBatch in BatchFiles(BulkDir, CSVName):
+            os.remove(OldBatch)
+
+    def Head(self, HeadRow):
+        self.HeadNames = tuple(HeadRow) + self.ExtraNames
+        self.TimeCol = list(HeadRow).index("datetime") if "datetime" in HeadRow else None
+
+    def Add(self, Row):
+        if self.TimeCol is not None and self.TimeCol < len(Row):
+            TimeStamp = TimeNorm.EpochMicros(TimeNorm.ZoneTime(Row[self.TimeCol]))
+        else:
+            TimeStamp = TimeNorm.EpochMicros(TimeNorm.NoDataTime)
+
+        DocVals = tuple(Row) + self.ExtraVals[:1] + (TimeStamp,) + self.ExtraVals[1:]
+        DocLine = self.Encode(dict(zip(self.HeadNames, DocVals))).encode("utf8") + b"\n"
+        self.Lines.append(self.Action)
+        self.Lines.append(DocLine)
+        self.LineBytes += len(self.Action) + len(DocLine)
+        self.Docs += 1
+
+        if self.LineBytes >= self.BatchBytes:
+            self.Flush()
+
+    def Flush(self):
+        if not self.Lines:
+            return
+
+        self.Batches += 1
+        BatchName = os.path.join(self.BulkDir, self.Timeline + "_" + str(self.Batches).zfill(4) + ".ndjson.gz")
+        with open(BatchName, "wb") as BatchFile:
+            BatchFile.write(gzip.compress(b"".join(self.Lines), compresslevel=6))
+
+        self.Lines = []
+        self.LineBytes = 0
+
+    def Close(self):
+        self.Flush()
+        return self.Docs
+
+
+###########################################################################
+# Bulk Uploader - Send() queues a Batch File, Workers Post them.  A Batch #
+#  is retried (PostTries, Backoff up to PostWait Seconds) when OpenSearch #
+#  can not be reached or answers 429/5xx.  Close() Waits and shows the    #
+#  Counts.  User:Password in the URL is sent as Basic Auth                #
+###########################################################################
+class BulkUpload:
+    def __init__(self, BulkURL, Workers=PostWorkers, Tries=PostTries):
+        URLParts = urllib.parse.urlsplit(BulkURL)
+        HostPort = URLParts.hostname or ""
+        if URLParts.port:
+            HostPort = HostPort + ":" + str(URLParts.port)
+
+        PostPath = URLParts.path.rstrip("/")
+        if not PostPath.endswith("/_bulk"):
+            PostPath = PostPath + "/_bulk"
+
+        self.PostURL = urllib.parse.urlunsplit((URLParts.scheme, HostPort, PostPath, "", ""))
+        self.Headers = {"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"}
+        if URLParts.username is not None:
+            UserPass = urllib.parse.unquote(URLParts.username) + ":" + urllib.parse.unquote(URLParts.password or "")
+            self.Headers["Authorization"] = "Basic " + base64.b64encode(UserPass.encode("utf8")).decode("ascii")
+
+        self.Tries = max(Tries, 1)
+        self.Workers = max(Workers, 1)
+        self.Pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.Workers)
+        self.Posts = []
+        self.Lock = threading.Lock()
+        self.Sent = 0
+        self.Failed = 0
+        self.Retried = 0
+        self.DocErrors = 0
+
+    def Send(self, BatchName):
+        self.Posts.append(self.Pool.submit(self.PostBatch, BatchName))
+
+    ###########################################################################
+    # Post one Batch (In a Worker Thread) - Document Errors in a 200 Reply    #
+    #  are Counted, not Retried (The Document itself was refused)             #
+    ###########################################################################
+    def PostBatch(self, BatchName):
+        with open(BatchName, "rb") as BatchFile:
+            BatchData = BatchFile.read()
+
+        for TryNum in range(1, self.Tries + 1):
+            PostErr = ""
+            try:
+                PostReq = urllib.request.Request(self.PostURL, data=BatchData, headers=self.Headers, method="POST")
+                with urllib.request.urlopen(PostReq, timeout=120) as PostResp:
+                    Reply = json.loads(PostResp.read() or b"{}")
+
+                DocErrors = 0
+                if Reply.get("errors"):
+                    for Item in Reply.get("items", []):
+                        if list(Item.values())[0].get("status", 200) >= 300:
+                            DocErrors += 1
+
+                with self.Lock:
+                    self.Sent += 1
+                    self.DocErrors += DocErrors
+                return True
+
+            except urllib.error.HTTPError as HTTPErr:
+                PostErr = "HTTP " + str(HTTPErr.code)
+                if HTTPErr.code != 429 and HTTPErr.code < 500:
+                    break
+            except (urllib.error.URLError, OSError, ValueError) as URLErr:
+                PostErr = str(URLErr)
+
+            if TryNum < self.Tries:
+                with self.Lock:
+                    self.Retried += 1
+                time.sleep(min(2 ** (TryNum - 1), PostWait))
+
+        print("[!] Bulk Upload Failed: " + os.path.basename(BatchName) + " (" + PostErr + ")")
+        with self.Lock:
+            self.Failed += 1
+        return False
+
+    def Close(self):
+        for PostRun in self.Posts:
+            PostRun.result()
+        self.Pool.shutdown(wait=True)
+
+        print("[+] Bulk Batches Uploaded: " + str(self.Sent) + " (Retries: " + str(self.Retried) + ", Failed: " + str(self.Failed) + ", Document Errors: " + str(self.DocErrors) + ")")
+        return self.Failed == 0
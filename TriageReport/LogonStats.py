@@ -0,0 +1,180 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Streaming Logon Aggregator for TriageReport                       #
+#    Logon Events (4625 Failed, 4624 Success, 4648 Explicit) are      #
+#    counted as they are read - Per UserId, per Source (Workstation   #
+#    and IP), and per Time Window - in one pass, with Dictionaries    #
+#    (Hash Lookups).  Only the Counts are kept, never the Events.     #
+#                                                                     #
+#   Time Windows are used to find Bursts:                             #
+#    Password Spray - Many different UserIds in one Window            #
+#    Brute Force    - Many attempts on one UserId in one Window       #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Source and Burst Report Tables (SourceTable/BurstTable)   #
+#           shared by the 4625, 4624 (RDP) and 4648 Sections          #
+#######################################################################
+import ReportTable
+
+
+###########################################################################
+# Defaults - Window is in Minutes (Windows start on the Day boundary)     #
+###########################################################################
+WindowMins = 10
+BurstMin = 10
+SprayUsers = 5
+BruteCount = 10
+
+
+###########################################################################
+# Window Start for a "YYYY-MM-DD HH:MM:SS" Date - String slicing instead  #
+#  of strptime, this runs once per Event                                  #
+###########################################################################
+def WindowKey(EvtDate, Window):
+    try:
+        DayMins = int(EvtDate[11:13]) * 60 + int(EvtDate[14:16])
+    except ValueError:
+        return None
+    DayMins -= DayMins % Window
+    return EvtDate[:10] + " {:02d}:{:02d}".format(DayMins // 60, DayMins % 60)
+
+
+def SourceText(Workstation, SourceIP):
+    Workstation = Workstation.strip()
+    SourceIP = SourceIP.strip()
+    if SourceIP in ("", "-"):
+        return Workstation if Workstation not in ("", "-") else "-"
+    if Workstation in ("", "-"):
+        return SourceIP
+    return Workstation + " / " + SourceIP
+
+
+class LogonStats:
+    def __init__(self, Window=WindowMins):
+        if Window < 1 or Window > 1440:
+            Window = WindowMins
+
+        self.Window = Window
+        self.Events = 0
+        self.Users = {}
+        self.Sources = {}
+        self.Windows = {}
+
+    ###########################################################################
+    # Count one Event: Users and Sources are [Count, First, Last, {Keys}]     #
+    #  and Windows are [Count, {UserId: Count}, {Sources}]                    #
+    ###########################################################################
+    def Add(self, EvtDate, UserId, Source="-"):
+        self.Events += 1
+        UserKey = UserId.lower()
+
+        UserStat = self.Users.get(UserKey)
+        if UserStat is None:
+            self.Users[UserKey] = [1, EvtDate, EvtDate, {Source}]
+        else:
+            UserStat[0] += 1
+            if EvtDate < UserStat[1]:
+                UserStat[1] = EvtDate
+            if EvtDate > UserStat[2]:
+                UserStat[2] = EvtDate
+            UserStat[3].add(Source)
+
+        SrcStat = self.Sources.get(Source)
+        if SrcStat is None:
+            self.Sources[Source] = [1, EvtDate, EvtDate, {UserKey}]
+        else:
+            SrcStat[0] += 1
+            if EvtDate < SrcStat[1]:
+                SrcStat[1] = EvtDate
+            if EvtDate > SrcStat[2]:
+                SrcStat[2] = EvtDate
+            SrcStat[3].add(UserKey)
+
+        WinKey = WindowKey(EvtDate, self.Window)
+        if WinKey is not None:
+            WinStat = self.Windows.get(WinKey)
+            if WinStat is None:
+                WinStat = self.Windows[WinKey] = [0, {}, set()]
+            WinStat[0] += 1
+            WinStat[1][UserKey] = WinStat[1].get(UserKey, 0) + 1
+            WinStat[2].add(Source)
+
+    ###########################################################################
+    # Per UserId: (UserId, Count, Sources, First, Last) - Most Events first   #
+    ###########################################################################
+    def UserCounts(self):
+        return sorted(((UserKey, UserStat[0], len(UserStat[3]), UserStat[1], UserStat[2]) for UserKey, UserStat in self.Users.items()),
+                      key=lambda UserRow: (UserRow[1], UserRow[0]), reverse=True)
+
+    ###########################################################################
+    # Per Source: (Source, Count, UserIds, First, Last) - Most Events first   #
+    ###########################################################################
+    def SourceCounts(self):
+        return sorted(((SrcKey, SrcStat[0], len(SrcStat[3]), SrcStat[1], SrcStat[2]) for SrcKey, SrcStat in self.Sources.items()),
+                      key=lambda SrcRow: (SrcRow[1], SrcRow[0]), reverse=True)
+
+    ###########################################################################
+    # Windows with at least MinCount Events, in Time Order:                   #
+    #  (Window Start, Count, UserIds, Sources, Top UserId, Top Count, Type)   #
+    #  Patterns 0 (Not Failures) names a Burst by its Shape, not an Attack    #
+    ###########################################################################
+    def Bursts(self, MinCount=BurstMin, Patterns=1):
+        BurstRows = []
+        for WinKey in sorted(self.Windows):
+            WinCount, WinUsers, WinSrcs = self.Windows[WinKey]
+            if WinCount < MinCount:
+                continue
+
+            TopUser = max(WinUsers, key=WinUsers.get)
+            if len(WinUsers) >= SprayUsers:
+                BurstType = "Password Spray" if Patterns == 1 else "Many UserIds"
+            elif WinUsers[TopUser] >= BruteCount:
+                BurstType = "Brute Force" if Patterns == 1 else "One UserId"
+            else:
+                BurstType = "Burst"
+
+            BurstRows.append((WinKey, WinCount, len(WinUsers), len(WinSrcs), TopUser, WinUsers[TopUser], BurstType))
+        return BurstRows
+
+
+###########################################################################
+# Per Source Table (H3 Title, Table, and Records Found)                   #
+###########################################################################
+def SourceTable(outfile, IOCMatch, LgnStats, TableTitle, SourceTitle="Source"):
+    reccount = 0
+    outfile.write("<H3>" + TableTitle + "</H3>\n")
+    RptTable = ReportTable.ReportTable(outfile, ("40%", "10%", "10%", "20%", "20%"), IOCMatch)
+    RptTable.Titles((SourceTitle, "Count", "UserIds", "First", "Last"))
+
+    for SrcKey, SrcCount, SrcUsers, FirstDate, LastDate in LgnStats.SourceCounts():
+        RptTable.Add((SrcKey, str(SrcCount), str(SrcUsers), FirstDate, LastDate), SrcKey)
+        reccount = reccount + 1
+
+    RptTable.Close()
+    outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
+
+
+###########################################################################
+# Burst Table - Windows with BurstMin or more Events (EvtLabel is what    #
+#  was counted, like "Failed Logins"), then BurstNote                     #
+###########################################################################
+def BurstTable(outfile, IOCMatch, LgnStats, TableTitle, EvtLabel, CountTitle, BurstNote, Patterns=1):
+    reccount = 0
+    outfile.write("<H3>" + TableTitle + " (" + str(LgnStats.Window) + " Minute Windows)</H3>\n")
+    outfile.write("<p><i><font color=firebrick>Windows with " + str(BurstMin) + " or more " + EvtLabel + ".  \n")
+    outfile.write(BurstNote + "</font></i></p>\n")
+    RptTable = ReportTable.ReportTable(outfile, ("20%", "10%", "10%", "10%", "25%", "10%", "15%"), IOCMatch)
+    RptTable.Titles(("Window Start", CountTitle, "UserIds", "Sources", "Top UserId", "Top Count", "Pattern"))
+
+    for WinKey, WinCount, WinUsers, WinSrcs, TopUser, TopCount, BurstType in LgnStats.Bursts(Patterns=Patterns):
+        RptTable.Add((WinKey, str(WinCount), str(WinUsers), str(WinSrcs), TopUser, str(TopCount), BurstType), TopUser)
+        reccount = reccount + 1
+
+    RptTable.Close()
+    if reccount < 1:
+        outfile.write("<p><b><font color = red> No Bursts Found! </font></b></p>\n")
+    else:
+        outfile.write("<p>Records Found: " + str(reccount) + "</p>\n")
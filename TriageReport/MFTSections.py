@@ -0,0 +1,323 @@
+####################################################################### 
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   MFT Section Engine for TriageReport                               #
+#    Reads the MFT Parser output once, and classifies every record    #
+#    into all of the enabled $MFT Report Sections (and IOC Matches)   #
+#    in a single streaming pass.                                      #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Use the shared IOCMatcher for the $MFT IOC Scan           #
+#   v0.03 - Parallel Chunked CSV Reader for MFTDump/MFTECmd output    #
+#   v0.04 - Keep the Normalized Records in the Artifact Cache         #
+#   v0.05 - Size and Path Component Index - Sections are Lookups      #
+#   v0.06 - No Cache: Only the Records a Section can return are kept  #
+#           in Memory (Not the whole $MFT)                            #
+#   v0.07 - Size Index sorted as packed (Size, Row) ints - No Size or #
+#           Path Index without a Cache (The Kept Records are Checked) #
+#######################################################################
+import os
+import array
+import bisect
+import functools
+import CSVChunk
+import ArtCache
+
+
+###########################################################################
+# MFT Parser Column Layouts                                               #
+#  1 - Malware Hunters MFTDump.exe                                        #
+#  2 - Eric Zimmerman MFTECmd.exe                                         #
+###########################################################################
+MFTLayouts = {
+    1: {"Delt": 1, "Size": 10, "Path": 13, "File": 4, "Crea": 6, "Accs": 7, "Modf": 8,
+        "ActFlag": "0", "DelFlag": "1", "Delim": '\t'},
+    2: {"Delt": 2, "Size": 8, "Path": 5, "File": 6, "Crea": 19, "Accs": 25, "Modf": 21,
+        "ActFlag": "True", "DelFlag": "False", "Delim": ','}
+}
+
+
+###########################################################################
+# Normalize one Parser Row (Top Level so the CSV Pool can pickle it)      #
+#  Returns None for rows that are not Deleted or Active records           #
+###########################################################################
+def NormalizeMFTRow(MFTParsr, csvrow):
+    Layout = MFTLayouts[MFTParsr]
+    if csvrow[Layout["Delt"]] == Layout["DelFlag"]:
+        Deleted = "1"
+    elif csvrow[Layout["Delt"]] == Layout["ActFlag"]:
+        Deleted = "0"
+    else:
+        return None
+
+    # Normalized Full Path
+    if MFTParsr == 2:
+        FullPath = os.path.join(csvrow[Layout["Path"]], csvrow[Layout["File"]])
+    else:
+        FullPath = csvrow[Layout["Path"]]
+
+    return (Deleted, FullPath, csvrow[Layout["Crea"]], csvrow[Layout["Accs"]], csvrow[Layout["Modf"]], csvrow[Layout["Size"]])
+
+
+###########################################################################
+# Normalized Record: (Deleted, FullPath, Created, Accessed, Modified,     #
+#  Size) - Deleted is "1" or "0", everything is kept as the parser's text #
+#  Workers > 1 parses the CSV in chunks across a process pool             #
+###########################################################################
+def ReadMFTDump(csvname, MFTParsr, Workers=0):
+    return CSVChunk.ReadCSV(csvname, Delim=MFTLayouts[MFTParsr]["Delim"], RowFunc=functools.partial(NormalizeMFTRow, MFTParsr),
+                            MinCols=14, Workers=Workers)
+
+
+###########################################################################
+# Artifact Cache Table "MFT" - Deleted and Size are packed as numbers     #
+#  (Size -1 means the parser gave no numeric Size)                        #
+###########################################################################
+MFTTypes = "qssssq"
+
+
+def PackMFTRec(MFTRec):
+    if MFTRec[5].isdigit():
+        nFileSize = int(MFTRec[5])
+    else:
+        nFileSize = -1
+    return (int(MFTRec[0]), MFTRec[1], MFTRec[2], MFTRec[3], MFTRec[4], nFileSize)
+
+
+def UnpackMFTRec(MFTRow):
+    if MFTRow[5] < 0:
+        FileSize = ""
+    else:
+        FileSize = str(MFTRow[5])
+    return (str(MFTRow[0]), MFTRow[1], MFTRow[2], MFTRow[3], MFTRow[4], FileSize)
+
+
+def CacheMFT(CacheDir, SrcSig, MFTRecs):
+    if CacheDir == "":
+        return MFTRecs
+    return ArtCache.StoreRows(CacheDir, "MFT", SrcSig, MFTTypes, MFTRecs, PackMFTRec)
+
+
+def LoadMFT(CacheDir, SrcSig):
+    return ArtCache.LoadRows(CacheDir, "MFT", SrcSig, UnpackMFTRec)
+
+
+###########################################################################
+# Section Definition:                                                     #
+#  (Key, Deleted, MinSize, MaxSize, PathHas)                              #
+#   Deleted: "1" Deleted Records, "0" Active Records                      #
+#   MinSize/MaxSize: Exclusive size range (None = No Size Filter)         #
+#   PathHas: Lowercase strings that must ALL be in the Full Path          #
+###########################################################################
+def MFTSection(Key, Deleted, MinSize=None, MaxSize=None, PathHas=()):
+    return (Key, Deleted, MinSize, MaxSize, tuple(PathHas))
+
+
+###########################################################################
+# Path Components that can be Indexed: A PathHas string that starts and   #
+#  ends with a separator (like "\\temp\\") only matches Records that have #
+#  that whole (non-last) component - Everything else is rechecked         #
+###########################################################################
+def PathComp(PathStr):
+    if len(PathStr) > 2 and PathStr.startswith("\\") and PathStr.endswith("\\"):
+        return PathStr[1:-1].split("\\")[0]
+    return None
+
+
+def PathComps(MFTSects):
+    SectComps = set()
+    for MFTSect in MFTSects:
+        for PathStr in MFTSect[4]:
+            if PathComp(PathStr) is not None:
+                SectComps.add(PathComp(PathStr))
+    return SectComps
+
+
+###########################################################################
+# Does the Record (with its nFileSize) fall in the Section                #
+###########################################################################
+def SectMatch(MFTSect, MFTHitRec):
+    Key, Deleted, MinSize, MaxSize, PathHas = MFTSect
+    if MFTHitRec[0] != Deleted:
+        return False
+
+    if MinSize is not None or MaxSize is not None:
+        if len(MFTHitRec[5]) < 2 or not MFTHitRec[5].isdigit():
+            return False
+        if MinSize is not None and MFTHitRec[6] <= MinSize:
+            return False
+        if MaxSize is not None and MFTHitRec[6] >= MaxSize:
+            return False
+
+    if len(PathHas) > 0:
+        lFullPath = MFTHitRec[1].lower()
+        for PathStr in PathHas:
+            if PathStr not in lFullPath:
+                return False
+
+    return True
+
+
+###########################################################################
+# MFT Index - Built in one pass over the records (with the IOC Scan):     #
+#  SizeKeys/SizeRows: Row Numbers sorted by Size (per Deleted/Active)     #
+#  PathRows: Path Component -> Row Numbers (per Deleted/Active)           #
+#  Records are read back from the Artifact Cache by Row Number, or, when  #
+#  there is no Cache (KeepRecs), only the Records that match one of       #
+#  KeepSects are kept in memory (Row Number -> Record) and no Size or     #
+#  Path Index is built - Sections are Checked against the Kept Records    #
+###########################################################################
+RowBits = 32
+RowMask = (1 << RowBits) - 1
+
+
+class MFTIndex:
+    def __init__(self, MFTRecs, IOCMatch, IndxComps=(), KeepRecs=1, KeepSects=()):
+        self.FlagRows = {"1": array.array('q'), "0": array.array('q')}
+        self.SizeKeys = {}
+        self.SizeRows = {}
+        self.PathRows = {"1": {}, "0": {}}
+        self.IOCHits = []
+        self.Table = None
+
+        if KeepRecs == 1:
+            self.Recs = {}
+        else:
+            self.Recs = None
+
+        if len(IOCMatch.IOCList) > 0:
+            ChkIOCs = 1
+        else:
+            ChkIOCs = 0
+
+        IndxComps = set(IndxComps)
+        SizePack = {"1": [], "0": []}
+
+        RowNum = -1
+        for MFTRec in MFTRecs:
+            RowNum += 1
+            FileSize = MFTRec[5]
+            if FileSize.isdigit():
+                nFileSize = int(FileSize)
+            else:
+                nFileSize = 0
+
+            MFTHitRec = MFTRec + (nFileSize,)
+            if self.Recs is not None:
+                for MFTSect in KeepSects:
+                    if SectMatch(MFTSect, MFTHitRec):
+                        self.Recs[RowNum] = MFTHitRec
+                        break
+            else:
+                Deleted = MFTRec[0]
+                self.FlagRows[Deleted].append(RowNum)
+
+                # Size Bands need a real size (Same as the original reports)
+                if len(FileSize) > 1 and FileSize.isdigit():
+                    SizePack[Deleted].append((nFileSize << RowBits) | RowNum)
+
+                if len(IndxComps) > 0:
+                    for PathPart in set(MFTRec[1].lower().split("\\")[1:-1]):
+                        if PathPart in IndxComps:
+                            self.PathRows[Deleted].setdefault(PathPart, array.array('q')).append(RowNum)
+
+            # Check for IOC Matches in the MFT
+            if ChkIOCs == 1:
+                if IOCMatch.Check(' '.join(MFTRec)) == 1:
+                    self.IOCHits.append(MFTHitRec)
+
+        # One Sort of (Size << RowBits) | Row - Same Order as by Size, then Row
+        for Deleted in ("1", "0"):
+            SizePack[Deleted].sort()
+            self.SizeKeys[Deleted] = array.array('q', (PackVal >> RowBits for PackVal in SizePack[Deleted]))
+            self.SizeRows[Deleted] = array.array('q', (PackVal & RowMask for PackVal in SizePack[Deleted]))
+            SizePack[Deleted] = None
+
+    def Attach(self, CacheTbl):
+        self.Table = CacheTbl
+
+    def Record(self, RowNum):
+        # None if the Record was not Kept (It matches no Section)
+        if self.Recs is not None:
+            return self.Recs.get(RowNum)
+
+        MFTRec = self.Table.Row(RowNum)
+        if MFTRec[5].isdigit():
+            return MFTRec + (int(MFTRec[5]),)
+        return MFTRec + (0,)
+
+    ###########################################################################
+    # Section Lookup: Bisect the Size Range and/or take the Path Component    #
+    #  list (the smaller one), then recheck each candidate against the whole  #
+    #  Section Definition.  Rows come back in their original (file) order     #
+    ###########################################################################
+    def Query(self, MFTSect):
+        Key, Deleted, MinSize, MaxSize, PathHas = MFTSect
+        if self.Recs is not None:
+            return [MFTHitRec for MFTHitRec in self.Recs.values() if SectMatch(MFTSect, MFTHitRec)]
+        if self.Table is None:
+            return []
+
+        SectRows = None
+        if MinSize is not None or MaxSize is not None:
+            SizeKeys = self.SizeKeys[Deleted]
+            if MinSize is None:
+                RngLow = 0
+            else:
+                RngLow = bisect.bisect_right(SizeKeys, MinSize)
+            if MaxSize is None:
+                RngHigh = len(SizeKeys)
+            else:
+                RngHigh = bisect.bisect_left(SizeKeys, MaxSize)
+            SectRows = self.SizeRows[Deleted][RngLow:max(RngLow, RngHigh)]
+
+        for PathStr in PathHas:
+            if PathComp(PathStr) is not None:
+                CompRows = self.PathRows[Deleted].get(PathComp(PathStr), ())
+                if SectRows is None or len(CompRows) < len(SectRows):
+                    SectRows = CompRows
+
+        if SectRows is None:
+            SectRows = self.FlagRows[Deleted]
+
+        SectHits = []
+        for RowNum in sorted(SectRows):
+            MFTHitRec = self.Record(RowNum)
+            if MFTHitRec is not None and SectMatch(MFTSect, MFTHitRec):
+                SectHits.append(MFTHitRec)
+
+        return SectHits
+
+    def Close(self):
+        if self.Table is not None:
+            self.Table.Close()
+            self.Table = None
+        self.Recs = None
+
+
+###########################################################################
+# Build the MFT Index (One Pass) and look up every Section from it.       #
+#  Returns a dict of Key -> list of (Deleted, FullPath, Created,          #
+#  Accessed, Modified, Size, nFileSize), plus "IOC" for the IOC Matches   #
+#  With a CacheDir the Records are read back from the "MFT" Cache Table   #
+#  (MFTRecs must be the CacheMFT/LoadMFT rows for that SrcSig) - Without  #
+#  one only the Section Hits are held in Memory                           #
+###########################################################################
+def ClassifyMFT(MFTRecs, MFTSects, IOCMatch, CacheDir="", SrcSig=None):
+    if CacheDir == "":
+        MFTIndx = MFTIndex(MFTRecs, IOCMatch, PathComps(MFTSects), KeepRecs=1, KeepSects=MFTSects)
+    else:
+        MFTIndx = MFTIndex(MFTRecs, IOCMatch, PathComps(MFTSects), KeepRecs=0)
+        MFTIndx.Attach(ArtCache.OpenTable(CacheDir, "MFT", SrcSig, UnpackMFTRec))
+        if MFTIndx.Table is None:
+            print("[!] MFT Cache Table Not Found - $MFT Sections will be Empty...")
+
+    MFTHits = {}
+    for MFTSect in MFTSects:
+        MFTHits[MFTSect[0]] = MFTIndx.Query(MFTSect)
+    MFTHits["IOC"] = MFTIndx.IOCHits
+
+    MFTIndx.Close()
+    return MFTHits
@@ -0,0 +1,274 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Buffered HTML Table Renderer for TriageReport                     #
+#    Each report table is described once (Cell Widths and IOC         #
+#    Highlighting) and every row is rendered through one prebuilt     #
+#    row template.  The report HTML is collected and written out in   #
+#    large blocks instead of one write per cell.                      #
+#                                                                     #
+#   Virtual Mode (RptMode:Virtual): Tables larger than VirtRows are   #
+#    written to a JS Data File (One Array per Row) and rendered by    #
+#    virtual-Ach.js - Only the visible Rows are in the page, and the  #
+#    Sort and Filter run over the Arrays in memory.                   #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - Virtual Mode (JS Data Files for large Tables)             #
+#######################################################################
+import os
+import json
+
+
+###########################################################################
+# Defaults                                                                #
+###########################################################################
+BlockSize = 1024 * 1024
+VirtRows = 1000
+
+SortTable = "<table class=\"sortable\" border=1 cellpadding=5 width=100%>"
+TopTable = "<table class=\"sortable\" valign=top border=1 cellpadding=5 width=100%>"
+
+PreIOC = " <b><font color=red>"
+PostIOC = "</font></b> "
+VTSearch = "https://www.virustotal.com/#/search/"
+
+
+###########################################################################
+# Buffered Report File - Same write/close as a file, but the HTML is      #
+#  joined and written in BlockSize blocks                                 #
+###########################################################################
+class ReportFile:
+    def __init__(self, FileName, BlockLen=BlockSize):
+        self.OutFile = open(FileName, "w", encoding='utf8', errors="replace")
+        self.BlockLen = BlockLen
+        self.Blocks = []
+        self.BufLen = 0
+        self.DataDir = None
+        self.DataRef = None
+        self.DataRows = VirtRows
+        self.TblCount = 0
+
+    ###########################################################################
+    # Virtual Mode - DataDir is where the JS Data Files go, DataRef is the    #
+    #  same Directory relative to the Report (for the <script> tags)          #
+    ###########################################################################
+    def Virtual(self, DataDir, DataRef, DataRows=VirtRows):
+        if not os.path.isdir(DataDir):
+            os.makedirs(DataDir)
+
+        for DataName in os.listdir(DataDir):
+            if DataName.startswith("Tbl") and DataName.endswith(".js"):
+                os.remove(os.path.join(DataDir, DataName))
+
+        self.DataDir = DataDir
+        self.DataRef = DataRef
+        self.DataRows = DataRows
+
+    def write(self, OutText):
+        self.Blocks.append(OutText)
+        self.BufLen += len(OutText)
+        if self.BufLen >= self.BlockLen:
+            self.flush()
+
+    def flush(self):
+        if self.Blocks:
+            self.OutFile.write("".join(self.Blocks))
+            self.Blocks = []
+            self.BufLen = 0
+
+    def close(self):
+        self.flush()
+        self.OutFile.close()
+
+
+###########################################################################
+# IOC Highlighting for Report Text that is not in a Table Row             #
+###########################################################################
+def Highlight(Text, IOCGotHit):
+    if IOCGotHit == 1:
+        return PreIOC + Text + PostIOC
+    return " " + Text + " "
+
+
+###########################################################################
+# VirusTotal Search Link for a Cell (IP, Domain, or Hash)                 #
+###########################################################################
+def VTLink(Value, Text=None):
+    if Text is None:
+        Text = Value
+    return "<A href=" + VTSearch + Value + ">" + Text + "</a>"
+
+
+###########################################################################
+# Cell Attributes: A Width ("20%"), or the full Attributes ("valign=top   #
+#  width=20%"), or None for a plain Cell                                  #
+###########################################################################
+def CellAttr(Column):
+    if Column is None:
+        return ""
+    if "=" in Column:
+        return " " + Column
+    return " width=" + Column
+
+
+###########################################################################
+# Top Aligned Cells for the (Multi-Line) Chainsaw Tables                  #
+###########################################################################
+def TopAlign(*Widths):
+    return tuple("valign=top width=" + Width for Width in Widths)
+
+
+def Literal(Text):
+    return Text.replace("{", "{{").replace("}", "}}")
+
+
+###########################################################################
+# Build one Row Template - Cell Values are filled in with str.format      #
+###########################################################################
+def RowTemplate(Columns, RowTag, CellTag, CellPre, CellPost):
+    RowCells = []
+    for ColIndx, Column in enumerate(Columns):
+        RowCells.append(Literal("<" + CellTag + CellAttr(Column) + ">" + CellPre)
+                        + "{" + str(ColIndx) + "}"
+                        + Literal(CellPost + "</" + CellTag + ">"))
+
+    return Literal(RowTag) + "\n".join(RowCells) + "</tr>\n"
+
+
+###########################################################################
+# Report Table:                                                           #
+#  Columns  - One entry per Cell (See CellAttr)                           #
+#  IOCMatch - Highlight (and Count) the rows that hit an IOC              #
+#  HeadRow  - 1 if the first row Added is the (CSV) Header Row            #
+#                                                                         #
+#  In Virtual Mode the Table HTML is held (Pending) until the Table has   #
+#   more than DataRows Rows - Then the Rows move to a JS Data File and    #
+#   only a placeholder is written to the Report                           #
+###########################################################################
+class ReportTable:
+    def __init__(self, OutFile, Columns, IOCMatch=None, HeadRow=0, RowTag="<tr>", TableTag=SortTable):
+        self.OutFile = OutFile
+        self.Columns = Columns
+        self.IOCMatch = IOCMatch
+        self.HeadRow = HeadRow
+        self.RowTag = RowTag
+        self.TableTag = TableTag
+        self.RowCount = 0
+
+        self.PlainRow = RowTemplate(Columns, RowTag, "td", " ", " ")
+        self.HitRow = RowTemplate(Columns, RowTag, "td", PreIOC, PostIOC)
+        self.PlainHead = RowTemplate(Columns, "<tr>", "th", " ", "  (+/-)")
+        self.HitHead = RowTemplate(Columns, "<tr>", "th", PreIOC, PostIOC + " (+/-)")
+
+        self.Virtual = OutFile.DataDir is not None
+        self.Pending = []
+        self.Kept = []
+        self.DataFile = None
+        self.HeadHTML = ""
+
+        self.Write(TableTag + "\n")
+
+    ###########################################################################
+    # Table HTML goes to the Report, or is held while the Table may still     #
+    #  move to a Data File (Virtual Mode)                                     #
+    ###########################################################################
+    def Write(self, OutText):
+        if self.DataFile is not None:
+            return
+        if self.Virtual:
+            self.Pending.append(OutText)
+        else:
+            self.OutFile.write(OutText)
+
+    def Keep(self, DataRow):
+        if self.DataFile is not None:
+            self.DataFile.write(json.dumps(DataRow, ensure_ascii=False, separators=(",", ":")) + ",\n")
+        elif self.Virtual:
+            self.Kept.append(DataRow)
+            if len(self.Kept) > self.OutFile.DataRows:
+                self.Spill()
+
+    ###########################################################################
+    # Move the Table to a JS Data File:                                       #
+    #  AchVirt.Load(Id, Options, [[Hit, Cell, Cell...], ...])                 #
+    #   Hit is 1 for an IOC Hit, +2 for a Span (Colspan) Row                  #
+    ###########################################################################
+    def Spill(self):
+        self.OutFile.TblCount += 1
+        TblId = "Tbl{:04d}".format(self.OutFile.TblCount)
+
+        TblOpts = {"Table": self.TableTag.replace("sortable", "virtual"),
+                   "Head": self.HeadHTML,
+                   "Row": self.RowTag,
+                   "Attrs": [CellAttr(Column) for Column in self.Columns]}
+
+        self.DataFile = open(os.path.join(self.OutFile.DataDir, TblId + ".js"), "w", encoding='utf8', errors="replace")
+        self.DataFile.write("AchVirt.Load(\"" + TblId + "\", " + json.dumps(TblOpts, ensure_ascii=False) + ", [\n")
+        for DataRow in self.Kept:
+            self.DataFile.write(json.dumps(DataRow, ensure_ascii=False, separators=(",", ":")) + ",\n")
+
+        self.OutFile.write("<div class=\"virtual\" id=" + TblId + "></div>\n")
+        self.OutFile.write("<script src=\"" + self.OutFile.DataRef + "/" + TblId + ".js\"></script>\n")
+
+        self.Pending = []
+        self.Kept = []
+
+    ###########################################################################
+    # Fixed Column Titles (Instead of a Header Row from the Input)            #
+    ###########################################################################
+    def Titles(self, Titles):
+        HeadCells = []
+        for Column, Title in zip(self.Columns, Titles):
+            HeadCells.append("<th" + CellAttr(Column) + "> " + Title + " (+/-)</th>")
+        self.HeadHTML = "<tr>" + "\n".join(HeadCells) + "</tr>"
+        self.Write("<thead>" + self.HeadHTML + "</thead><tbody>\n")
+
+    ###########################################################################
+    # Add a Row - RowString is what is checked for IOCs (Default: the Cells)  #
+    #  Without an IOCMatch the caller can pass IOCGotHit=1 to Highlight it    #
+    #  Returns 1 if the Row hit an IOC                                        #
+    ###########################################################################
+    def Add(self, Cells, RowString=None, IOCGotHit=0):
+        if self.IOCMatch is not None:
+            if RowString is None:
+                RowString = ' '.join(Cells)
+            IOCGotHit = self.IOCMatch.Check(RowString)
+
+        if self.HeadRow == 1 and self.RowCount == 0:
+            if IOCGotHit == 1:
+                self.HeadHTML = self.HitHead.format(*Cells)
+            else:
+                self.HeadHTML = self.PlainHead.format(*Cells)
+            self.Write("<thead>\n" + self.HeadHTML + "</thead><tbody>\n")
+        else:
+            if IOCGotHit == 1:
+                self.Write(self.HitRow.format(*Cells))
+            else:
+                self.Write(self.PlainRow.format(*Cells))
+            self.Keep([IOCGotHit] + list(Cells))
+
+        self.RowCount += 1
+        return IOCGotHit
+
+    ###########################################################################
+    # Add a Span Row - One left aligned Cell across the whole Table           #
+    ###########################################################################
+    def Span(self, Text, IOCGotHit=0):
+        self.Write("<tr><td Colspan=\"" + str(len(self.Columns)) + "\" style=\"text-align:left\" width=100%>" + Highlight(Text, IOCGotHit) + "</td></tr>\n")
+        self.Keep([IOCGotHit + 2, Text])
+        self.RowCount += 1
+
+    def Close(self):
+        if self.DataFile is not None:
+            self.DataFile.write("]);\n")
+            self.DataFile.close()
+            self.DataFile = None
+            return
+
+        self.Write("</tbody></table>\n")
+        if self.Virtual:
+            self.OutFile.write("".join(self.Pending))
+            self.Pending = []
+            self.Kept = []
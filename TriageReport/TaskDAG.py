@@ -0,0 +1,129 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Dependency Aware Task Scheduler for the TriageReport Tools        #
+#    The external tools (RegRipper, WinPrefetchView, Wevtutil,        #
+#    LogParser, RBCmd, MFTDump/MFTECmd) are independent of each       #
+#    other, so they are launched as soon as the Tasks they Need are   #
+#    done, up to Workers at a time.  The Report only Waits for the    #
+#    Tasks whose output a Section is about to read.                   #
+#                                                                     #
+#   A Task is a Command Line (Run through the shell, like os.system)  #
+#    or a Python function (For steps like caching a Tool's output).   #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#######################################################################
+import os
+import time
+import threading
+import subprocess
+import concurrent.futures
+
+
+###########################################################################
+# One Task - ExitCode is None until the Task is Done                      #
+###########################################################################
+class DAGTask:
+    def __init__(self, Name, Action, Needs):
+        self.Name = Name
+        self.Action = Action
+        self.Needs = Needs
+        self.Waiting = set()
+        self.Children = []
+        self.ExitCode = None
+        self.Duration = 0.0
+        self.Done = threading.Event()
+
+
+class TaskDAG:
+    def __init__(self, Workers=0):
+        if Workers < 1:
+            Workers = os.cpu_count() or 1
+
+        self.Workers = Workers
+        self.Pool = concurrent.futures.ThreadPoolExecutor(max_workers=Workers)
+        self.Tasks = {}
+        self.Order = []
+        self.Lock = threading.Lock()
+
+    ###########################################################################
+    # Add a Task - Needs are the Names of Tasks that must finish first.       #
+    #  A Need that was never Added (Tool or Source not found) is ignored.     #
+    ###########################################################################
+    def Add(self, Name, Action, Needs=()):
+        NewTask = DAGTask(Name, Action, Needs)
+
+        with self.Lock:
+            self.Tasks[Name] = NewTask
+            self.Order.append(NewTask)
+
+            for NeedName in Needs:
+                NeedTask = self.Tasks.get(NeedName)
+                if NeedTask is not None and not NeedTask.Done.is_set():
+                    NewTask.Waiting.add(NeedName)
+                    NeedTask.Children.append(NewTask)
+
+            if not NewTask.Waiting:
+                self.Pool.submit(self.RunTask, NewTask)
+
+        return Name
+
+    ###########################################################################
+    # Run a Task (In a Worker Thread), then release the Tasks waiting on it   #
+    ###########################################################################
+    def RunTask(self, CurTask):
+        StartTime = time.time()
+
+        try:
+            if callable(CurTask.Action):
+                CurTask.Action()
+                CurTask.ExitCode = 0
+            else:
+                CurTask.ExitCode = subprocess.run(CurTask.Action, shell=True).returncode
+        except Exception as TaskErr:
+            print("[!] Task Failed: " + CurTask.Name + " (" + str(TaskErr) + ")")
+            CurTask.ExitCode = -1
+
+        CurTask.Duration = time.time() - StartTime
+
+        with self.Lock:
+            CurTask.Done.set()
+            for ChildTask in CurTask.Children:
+                ChildTask.Waiting.discard(CurTask.Name)
+                if not ChildTask.Waiting:
+                    self.Pool.submit(self.RunTask, ChildTask)
+
+    ###########################################################################
+    # Block until the Named Tasks are Done (Unknown Names do not block)       #
+    #  Returns the Exit Code of the last one (None if it was never Added)     #
+    ###########################################################################
+    def Wait(self, *Names):
+        ExitCode = None
+        for Name in Names:
+            CurTask = self.Tasks.get(Name)
+            if CurTask is None:
+                ExitCode = None
+            else:
+                CurTask.Done.wait()
+                ExitCode = CurTask.ExitCode
+        return ExitCode
+
+    ###########################################################################
+    # Wait for every Task, show the Exit Codes and Durations, and stop the    #
+    #  Worker Threads                                                         #
+    ###########################################################################
+    def Close(self):
+        for CurTask in self.Order:
+            CurTask.Done.wait()
+
+        if self.Order:
+            print("[+] Tool Tasks (" + str(self.Workers) + " Workers):")
+            for CurTask in self.Order:
+                if CurTask.ExitCode == 0:
+                    print("[+]   " + CurTask.Name + ": {:.1f}s".format(CurTask.Duration))
+                else:
+                    print("[!]   " + CurTask.Name + ": {:.1f}s".format(CurTask.Duration) + " (Exit Code: " + str(CurTask.ExitCode) + ")")
+
+        self.Pool.shutdown(wait=True)
@@ -0,0 +1,145 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Timestamp Normalization for ts_Transform and TriageReport         #
+#    One Parser per Tool Date Format, by String Slicing instead of    #
+#    strptime, each with a bounded Memo (Tool Dates repeat a lot -    #
+#    one Browser Visit or Prefetch Run Time is on many Rows).         #
+#                                                                     #
+#   Every Parser returns ISO 8601 (UTC, YYYY-MM-DDTHH:MM:SS[.ffffff]  #
+#    - No Offset Suffix, as the Timesketch CSVs have always been      #
+#    written), or NoDataTime for a Blank or Bad Date.                 #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#   v0.02 - EpochMicros - Numeric Timestamp for the OpenSearch Bulk   #
+#           Documents                                                 #
+#   v0.03 - ZoneTime: A Date that is already UTC is Checked by        #
+#           fromisoformat and Sliced, not Rebuilt from its Fields     #
+#######################################################################
+import datetime
+import functools
+
+
+# The Timestamp written when a Row has No (Valid) Date
+NoDataTime = "1900-01-01T19:01:01"
+
+# Distinct Dates kept per Parser
+MemoSize = 65536
+
+IsoCheck = datetime.datetime.fromisoformat
+
+
+###########################################################################
+# Nirsoft (WinPrefetchView, LastActivityView, BrowsingHistoryView,        #
+#  BrowserDownloadsView) and Sysinternals Autoruns:                       #
+#  MM/DD/YYYY hh:mm:ss AM|PM  (Autoruns has no Seconds: hh:mm AM|PM)      #
+#  - Nirsoft Dates are the Local Time of the machine that ran the tool,   #
+#    they are passed through as they are (The Report says so)             #
+###########################################################################
+@functools.lru_cache(maxsize=MemoSize)
+def NirsoftTime(TimeText):
+    try:
+        DatePart, TimePart, AmPm = TimeText.split(" ")
+        MonText, DayText, YearText = DatePart.split("/")
+        TimeVals = TimePart.split(":")
+
+        Hour = int(TimeVals[0])
+        if Hour < 1 or Hour > 12 or len(TimeVals) not in (2, 3):
+            return NoDataTime
+
+        AmPm = AmPm.upper()
+        if AmPm == "PM":
+            Hour = Hour % 12 + 12
+        elif AmPm == "AM":
+            Hour = Hour % 12
+        else:
+            return NoDataTime
+
+        if len(TimeVals) == 3:
+            Second = int(TimeVals[2])
+        else:
+            Second = 0
+
+        return datetime.datetime(int(YearText), int(MonText), int(DayText), Hour, int(TimeVals[1]), Second).isoformat()
+    except ValueError:
+        return NoDataTime
+
+
+###########################################################################
+# Eric Zimmerman Tools (LECmd --dt "yyyy-MM-dd HH:mm:ss K", SrumECmd),    #
+#  Chainsaw and Hayabusa:  YYYY-MM-DD[ T]HH:MM:SS[.fffffff][ ][Z|+-HH:MM] #
+#  - A Date with an Offset is moved to UTC, one without is already UTC    #
+###########################################################################
+@functools.lru_cache(maxsize=MemoSize)
+def ZoneTime(TimeText):
+    if len(TimeText) < 19 or TimeText[4] != "-" or TimeText[7] != "-" or TimeText[10] not in " T" or TimeText[13] != ":" or TimeText[16] != ":":
+        return NoDataTime
+
+    try:
+        Micro = 0
+        ZoneText = TimeText[19:]
+        if ZoneText.startswith("."):
+            FracText = ZoneText[1:]
+            ZoneText = FracText.lstrip("0123456789")
+            FracText = FracText[:len(FracText) - len(ZoneText)]
+            Micro = int((FracText + "000000")[:6])
+
+        OffMins = 0
+        ZoneText = ZoneText.strip()
+        if ZoneText not in ("", "Z", "UTC"):
+            if ZoneText[0] not in "+-" or len(ZoneText) not in (5, 6):
+                return NoDataTime
+            OffMins = int(ZoneText[1:3]) * 60 + int(ZoneText[-2:])
+            if ZoneText[0] == "-":
+                OffMins = -OffMins
+
+        # Already UTC: The Date is only Checked (fromisoformat is in C), the
+        #  ISO Text is Sliced - The same Text isoformat() would write.  Text
+        #  it rejects is Rebuilt from its Fields below, as before
+        if OffMins == 0:
+            IsoText = TimeText[:10] + "T" + TimeText[11:19]
+            try:
+                IsoCheck(IsoText)
+                if Micro != 0:
+                    return IsoText + "." + str(Micro).zfill(6)
+                return IsoText
+            except ValueError:
+                pass
+
+        TimeStamp = datetime.datetime(int(TimeText[0:4]), int(TimeText[5:7]), int(TimeText[8:10]),
+                                      int(TimeText[11:13]), int(TimeText[14:16]), int(TimeText[17:19]), Micro)
+        if OffMins != 0:
+            TimeStamp = TimeStamp - datetime.timedelta(minutes=OffMins)
+
+        return TimeStamp.isoformat()
+    except (ValueError, OverflowError):
+        return NoDataTime
+
+
+###########################################################################
+# Report Cell: The Normalized Date as the Report shows Dates (YYYY-MM-DD  #
+#  HH:MM:SS, like the $MFT and Event Log Sections) - Text that is not a   #
+#  Date (A Header Row, a Blank) is shown as it is                         #
+###########################################################################
+def ShowTime(TimeParse, TimeText):
+    IsoText = TimeParse(TimeText)
+    if IsoText == NoDataTime:
+        return TimeText
+    return IsoText.replace("T", " ", 1)
+
+
+###########################################################################
+# Epoch Microseconds (The Timesketch "timestamp" Field) for a Normalized  #
+#  ISO 8601 UTC Date from one of the Parsers above                        #
+###########################################################################
+EpochTime = datetime.datetime(1970, 1, 1)
+
+
+@functools.lru_cache(maxsize=MemoSize)
+def EpochMicros(IsoText):
+    try:
+        return (datetime.datetime.fromisoformat(IsoText) - EpochTime) // datetime.timedelta(microseconds=1)
+    except (ValueError, TypeError):
+        return (datetime.datetime.fromisoformat(NoDataTime) - EpochTime) // datetime.timedelta(microseconds=1)
@@ -0,0 +1,196 @@
+#######################################################################
+# Version: beta v0.01 (Python 3.x)                                    #
+# Author.: David Porco                                                #
+# Release: NA                                                         #
+#                                                                     #
+#   Super Timeline for ts_Transform - Every ts_*.csv in the Timeline  #
+#    Directory Merged into one Chronological Super_Timeline.csv       #
+#                                                                     #
+#   External Sort: Each ts File is read once, its Rows are Sorted in  #
+#    Runs of at most RunRows Rows (Or RunBytes) and written to Run    #
+#    Files, then all the Runs are k-way Merged (heapq) - Only one Run #
+#    is ever in Memory, no matter how big the Input is.  More than    #
+#    MergeWays Runs are Merged in Passes (Bounded Open Files).        #
+#                                                                     #
+#   The Time Window (TimeFrom <= datetime < TimeUpto) is applied as   #
+#    the Runs are built, so Rows outside it are never Sorted.         #
+#    Dates go through TimeNorm, so every Source Sorts the same way.   #
+#                                                                     #
+#   v0.01 - Initial Release                                           #
+#######################################################################
+import os
+import csv
+import glob
+import heapq
+import shutil
+import operator
+import CSVChunk
+import TimeNorm
+
+
+RunRows = 500000
+RunBytes = 64 * 1024 * 1024
+MergeWays = 64
+
+SuperHead = ("datetime", "timestamp_desc", "data_type", "message", "timeline")
+
+
+###########################################################################
+# Time Window Bound (MrgFrom:/MrgUpto:) - A Date alone is Midnight.       #
+#  Returns "" (No Bound) for Blank or Bad Text                            #
+###########################################################################
+def WindowTime(TimeText):
+    TimeText = TimeText.strip()
+    if len(TimeText) == 10:
+        TimeText = TimeText + " 00:00:00"
+    if TimeText == "":
+        return ""
+
+    IsoText = TimeNorm.ZoneTime(TimeText)
+    if IsoText == TimeNorm.NoDataTime:
+        print("[!] Invalid Time Window Date (YYYY-MM-DD HH:MM:SS): " + TimeText)
+        return ""
+    return IsoText
+
+
+###########################################################################
+# Sort the Rows in Memory and write them as one Run File                  #
+###########################################################################
+def WriteRun(RunBuff, RunDir, RunNames):
+    RunBuff.sort(key=operator.itemgetter(0))
+
+    RunName = os.path.join(RunDir, "Run_" + str(len(RunNames) + 1).zfill(6) + ".csv")
+    with open(RunName, "w", encoding='utf8', errors="replace", newline='') as RunFile:
+        csv.writer(RunFile).writerows(RunBuff)
+
+    RunNames.append(RunName)
+
+
+###########################################################################
+# Build the Sorted Runs for one ts File - Returns (Rows Kept, Rows Left   #
+#  out by the Time Window).  NoData Rows (No Input) are not Events, and   #
+#  are left out.                                                          #
+###########################################################################
+def SourceRuns(CSVName, RunDir, RunNames, TimeFrom="", TimeUpto="", RunMax=RunRows):
+    Timeline = os.path.splitext(os.path.basename(CSVName))[0]
+    RowsKept = RowsSkip = 0
+    RunBuff = []
+    BuffBytes = 0
+    ZoneTime = TimeNorm.ZoneTime
+
+    CSVRows = CSVChunk.ReadCSV(CSVName)
+    HeadRow = next(CSVRows, None)
+    if HeadRow is None or "datetime" not in HeadRow:
+        print("[!] No datetime Column, Not in the Super Timeline: " + os.path.basename(CSVName))
+        return 0, 0
+
+    TimeCol = HeadRow.index("datetime")
+    DescCol = HeadRow.index("timestamp_desc") if "timestamp_desc" in HeadRow else None
+    TypeCol = HeadRow.index("data_type") if "data_type" in HeadRow else None
+    MesgCol = HeadRow.index("message") if "message" in HeadRow else None
+    MinCols = max(Col for Col in (TimeCol, DescCol, TypeCol, MesgCol) if Col is not None)
+
+    for csvrow in CSVRows:
+        if len(csvrow) <= MinCols:
+            continue
+
+        DataType = csvrow[TypeCol] if TypeCol is not None else ""
+        if DataType.startswith("NoData"):
+            continue
+
+        RowTime = ZoneTime(csvrow[TimeCol])
+        if (TimeFrom and RowTime < TimeFrom) or (TimeUpto and RowTime >= TimeUpto):
+            RowsSkip += 1
+            continue
+
+        Message = csvrow[MesgCol] if MesgCol is not None else ""
+        RunBuff.append((RowTime, csvrow[DescCol] if DescCol is not None else "", DataType, Message, Timeline))
+        BuffBytes += len(Message) + 96
+        RowsKept += 1
+
+        if len(RunBuff) >= RunMax or BuffBytes >= RunBytes:
+            WriteRun(RunBuff, RunDir, RunNames)
+            RunBuff = []
+            BuffBytes = 0
+
+    if RunBuff:
+        WriteRun(RunBuff, RunDir, RunNames)
+
+    return RowsKept, RowsSkip
+
+
+###########################################################################
+# Read a Run File back, one Row at a time                                 #
+###########################################################################
+def ReadRun(RunName):
+    with open(RunName, "r", encoding='utf8', errors="replace", newline='') as RunFile:
+        yield from csv.reader(RunFile)
+
+
+###########################################################################
+# k-way Merge of Sorted Runs (heapq) into OutName - Equal Times keep the  #
+#  Run Order.  Returns the Row Count                                      #
+###########################################################################
+def MergeRuns(RunNames, OutName, WithHead=False):
+    reccount = 0
+    with open(OutName, "w", encoding='utf8', errors="replace", newline='') as csvoutf:
+        if WithHead:
+            csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL)
+            csvwrite.writerow(SuperHead)
+        else:
+            csvwrite = csv.writer(csvoutf)
+
+        for csvrow in heapq.merge(*[ReadRun(RunName) for RunName in RunNames], key=operator.itemgetter(0)):
+            csvwrite.writerow(csvrow)
+            reccount = reccount + 1
+
+    return reccount
+
+
+###########################################################################
+# Build the Super Timeline from every ts_*.csv in TimelineDir             #
+###########################################################################
+def SuperTimeline(TimelineDir, OutName="Super_Timeline.csv", TimeFrom="", TimeUpto="", RunMax=RunRows):
+    TimeFrom = WindowTime(TimeFrom)
+    TimeUpto = WindowTime(TimeUpto)
+    if TimeFrom or TimeUpto:
+        print("[+] Super Timeline Window: " + (TimeFrom or "Start") + " to " + (TimeUpto or "End"))
+
+    RunDir = os.path.join(TimelineDir, "SuperRuns")
+    if os.path.isdir(RunDir):
+        shutil.rmtree(RunDir, ignore_errors=True)
+    os.makedirs(RunDir, exist_ok=True)
+
+    RunNames = []
+    for CSVName in sorted(glob.glob(os.path.join(TimelineDir, "ts_*.csv"))):
+        RowsKept, RowsSkip = SourceRuns(CSVName, RunDir, RunNames, TimeFrom, TimeUpto, max(RunMax, 1000))
+        if RowsSkip > 0:
+            print("[+] Super Timeline: " + os.path.basename(CSVName) + " - " + str(RowsKept) + " Rows (" + str(RowsSkip) + " outside the Time Window)")
+        else:
+            print("[+] Super Timeline: " + os.path.basename(CSVName) + " - " + str(RowsKept) + " Rows")
+
+    ###########################################################################
+    # Merge Passes - No more than MergeWays Runs are open at once             #
+    ###########################################################################
+    PassNum = 0
+    while len(RunNames) > MergeWays:
+        PassNum = PassNum + 1
+        PassRuns = []
+        for GrpStart in range(0, len(RunNames), MergeWays):
+            GrpRuns = RunNames[GrpStart:GrpStart + MergeWays]
+            if len(GrpRuns) == 1:
+                PassRuns.append(GrpRuns[0])
+                continue
+
+            PassName = os.path.join(RunDir, "Pass" + str(PassNum) + "_" + str(len(PassRuns) + 1).zfill(6) + ".csv")
+            MergeRuns(GrpRuns, PassName)
+            for RunName in GrpRuns:
+                os.remove(RunName)
+            PassRuns.append(PassName)
+        RunNames = PassRuns
+
+    reccount = MergeRuns(RunNames, os.path.join(TimelineDir, OutName), WithHead=True)
+    shutil.rmtree(RunDir, ignore_errors=True)
+
+    print("[+] Super Timeline Rows: " + str(reccount) + " (" + OutName + ")")
+    return reccount
@@ -13,6 +13,34 @@
 #           This is for eventual cross platform support               #
 #           IMPORTANT NOTE: removing preceeding path separators [1:]  #
 #           was REQUIRED to make os.path.join work properly           #
+#   v0.05 - Read Prefetch, LNK, and Browser rows from the TriageReport#
+#           Artifact Cache (ArtCache) when it is current              #
+#   v0.06 - Stream the $MFT (Native Parser) to Timesketch - One row   #
+#           per distinct MACB Timestamp, Sharded by MFTShrd:n rows    #
+#   v0.07 - EvtShrd:n - Run Chainsaw and Hayabusa n at a time over    #
+#           Size Balanced Event Log Shards, then Merge (ToolShard)    #
+#   v0.08 - Sigma False Positive Suppression Table (SigSupp:) Shared  #
+#           with TriageReport (Detections)                            #
+#   v0.09 - Declarative Transforms (ts_Engine) - One Spec per         #
+#           Artifact, written by csv.writer (QUOTE_ALL) - Values are  #
+#           passed through intact                                     #
+#   v0.10 - ArtJobs:n - Run the Artifact Transforms as Jobs, n at a   #
+#           time in a Process Pool - Transform_Summary.csv has the    #
+#           Rows, Bytes, and Seconds of each Job                      #
+#   v0.11 - Every Date Column goes through TimeNorm (Slicing with a   #
+#           Memo, not strptime) - LNK, SRUM, and Chainsaw Dates are   #
+#           Normalized to ISO 8601 UTC too                            #
+#   v0.12 - BulkIdx: - Also write OpenSearch _bulk NDJSON (gzip       #
+#           Batches of BulkMBs:) - BulkURL: Uploads them (BulkCon:    #
+#           at a time, with Retries)                                  #
+#   v0.13 - SuperTL:Yes - Super_Timeline.csv: Every ts_*.csv Merged   #
+#           by Time (ts_Merge - Sorted Runs, then a k-way Merge),     #
+#           MrgFrom:/MrgUpto: Time Window                             #
+#   v0.14 - DedupTL:Yes - Drop Duplicate Events across the ts Files   #
+#           (ts_Dedup - 64 Bit Fingerprints in a Compact Hash Set or  #
+#           Bloom Filter) - Duplicates Dropped per Job in the Summary #
+#   v0.15 - BulkTID: - Timesketch Timeline ID in the Bulk Documents   #
+#           (with the Epoch Microsecond timestamp)                    #
 ####################################################################### 
 import os, stat
 import sys
@@ -24,7 +52,16 @@ import requests
 import glob
 import shutil
 import datetime
+import concurrent.futures
 from zipfile import ZipFile
+import ArtCache
+import MFTParse
+import ToolShard
+import Detections
+import ts_Engine
+import BulkSink
+import ts_Merge
+import ts_Dedup
 
 parser = argparse.ArgumentParser(description="Format Triage Collection Output for Timesketch")
 parser.add_argument("-d", dest="dirname", 
@@ -43,6 +80,593 @@ dirleft, diright = os.path.split(dirname)
 dirtrge = os.path.join(dirleft, "Timelines", diright)
 
 
+###########################################################################
+# Artifact Jobs - Each Transform is one Job: JobCfg (The Config Settings) #
+#  in, (Rows, Output Files) out.  They read different inputs and write    #
+#  different ts_*.csv Files, so ArtJobs:n runs them n at a time in a      #
+#  Process Pool, and the External Tools they launch run alongside the     #
+#  Python Transforms                                                      #
+###########################################################################
+def JobBulk(JobCfg, filnout):
+    # The OpenSearch _bulk Batches for filnout (None when BulkIdx: is not set)
+    if JobCfg["BulkIdx"] == "":
+        return None
+    return BulkSink.BulkWriter(os.path.join(dirtrge, "Bulk"), JobCfg["BulkIdx"], filnout, JobCfg["BulkMBs"] * 1048576, JobCfg["BulkTID"])
+
+
+###########################################################################
+# Parse Prefetch Files                                                    #
+###########################################################################
+def JobPrefetch(JobCfg):
+    Prefetc = JobCfg["Prefetc"]
+    ArtCDir = JobCfg["ArtCDir"]
+
+    print("[+] Generating Prefetch Data...")
+    exeName = os.path.join(dirleft, "SYS", "WinPrefetchView.exe")
+    PrfSig = ArtCache.SourceSig([os.path.join(dirname, Prefetc[1:])], "WinPrefetchView")
+
+    if ArtCache.IsCached(ArtCDir, "Prefetch", PrfSig):
+        print("[+] Using Cached Prefetch Data (Artifact Cache)...")
+    elif os.path.isfile(exeName):
+        if os.path.isdir(os.path.join(dirname, Prefetc[1:])):
+            cmdexec = exeName + " /folder " + os.path.join(dirname, Prefetc[1:]) + " /scomma  " + os.path.join(dirtrge, "WinPrefetchview.csv")
+            returned_value = os.system(cmdexec)
+        else:
+            print("[!] Prefetch Data Not Found in the Collection: " + os.path.join(dirname, Prefetc[1:]))
+    else:
+        print("[!] WinPrefetchView Not Found...")
+
+    ###########################################################################
+    # Transform Prefetch CSV for Timesketch                                   #
+    ###########################################################################
+    filname = os.path.join(dirtrge, "WinPrefetchview.csv")
+    filnout = os.path.join(dirtrge, "ts_prefetchview.csv")
+    ArtRows = ArtCache.CachedCSV(ArtCDir, "Prefetch", PrfSig, filname)
+
+    if ArtRows is not None:
+        return ts_Engine.WriteCSV(filnout, ts_Engine.PrefetchSpec, ArtRows, Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Prefetch Data ...")
+    return 0, []
+
+
+###########################################################################
+# Transform the $MFT for Timesketch (Native Parser - No Plaso Run)        #
+#  One row per distinct MACB Timestamp in $SI and $FN.  Rows are written  #
+#  as the $MFT is walked, and a new ts_mft_nnn.csv is started every       #
+#  MFTShrd rows (MFTShrd:0 writes everything to ts_mft.csv)               #
+###########################################################################
+def JobMFT(JobCfg):
+    MFTFile = JobCfg["MFTFile"]
+    MFTShrd = JobCfg["MFTShrd"]
+
+    print("[+] Transforming $MFT Information...")
+
+    reccount = 0
+    shrdcount = 0
+    MFTHead = ("datetime", "message", "timestamp_desc", "data_type", "macb", "attribute", "filename", "file_size", "deleted", "is_directory", "mft_entry")
+    shrdrows = 0
+    OutFiles = []
+    filname = os.path.join(dirname, MFTFile[1:])
+
+    for filnout in glob.glob(os.path.join(dirtrge, "ts_mft*.csv")):
+        os.remove(filnout)
+
+    if not os.path.isfile(filname):
+        print("[!] Bypassing $MFT Transform (No Input Data) ...")
+        return 0, []
+
+    csvoutf = None
+    Bulk = None
+    for ISOTime, Attr, MACB, RecNum, InUse, IsDir, FullPath, DataSize in MFTParse.MFTTimeline(filname):
+        if csvoutf is None or (MFTShrd > 0 and shrdrows >= MFTShrd):
+            if csvoutf is not None:
+                csvoutf.close()
+            if Bulk is not None:
+                Bulk.Close()
+
+            if MFTShrd > 0:
+                shrdcount = shrdcount + 1
+                filnout = os.path.join(dirtrge, "ts_mft_" + str(shrdcount).zfill(3) + ".csv")
+            else:
+                filnout = os.path.join(dirtrge, "ts_mft.csv")
+
+            csvoutf = open(filnout, "w", encoding='utf8', errors="replace", newline='')
+            csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL)
+            csvwrite.writerow(MFTHead)
+            OutFiles.append(filnout)
+            shrdrows = 0
+
+            Bulk = JobBulk(JobCfg, filnout)
+            if Bulk is not None:
+                Bulk.Head(MFTHead)
+
+        if InUse:
+            Deleted = "No"
+        else:
+            Deleted = "Yes"
+
+        if IsDir:
+            IsDirectory = "Yes"
+        else:
+            IsDirectory = "No"
+
+        MFTRow = (ISOTime, MACB + " " + Attr + " " + FullPath, "mft_" + Attr[1:].lower() + "_macb", "mft:" + Attr[1:].lower(),
+                  MACB, Attr, FullPath, DataSize, Deleted, IsDirectory, RecNum)
+        csvwrite.writerow(MFTRow)
+        if Bulk is not None:
+            Bulk.Add(MFTRow)
+
+        shrdrows = shrdrows + 1
+        reccount = reccount + 1
+
+    if reccount < 1:
+        print("[!] No Records Processed: " + dirname)
+        csvoutf = open(os.path.join(dirtrge, "ts_mft.csv"), "w", encoding='utf8', errors="replace", newline='')
+        csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL)
+        csvwrite.writerow(MFTHead)
+        csvwrite.writerow((ts_Engine.NoDataTime, "No Data Parsed From Input", "NoData", "NoData:Input") + ("NoData",) * 7)
+        OutFiles.append(os.path.join(dirtrge, "ts_mft.csv"))
+
+        Bulk = JobBulk(JobCfg, os.path.join(dirtrge, "ts_mft.csv"))
+        if Bulk is not None:
+            Bulk.Head(MFTHead)
+            Bulk.Add((ts_Engine.NoDataTime, "No Data Parsed From Input", "NoData", "NoData:Input") + ("NoData",) * 7)
+    else:
+        print("[+] Records Processed: " + str(reccount))
+
+    csvoutf.close()
+    if Bulk is not None:
+        Bulk.Close()
+    return reccount, OutFiles
+
+
+###########################################################################
+# Write AutoRuns (Use Python CSV Reader Module)                           #
+###########################################################################
+def JobAutoRuns(JobCfg):
+    AutoRun = JobCfg["AutoRun"]
+
+    print("[+] Transforming Autoruns Information...")
+
+    filname = os.path.join(dirname, AutoRun[1:])
+    filnout = os.path.join(dirtrge, "ts_autoruns.csv")
+
+    if os.path.isfile(filname):
+        return ts_Engine.WriteCSV(filnout, ts_Engine.AutoRunSpec, ts_Engine.ReadRows(filname), Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Autoruns Transform (No Input Data) ...")
+    return 0, []
+
+
+###########################################################################
+# Parse Desktop and Recent Link Files                                     #
+###########################################################################
+def JobLnkFiles(JobCfg):
+    LNKFile = JobCfg["LNKFile"]
+    ArtCDir = JobCfg["ArtCDir"]
+
+    print("[+] Generating Desktop and Recent LNK Information...")
+
+    print("[+] Checking for Eric Zimmerman LECmd Link Parser...")
+
+    filname = os.path.join(dirtrge, "LNKFiles.csv")
+    filnout = os.path.join(dirtrge, "ts_lnkfiles.csv")
+
+    ###########################################################################
+    # os.path.join will not work if LNKFile starts with a path separator      #
+    # - use [1:] to ignore path separator                                     #
+    ###########################################################################
+    curdir = os.path.join(dirname, LNKFile[1:])
+    LnkSig = ArtCache.SourceSig([curdir], "LECmd")
+
+    exeName = os.path.join(dirleft, "SYS", "LECmd.exe")
+    if ArtCache.IsCached(ArtCDir, "LNKFiles", LnkSig):
+        print("[+] Using Cached LNK File Data (Artifact Cache)...")
+    elif os.path.isfile(exeName):
+        print("[+] LECmd executable found")
+        print("[+] Parsing Desktop and Recent LNK Files from Multiple User Profiles...")
+        cmdexec = exeName + " -q -d " + curdir + " --dt \"yyyy-MM-dd HH:mm:ss K\" --csv " + dirtrge + " --csvf " + filname
+
+        returned_value = os.system(cmdexec)
+
+        print("[+] Reading Desktop and Recent LNK Files from Multiple User Profiles...")
+
+    ArtRows = ArtCache.CachedCSV(ArtCDir, "LNKFiles", LnkSig, filname)
+    if ArtRows is not None:
+        return ts_Engine.WriteCSV(filnout, ts_Engine.LnkFileSpec, ArtRows, Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Link File Transform (No Input Data) ...")
+    return 0, []
+
+
+###########################################################################
+# Write LastActivityView Data (Use Python CSV Reader Module)              #
+###########################################################################
+def JobLastAct(JobCfg):
+    LastAct = JobCfg["LastAct"]
+
+    print("[+] Transforming Last Activity View Information...")
+
+    ###########################################################################
+    # os.path.join will not work if LastAct starts with a path separator      #
+    # - use [1:] to ignore path separator                                     #
+    ###########################################################################
+    filname = os.path.join(dirname, LastAct[1:])
+    filnout = os.path.join(dirtrge, "ts_lastact.csv")
+
+    if os.path.isfile(filname):
+        return ts_Engine.WriteCSV(filnout, ts_Engine.LastActSpec, ts_Engine.ReadRows(filname), Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Last Activity View Transform (No Input Data) ...")
+    return 0, []
+
+
+###########################################################################
+# Write Web Browser Data (Use Python CSV Reader Module)                   #
+###########################################################################
+def JobBrowseHist(JobCfg):
+    Browser = JobCfg["Browser"]
+    ArtCDir = JobCfg["ArtCDir"]
+
+    print("[+] Transforming File and Web Browser Information...")
+
+    ###########################################################################
+    # os.path.join will not work if Browser starts with a path separator      #
+    # - use [1:] to ignore path separator                                     #
+    ###########################################################################
+    filname = os.path.join(dirname, Browser[1:])
+    filnout = os.path.join(dirtrge, "ts_browsehist.csv")
+    BrwSig = ArtCache.SourceSig([filname], "CSV")
+    ArtRows = ArtCache.CachedCSV(ArtCDir, "Browser", BrwSig, filname)
+
+    if ArtRows is not None:
+        return ts_Engine.WriteCSV(filnout, ts_Engine.BrowserSpec, ArtRows, Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Browser History Transform (No Input Data) ...")
+    return 0, []
+
+
+###########################################################################
+# Write Web Browser Downloads (Use Python CSV Reader Module)              #
+###########################################################################
+def JobBrowseDown(JobCfg):
+    Downlod = JobCfg["Downlod"]
+    ArtCDir = JobCfg["ArtCDir"]
+
+    print("[+] Transforming File and Web Browser Downloads...")
+
+    ###########################################################################
+    # os.path.join will not work if Downlod starts with a path separator      #
+    # - use [1:] to ignore path separator                                     #
+    ###########################################################################
+    filname = os.path.join(dirname, Downlod[1:])
+    filnout = os.path.join(dirtrge, "ts_browsedown.csv")
+    DwnSig = ArtCache.SourceSig([filname], "CSV")
+    ArtRows = ArtCache.CachedCSV(ArtCDir, "Downlod", DwnSig, filname)
+
+    if ArtRows is not None:
+        return ts_Engine.WriteCSV(filnout, ts_Engine.DownlodSpec, ArtRows, Bulk=JobBulk(JobCfg, filnout)), [filnout]
+
+    print("[!] Bypassing Browser History Transform (No Input Data) ...")
+    return 0, []
+
+
+###########################################################################
+# Parse SRUM DB                                                           #
+###########################################################################
+def JobSrum(JobCfg):
+    SrumDir = JobCfg["SrumDir"]
+    SysRegs = JobCfg["SysRegs"]
+
+    print("[+] Generating SRUM Data...")
+    exeName = os.path.join(dirleft, "SYS", "SrumECmd.exe")
+
+    if not os.path.isfile(exeName):
+        print("[!] SrumECmd Not Found...")
+        return 0, []
+
+    if not (os.path.isdir(os.path.join(dirname, SrumDir[1:])) and os.path.isfile(os.path.join(dirname, SysRegs[1:], "SOFTWARE"))):
+        print("[!] SRUM or SYSTEM registry Not Found in the Collection: " + dirname + SrumDir)
+        return 0, []
+
+    cmdexec = exeName + " -d " + os.path.join(dirname, "Cache") + " -r " + os.path.join(dirname, "Cache", "SOFTWARE") + " --csv " + os.path.join(dirtrge, "SRUM")
+    returned_value = os.system(cmdexec)
+
+    ###########################################################################
+    # Transform Just the Network activity for Timesketch                      #
+    ###########################################################################
+    print("[+] Processing SRUM Network Usage: SrumECmd_NetworkUsages_Output.csv")
+    reccount = 0
+    filnout = os.path.join(dirtrge, "ts_srumnetusage.csv")
+    for curfile in os.listdir(os.path.join(dirtrge, "SRUM")):
+        if curfile.endswith("SrumECmd_NetworkUsages_Output.csv"):
+            filname = os.path.join(dirtrge, "SRUM", curfile)
+            reccount = ts_Engine.WriteCSV(filnout, ts_Engine.SrumNetSpec, ts_Engine.ReadRows(filname), Bulk=JobBulk(JobCfg, filnout))
+
+    return reccount, [filnout]
+
+
+###########################################################################
+# Run Countercept Chainsaw Program against all .EVTX Files                #
+#                                                                         #
+# IMPORTANT NOTE: This section is coded for Chainsaw v2.9 - Other         #
+#  versions may require modifications to accomodate, since output can     #
+#  change between versions.                                               #
+###########################################################################
+def JobChainsaw(JobCfg):
+    EvtDir1 = JobCfg["EvtDir1"]
+    EvtShrd = JobCfg["EvtShrd"]
+    ShardDirs = JobCfg["ShardDirs"]
+
+    print("[+] Checking for F-Secure Countercept Chainsaw...")
+
+    filnout = os.path.join(dirtrge, "ts_chainsaw.csv")
+
+    if not os.path.isfile(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe")):
+        print("[!] Chainsaw Executable not found!  Bypassing Chainsaw Processing...")
+        return 0, []
+
+    print("[+] Chainsaw executable found")
+    print("[+] Running F-Secure Countercept Chainsaw against all Event Logs...")
+
+    ChSwSubDir = ""
+
+    ###########################################################################
+    # os.path.join will not work if EVTDir1 starts with a path separator      #
+    # - use [1:] to ignore path separator                                     #
+    ###########################################################################
+    EvtName = os.path.join(dirname, EvtDir1[1:])
+    ChSwArgs = " --mapping " + os.path.join(dirleft, "chainsaw", "mappings", "sigma-event-logs-all.yml") + " --rule " + os.path.join(dirleft, "chainsaw", "rules") + " --sigma " + os.path.join(dirleft, "chainsaw", "sigma")
+
+    if EvtShrd > 1 and len(ShardDirs) > 0:
+        ###########################################################################
+        # Sharded: One Chainsaw per Shard (EvtShrd at a time), and the Shard CSVs #
+        #  are Merged into ChainCSV - The same place a single run writes them     #
+        ###########################################################################
+        print("[+] Running Chainsaw over " + str(len(ShardDirs)) + " Event Log Shards...")
+        CmdLines = []
+        for ShardDir in ShardDirs:
+            CmdLines.append(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt " + " --skip-errors --timezone UTC --full --csv --output " + os.path.join(ShardDir, "Chainsaw") + ChSwArgs + " " + os.path.join(ShardDir, ToolShard.ShardEvtx))
+        ToolShard.RunShards(CmdLines, EvtShrd)
+        ToolShard.MergeCSVs(ShardDirs, "Chainsaw", EvtName, os.path.join(dirtrge, "ChainCSV"))
+
+    else:
+        cmdexec = os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt " + " --skip-errors --timezone UTC --full --csv --output " + os.path.join(dirtrge, "ChainCSV") + ChSwArgs + " " + EvtName
+        returned_value = os.system(cmdexec)
+
+    ###########################################################################
+    # Chainsaw: Log Tampering - Implement in Next Version                     #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Account Tampering - Implement in Next Version                 #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Login Attacks - Implement in Next Version                     #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Antivirus Detections - Implement in Next Version              #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Lateral Movement - Implement in Next Version                  #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Log Tampering (v1.45) - Implement in Next Version             #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Powershell Script (v1.45) - Implement in Next Version         #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: RDP Attacks (v1.45) - Implement in Next Version               #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: RDP Events (v1.45) - Implement in Next Version                #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Service Installation (v1.45) - Implement in Next Version      #
+    ###########################################################################
+    ###########################################################################
+    # Chainsaw: Sigma Detections - A Job Process starts with the Default      #
+    #  Suppression Table, so the Config Rules come in with the Job            #
+    ###########################################################################
+    Detections.SigmaSupp.Clear()
+    for TitlePat, ChanPat in JobCfg["SigSupp"]:
+        Detections.SigmaSupp.Add(TitlePat, ChanPat)
+
+    reccount = ts_Engine.WriteCSV(filnout, ts_Engine.ChainsawSpec, *[ts_Engine.ReadRows(ChName) for ChName in glob.glob(os.path.join(dirtrge, "**", "sigma.csv"), recursive=True)], Bulk=JobBulk(JobCfg, filnout))
+
+    Detections.SigmaSupp.Report()
+    return reccount, [filnout]
+
+
+###########################################################################
+# Run Yamato-Security/hayabusa against all .EVTX Files                    #
+#                                                                         #
+# IMPORTANT NOTE: This section is coded for Chainsaw v2.15.0 - Other      #
+#  versions may require modifications to accomodate, since output can     #
+#  change between versions.                                               #
+###########################################################################
+def JobHayabusa(JobCfg):
+    EvtDir1 = JobCfg["EvtDir1"]
+    EvtShrd = JobCfg["EvtShrd"]
+    ShardDirs = JobCfg["ShardDirs"]
+
+    print("[+] Checking for Yamato-Security/hayabusa...")
+
+    ###########################################################################
+    # Hayabusa: Writes CSV in Timesketch format - not need for Transform      #
+    ###########################################################################
+    if not os.path.isfile(os.path.join(dirleft, "hayabusa\\hayabusa-2.15.0-win-x64.exe")):
+        print("[!] Hayabusa Executable not found!  Bypassing Hayabusa Processing...")
+        return 0, []
+
+    print("[+] Hayabusa executable found")
+    print("[+] Running Hayabusa against all Event Logs...")
+
+    ChSwSubDir = ""
+    EvtName = os.path.join(dirname, EvtDir1[1:])
+
+    if EvtShrd > 1 and len(ShardDirs) > 0:
+        ###########################################################################
+        # Sharded: One Hayabusa per Shard (EvtShrd at a time), and the Shard CSVs #
+        #  are Merged into the Hayabusa Directory                                 #
+        ###########################################################################
+        print("[+] Running Hayabusa over " + str(len(ShardDirs)) + " Event Log Shards...")
+        CmdLines = []
+        for ShardDir in ShardDirs:
+            os.makedirs(os.path.join(ShardDir, "Hayabusa"), exist_ok=True)
+            CmdLines.append(os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + os.path.join(ShardDir, ToolShard.ShardEvtx) + " -o " + os.path.join(ShardDir, "Hayabusa", "ts_Hayabusa.csv") + " -p timesketch-verbose --ISO-8601")
+        ToolShard.RunShards(CmdLines, EvtShrd)
+        ToolShard.MergeCSVs(ShardDirs, "Hayabusa", EvtName, os.path.join(dirtrge, "Hayabusa"))
+
+    else:
+        returned_value = os.system("mkdir " + os.path.join(dirtrge, "Hayabusa"))
+        cmdexec = os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + EvtName + " -o " + os.path.join(dirtrge, "Hayabusa", "ts_Hayabusa.csv") + " -p timesketch-verbose --ISO-8601"
+        returned_value = os.system(cmdexec)
+
+    # Old version uses OS Copy
+    # cmdexec = "copy " + dirtrge + "\\Hayabusa\\ts_Hayabusa.csv " + dirtrge + "\\"
+    # returned_value = os.system(cmdexec)
+
+    # New Version used Python shutil
+    shutil.copy(os.path.join(dirtrge, "Hayabusa", "ts_Hayabusa.csv"), dirtrge)
+
+    ###########################################################################
+    # Hayabusa Rows are Counted (And go to the _bulk Batches) in one Read     #
+    ###########################################################################
+    filnout = os.path.join(dirtrge, "ts_Hayabusa.csv")
+    reccount = 0
+    HeadDone = False
+    Bulk = JobBulk(JobCfg, filnout)
+    for csvrow in ts_Engine.ReadRows(filnout):
+        if not HeadDone:
+            HeadDone = True
+            if Bulk is not None:
+                Bulk.Head(csvrow)
+            continue
+
+        if Bulk is not None:
+            Bulk.Add(csvrow)
+        reccount = reccount + 1
+
+    if Bulk is not None:
+        Bulk.Close()
+    return reccount, [filnout]
+
+
+###########################################################################
+# Run one Job (In this Process or a Pool Process) - A failed Job is shown #
+#  and Summarized, the other Jobs keep going                              #
+###########################################################################
+def TimedJob(JobName, JobFunc, JobCfg):
+    StartTime = time.time()
+
+    try:
+        JobRows, OutFiles = JobFunc(JobCfg)
+        JobStat = "OK"
+    except Exception as JobErr:
+        print("[!] Job Failed: " + JobName + " (" + str(JobErr) + ")")
+        JobRows, OutFiles, JobStat = 0, [], "Failed"
+
+    return JobName, JobStat, JobRows, OutFiles, time.time() - StartTime
+
+
+###########################################################################
+# Run the Jobs - ArtJobs < 2 runs them one after another in this Process  #
+#  (Default).  Otherwise the long Jobs (Tools and the $MFT) are started   #
+#  first, so the Transforms finish in about the time of the slowest one   #
+#                                                                         #
+#  OnDone is called (In this Process) with each Job Result as that Job    #
+#   finishes - The _bulk Batches of a Job are Uploaded from there         #
+###########################################################################
+LongJobs = ("MFT", "Chainsaw", "Hayabusa", "SRUM", "LNK Files")
+
+
+def RunJobs(JobList, JobCfg, ArtJobs, OnDone=None):
+    if ArtJobs < 2 or len(JobList) < 2:
+        JobDone = []
+        for JobName, JobFunc in JobList:
+            JobDone.append(TimedJob(JobName, JobFunc, JobCfg))
+            if OnDone is not None:
+                OnDone(JobDone[-1])
+        return JobDone
+
+    print("[+] Running " + str(len(JobList)) + " Transform Jobs, " + str(ArtJobs) + " at a time...")
+    JobStart = sorted(JobList, key=lambda CurJob: CurJob[0] not in LongJobs)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(ArtJobs, len(JobList))) as JobPool:
+        JobRuns = {JobName: JobPool.submit(TimedJob, JobName, JobFunc, JobCfg) for JobName, JobFunc in JobStart}
+        if OnDone is not None:
+            for JobRun in concurrent.futures.as_completed(JobRuns.values()):
+                OnDone(JobRun.result())
+        return [JobRuns[JobName].result() for JobName, JobFunc in JobList]
+
+
+###########################################################################
+# Dedup Pass (DedupTL:) - Every ts File, ts_system.csv then the Jobs in   #
+#  Order, against one Fingerprint Table, so an Event already seen in any  #
+#  ts File is Dropped.  The Bulk Batches are written here (Kept Rows      #
+#  only) and Sent (BulkPost) as each File is Done.  Returns the           #
+#  Duplicates Dropped per Job                                             #
+###########################################################################
+def DedupJobs(JobDone, DedupTL, BulkIdx, BulkMBs, BulkTID, BulkPost=None):
+    SysFile = os.path.join(dirtrge, "ts_system.csv")
+    DedupRun = [("System", [SysFile])] + [(JobName, OutFiles) for JobName, JobStat, JobRows, OutFiles, JobTime in JobDone]
+    Fingers = ts_Dedup.FingerTable(DedupTL, 1 + sum(JobRows for JobName, JobStat, JobRows, OutFiles, JobTime in JobDone))
+
+    DupDone = {}
+    for JobName, OutFiles in DedupRun:
+        DupDone[JobName] = 0
+        for OutFile in OutFiles:
+            if not os.path.isfile(OutFile):
+                continue
+
+            Bulk = None
+            if BulkIdx != "":
+                Bulk = BulkSink.BulkWriter(os.path.join(dirtrge, "Bulk"), BulkIdx, OutFile, BulkMBs * 1048576, BulkTID)
+
+            RowsKept, RowsDrop = ts_Dedup.DedupCSV(OutFile, Fingers, Bulk)
+            DupDone[JobName] += RowsDrop
+            print("[+] Dedup: " + os.path.basename(OutFile) + " - " + str(RowsKept) + " Rows Kept, " + str(RowsDrop) + " Duplicates Dropped")
+
+            if BulkPost is not None:
+                for BatchName in BulkSink.BatchFiles(os.path.join(dirtrge, "Bulk"), OutFile):
+                    BulkPost.Send(BatchName)
+
+    print("[+] Dedup: " + str(sum(DupDone.values())) + " Duplicates Dropped (" + str(Fingers.Count) + " Events, " + str(Fingers.Bytes() // 1024) + " KB of Fingerprints)")
+    return DupDone
+
+
+###########################################################################
+# Transform_Summary.csv - Rows, Bytes, and Seconds per Job (And the       #
+#  Duplicates Dropped, when DedupTL: is on)                               #
+###########################################################################
+def JobSummary(JobDone, ArtJobs, WallTime, DupDone=None):
+    filnout = os.path.join(dirtrge, "Transform_Summary.csv")
+
+    with open(filnout, "w", encoding='utf8', errors="replace", newline='') as csvoutf:
+        csvwrite = csv.writer(csvoutf, quoting=csv.QUOTE_ALL)
+        if DupDone is None:
+            csvwrite.writerow(("job", "status", "rows", "bytes", "seconds", "output"))
+        else:
+            csvwrite.writerow(("job", "status", "rows", "bytes", "seconds", "output", "duplicates"))
+
+        print("[+] Transform Jobs (" + str(max(ArtJobs, 1)) + " at a time) - {:.1f}s:".format(WallTime))
+        for JobName, JobStat, JobRows, OutFiles, JobTime in JobDone:
+            JobBytes = sum(os.path.getsize(OutFile) for OutFile in OutFiles if os.path.isfile(OutFile))
+            JobLine = (JobName, JobStat, JobRows, JobBytes, "{:.1f}".format(JobTime), ";".join(os.path.basename(OutFile) for OutFile in OutFiles))
+            if DupDone is None:
+                csvwrite.writerow(JobLine)
+            else:
+                csvwrite.writerow(JobLine + (DupDone.get(JobName, 0),))
+
+            if JobStat == "OK" and DupDone is not None:
+                print("[+]   " + JobName + ": " + str(JobRows) + " Rows (" + str(DupDone.get(JobName, 0)) + " Duplicates Dropped), " + str(JobBytes) + " Bytes, {:.1f}s".format(JobTime))
+            elif JobStat == "OK":
+                print("[+]   " + JobName + ": " + str(JobRows) + " Rows, " + str(JobBytes) + " Bytes, {:.1f}s".format(JobTime))
+            else:
+                print("[!]   " + JobName + ": " + JobStat + ", {:.1f}s".format(JobTime))
+
+
 ###########################################################################
 # Main 
 ###########################################################################
@@ -98,6 +722,21 @@ def main():
     SysRegs = os.path.join("Reg", "Config")
     PreConv = ""
     Brander = ""
+    ArtCach = "Yes"
+    MFTShrd = 0
+    EvtShrd = 0
+    EvtSplt = "No"
+    ArtJobs = 0
+    BulkIdx = ""
+    BulkMBs = 8
+    BulkTID = ""
+    BulkURL = ""
+    BulkCon = BulkSink.PostWorkers
+    SuperTL = "No"
+    MrgRows = ts_Merge.RunRows
+    MrgFrom = ""
+    MrgUpto = ""
+    DedupTL = "No"
 
     print("[+] Checking For Config File...")
     if os.path.isfile(cfgname):
@@ -150,6 +789,98 @@ def main():
                 MFTFile = cfgline[8:].strip()
                 print("[+] MFT Source File: " + MFTFile)
 
+            elif cfgline.startswith("MFTShrd:"):
+                if cfgline[8:].strip().isdigit():
+                    MFTShrd = int(cfgline[8:].strip())
+                    print("[+] MFT Timeline Rows per File: " + str(MFTShrd))
+                else:
+                    print("[!] Invalid MFTShrd (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("EvtShrd:"):
+                if cfgline[8:].strip().isdigit():
+                    EvtShrd = int(cfgline[8:].strip())
+                    print("[+] Chainsaw/Hayabusa Event Log Shards: " + str(EvtShrd))
+                else:
+                    print("[!] Invalid EvtShrd (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("EvtSplt:"):
+                EvtSplt = cfgline[8:].strip()
+                print("[+] Split Large Event Logs across Shards: " + EvtSplt)
+
+            elif cfgline.startswith("ArtJobs:"):
+                if cfgline[8:].strip().isdigit():
+                    ArtJobs = int(cfgline[8:].strip())
+                    print("[+] Artifact Transform Jobs: " + str(ArtJobs))
+                else:
+                    print("[!] Invalid ArtJobs (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("BulkIdx:"):
+                BulkIdx = cfgline[8:].strip().lower()
+                print("[+] OpenSearch Bulk Index: " + BulkIdx)
+
+            elif cfgline.startswith("BulkMBs:"):
+                if cfgline[8:].strip().isdigit() and int(cfgline[8:].strip()) > 0:
+                    BulkMBs = int(cfgline[8:].strip())
+                    print("[+] OpenSearch Bulk Batch Size (MB): " + str(BulkMBs))
+                else:
+                    print("[!] Invalid BulkMBs (Must be a Number > 0): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("BulkTID:"):
+                if cfgline[8:].strip().isdigit():
+                    BulkTID = cfgline[8:].strip()
+                    print("[+] Timesketch Timeline ID: " + BulkTID)
+                else:
+                    print("[!] Invalid BulkTID (Must be a Number): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("BulkURL:"):
+                BulkURL = cfgline[8:].strip()
+                print("[+] OpenSearch Bulk Upload: " + BulkURL.split("@")[-1])
+
+            elif cfgline.startswith("BulkCon:"):
+                if cfgline[8:].strip().isdigit() and int(cfgline[8:].strip()) > 0:
+                    BulkCon = int(cfgline[8:].strip())
+                    print("[+] OpenSearch Bulk Uploads at a time: " + str(BulkCon))
+                else:
+                    print("[!] Invalid BulkCon (Must be a Number > 0): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("SuperTL:"):
+                SuperTL = cfgline[8:].strip()
+
+            elif cfgline.startswith("MrgRows:"):
+                if cfgline[8:].strip().isdigit() and int(cfgline[8:].strip()) > 0:
+                    MrgRows = int(cfgline[8:].strip())
+                    print("[+] Super Timeline Sort Run Rows: " + str(MrgRows))
+                else:
+                    print("[!] Invalid MrgRows (Must be a Number > 0): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("MrgFrom:"):
+                MrgFrom = cfgline[8:].strip()
+
+            elif cfgline.startswith("MrgUpto:"):
+                MrgUpto = cfgline[8:].strip()
+
+            elif cfgline.startswith("DedupTL:"):
+                if cfgline[8:].strip().upper() in ("YES", "NO", "SET", "BLOOM"):
+                    DedupTL = cfgline[8:].strip()
+                    print("[+] Timeline Dedup: " + DedupTL)
+                else:
+                    print("[!] Invalid DedupTL (Must be Yes, No, Set, or Bloom): " + cfgline[8:].strip())
+
+            elif cfgline.startswith("SigSupp:"):
+                ###########################################################################
+                # Sigma Suppression Rule: Title Pattern|Required Channel Pattern          #
+                #  (SigSupp:None drops the Default Rules)                                 #
+                ###########################################################################
+                SuppVals = cfgline[8:].strip().split("|")
+                if cfgline[8:].strip().upper() == "NONE":
+                    Detections.SigmaSupp.Clear()
+                    print("[+] Sigma Suppression Defaults Dropped")
+                elif len(SuppVals) != 2 or SuppVals[0].strip() == "" or SuppVals[1].strip() == "":
+                    print("[!] Invalid SigSupp (TitlePattern|ChannelPattern): " + cfgline[8:].strip())
+                else:
+                    Detections.SigmaSupp.Add(SuppVals[0].strip(), SuppVals[1].strip())
+                    print("[+] Sigma Suppression: " + SuppVals[0].strip() + " (Unless Channel: " + SuppVals[1].strip() + ")")
+
             elif cfgline.startswith("Browser:"):
                 Browser = cfgline[8:].strip()
                 Downlod = os.path.join(os.path.dirname(Browser), "BrowseDown.csv")
@@ -204,6 +935,10 @@ def main():
                 Brander = cfgline[8:].strip()
                 print("[+] Custom Branding: " + Brander)
 
+            elif cfgline.startswith("ArtCach:"):
+                ArtCach = cfgline[8:].strip()
+                print("[+] Artifact Cache: " + ArtCach)
+
             elif cfgline.startswith("IOC:"):
                 if HasIOCs == 0:
                     print("[+] Adding IOCs for Searching...")
@@ -218,6 +953,14 @@ def main():
         RunAllAll = 1
 
 
+    ###########################################################################
+    # Share the TriageReport Artifact Cache for this Collection               #
+    ###########################################################################
+    if ArtCach.upper() == "NO":
+        ArtCDir = ""
+    else:
+        ArtCDir = os.path.join(dirname, "TriageReport", "ArtCache")
+
     ###########################################################################
     # Pre-Cleanup to delete any Leftover temp files from failed runs
     ###########################################################################
@@ -314,565 +1057,24 @@ def main():
     # Create System Information Timesketch CSV                                #
     ###########################################################################
     filnout = os.path.join(dirtrge, "ts_system.csv")
+    SysTime = datetime.datetime.now(datetime.timezone.utc).isoformat()
     csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
     csvoutf.write("\"datetime\",\"message\",\"timestamp_desc\",\"data_type\"\n")
-    csvoutf.write("\"" + datetime.datetime.now(datetime.timezone.utc).isoformat() + "\",\"Initial Timesketch Load\",\"autorun_date\",\"system:runtime\"\n")
+    csvoutf.write("\"" + SysTime + "\",\"Initial Timesketch Load\",\"autorun_date\",\"system:runtime\"\n")
     csvoutf.close()
 
-
-    ###########################################################################
-    # Parse Prefetch Files                                                    #
-    ###########################################################################
-    if RunAllAll == 1 or SrcPrf == 1:
-        print("[+] Generating Prefetch Data...")
-        exeName = os.path.join(dirleft, "SYS", "WinPrefetchView.exe")
-
-        if os.path.isfile(exeName):
-            if os.path.isdir(os.path.join(dirname, Prefetc[1:])):
-                cmdexec = exeName + " /folder " + os.path.join(dirname, Prefetc[1:]) + " /scomma  " + os.path.join(dirtrge, "WinPrefetchview.csv")
-                returned_value = os.system(cmdexec)
-            else:
-                print("[!] Prefetch Data Not Found in the Collection: " + os.path.join(dirname, Prefetc[1:]))
-                SrcPrf = 0
-        else:
-            print("[!] WinPrefetchView Not Found...")
-            SrcPrf = 0
-
-        ###########################################################################
-        # Transform Prefetch CSV for Timesketch                                    #
-        ###########################################################################
-        reccount = 0
-        filname = os.path.join(dirtrge, "WinPrefetchview.csv")
-        filnout = os.path.join(dirtrge, "ts_prefetchview.csv")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 8:
-                        if reccount == 0:
-                            ###########################################################################
-                            # Write out a header                                                      #
-                            ###########################################################################
-                            csvoutf.write("\"filename\",\"created_time\",\"modified_time\",\"file_size\",\"Process_exe\",\"process_path\",\"run_count\",\"last_run\",\"missing_process\","
-                                        + "\"message\",\"datetime\",\"timestamp_desc\",\"data_type\"\n")
-
-                        if csvrow[0] == "":
-                            csvrow[0] = "1900-01-01T19:01:01"
-                        else:
-                            datetime_object = datetime.datetime.strptime(csvrow[2], "%m/%d/%Y %I:%M:%S %p")
-                            iso_string = datetime_object.isoformat()
-
-                        csvoutf.write("\"" 
-                                     + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" 
-                                     + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" 
-                                     + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" 
-                                     + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                     + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[0].replace(',',' - ').replace('"','') + " - "
-                                     + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + iso_string + "\",\"" 
-                                     + "prefetch_lastmod\",\"prefetch:lastmod\"\n")
-
-                        reccount = reccount + 1
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\"NoData\",\"NoData\",\"NoData\",\"NoData\",\"NoData\",\"NoData\",\"NoData\",\"NoData\",\"NoData\","
-                             + "\"No Data Parsed From Input\",\"1900-01-01T19:01:01\",\"NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Prefetch Data ...")
-    else:
-        print("[!] Bypassing Prefetch Data ...")
-
-
-    ###########################################################################
-    # Write AutoRuns (Use Python CSV Reader Module)                           #
-    ###########################################################################
-    if RunAllAll == 1 or RunAutoRn == 1:
-        print("[+] Transforming Autoruns Information...")
-
-        reccount = 0
-        filname = os.path.join(dirname, AutoRun[1:])
-        filnout = os.path.join(dirtrge, "ts_autoruns.csv")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 15:
-                        if reccount == 0:
-                            csvoutf.write("\"datetime\",\"" 
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + "message" +"\",\"" + csvrow[7].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[14].replace(',',' - ').replace('"','') + "\",\"" + csvrow[15].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[16].replace(',',' - ').replace('"','') + "\",\"" + "timestamp_desc\",\"data_type\"\n")
-                        else:
-                            if csvrow[0] == "":
-                                csvrow[0] = "1900-01-01T19:01:01"
-                            else:
-                                datetime_object = datetime.datetime.strptime(csvrow[0], "%m/%d/%Y %I:%M %p")
-                                iso_string = datetime_object.isoformat()
-
-                            csvoutf.write("\"" + iso_string + "\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','')  + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + " - " 
-                                         + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[14].replace(',',' - ').replace('"','') +"\",\"" + csvrow[15].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[16].replace(',',' - ').replace('"','') + "\",\""
-                                         + "autorun_date\",\"autoruns:autorun\"\n")
-
-                        reccount = reccount + 1
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\"1900-01-01T19:01:01\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "No Data Parsed From Input" +"\",\"" + "NoData" +"\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Autoruns Transform (No Input Data) ...")
-    else:
-        print("[!] Bypassing Autoruns Transform (No Input Data) ...")
-
-
-    ###########################################################################
-    # Parse Desktop and Recent Link Files                                     #
-    ###########################################################################
-    if RunAllAll == 1 or RunLnkPrs == 1:
-        print("[+] Generating Desktop and Recent LNK Information...")
-
-        print("[+] Checking for Eric Zimmerman LECmd Link Parser...")
-
-        reccount = 0
-        filname = os.path.join(dirtrge, "LNKFiles.csv")
-        filnout = os.path.join(dirtrge, "ts_lnkfiles.csv")
-
-        exeName = os.path.join(dirleft, "SYS", "LECmd.exe")
-        if os.path.isfile(exeName):
-            print("[+] LECmd executable found")
-            print("[+] Parsing Desktop and Recent LNK Files from Multiple User Profiles...")
-
-            ###########################################################################
-            # os.path.join will not work if LNKFile starts with a path separator      #
-            # - use [1:] to ignore path separator                                     #
-            ###########################################################################
-            curdir = os.path.join(dirname, LNKFile[1:])
-            cmdexec = exeName + " -q -d " + curdir + " --dt \"yyyy-MM-dd HH:mm:ss K\" --csv " + dirtrge + " --csvf " + filname 
-
-            returned_value = os.system(cmdexec)
-
-            print("[+] Reading Desktop and Recent LNK Files from Multiple User Profiles...")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 25:
-                        if reccount == 0:
-                            csvoutf.write("\"message\",\"" + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[14].replace(',',' - ').replace('"','') + "\",\"" + csvrow[15].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[16].replace(',',' - ').replace('"','') + "\",\"" + csvrow[17].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[18].replace(',',' - ').replace('"','') + "\",\"" + csvrow[19].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[20].replace(',',' - ').replace('"','') + "\",\"" + csvrow[21].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[22].replace(',',' - ').replace('"','') + "\",\"" + csvrow[23].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[24].replace(',',' - ').replace('"','') + "\",\"" + csvrow[25].replace(',',' - ').replace('"','') + "\",\""
-                                          + "datetime\",\"timestamp_desc\",\"data_type\"\n")
-                        else:
-                            csvoutf.write("\"" + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[0].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[7].replace(',',' - ').replace('"','') + "\",\"" + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[9].replace(',',' - ').replace('"','') + "\",\"" + csvrow[10].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[11].replace(',',' - ').replace('"','') + "\",\"" + csvrow[12].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[13].replace(',',' - ').replace('"','') + "\",\"" + csvrow[14].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[15].replace(',',' - ').replace('"','') + "\",\"" + csvrow[16].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[17].replace(',',' - ').replace('"','') + "\",\"" + csvrow[18].replace(',',' - ').replace('"','') + "\",\"" 
-                                         + csvrow[19].replace(',',' - ').replace('"','') + "\",\"" + csvrow[20].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[21].replace(',',' - ').replace('"','') + "\",\"" + csvrow[22].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[23].replace(',',' - ').replace('"','') + "\",\"" + csvrow[24].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[25].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + "LNKFileMod\",\"LinkFile:Modified\"\n")
-
-                        reccount = reccount + 1
-
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\"No Data Parsed From Input\",\"" + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\"" 
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "1900-01-01T19:01:01\",\"NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Link File Transform (No Input Data) ...")
-    else:
-        print("[!] Bypassing Link File Transform (No Input Data) ...")
-
-
-    ###########################################################################
-    # Write LastActivityView Data (Use Python CSV Reader Module)              #
-    ###########################################################################
-    if RunAllAll == 1 or RunLastAct == 1:
-        print("[+] Transforming Last Activity View Information...")
-
-        reccount = 0
-        ###########################################################################
-        # os.path.join will not work if LastAct starts with a path separator      #
-        # - use [1:] to ignore path separator                                     #
-        ###########################################################################
-        filname = os.path.join(dirname, LastAct[1:])
-        filnout = os.path.join(dirtrge, "ts_lastact.csv")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 5:
-                        if reccount == 0:
-                            csvoutf.write("\"datetime\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + "\",\""
-                                         + "message\",\"timestamp_desc\",\"data_type\"\n")
-                        else:
-                            datetime_object = datetime.datetime.strptime(csvrow[0].replace(',',' - ').replace('"',''), "%m/%d/%Y %I:%M:%S %p")
-                            iso_string = datetime_object.isoformat()
-
-                            if len(csvrow[4]) < 1:
-                                MoreInfo = ""
-                            else:
-                                MoreInfo = " - MoreInfo: "
-
-                            csvoutf.write("\"" + iso_string + "\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + " - Path: " + csvrow[3].replace(',',' - ').replace('"','')
-                                         + MoreInfo + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + "LastActivty\",\"Activity:last\"\n")
-
-                        reccount = reccount + 1
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\"1900-01-01T19:01:01\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "No Data Parsed From Input\",\"NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Last Activity View Transform (No Input Data) ...")
-    else:
-        print("[!] Bypassing Last Activity View Transform (No Input Data) ...")
-
-
-    ###########################################################################
-    # Write Web Browser Data (Use Python CSV Reader Module)                   #
-    ###########################################################################
-    if RunAllAll == 1 or RunFBrHst == 1:
-        print("[+] Transforming File and Web Browser Information...")
-
-        reccount = 0
-        ###########################################################################
-        # os.path.join will not work if Browser starts with a path separator      #
-        # - use [1:] to ignore path separator                                     #
-        ###########################################################################
-        filname = os.path.join(dirname, Browser[1:])
-        filnout = os.path.join(dirtrge, "ts_browsehist.csv")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 13:
-                        if reccount == 0:
-                            csvoutf.write("\"message\",\""
-                                         + csvrow[1].replace(',',' - ').replace('"','') + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[7].replace(',',' - ').replace('"','') +  "\",\"" + csvrow[8].replace(',',' - ').replace('"','')  + "\",\""
-                                         + csvrow[9].replace(',',' - ').replace('"','') + "\",\"" + csvrow[10].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[11].replace(',',' - ').replace('"','') +"\",\"" + csvrow[12].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                         + "datetime\",\"timestamp_desc\",\"data_type\"\n")
-                        else:
-                            datetime_object = datetime.datetime.strptime(csvrow[2].replace(',',' - ').replace('"',''), "%m/%d/%Y %I:%M:%S %p")
-                            iso_string = datetime_object.isoformat()
-                            if csvrow[0].startswith("file:///"):
-                                csvoutf.write("\""
-                                             + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                             + iso_string + "\",\"" + "fileOpen\",\"browser:file\"\n")
-                            else:
-                                csvoutf.write("\""
-                                             + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                             + iso_string + "\",\"" + "websiteVisit\",\"browser:visit\"\n")
-
-                        reccount = reccount + 1
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\"No Data Parsed From Input\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\""
-                             + "1900-01-01T19:01:01\",\"NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Browser History Transform (No Input Data) ...")
-    else:
-        print("[!] Bypassing Browser History Transform (No Input Data) ...")
-
+    if BulkIdx != "" and DedupTL.upper() == "NO":
+        Bulk = BulkSink.BulkWriter(os.path.join(dirtrge, "Bulk"), BulkIdx, filnout, BulkMBs * 1048576, BulkTID)
+        Bulk.Head(("datetime", "message", "timestamp_desc", "data_type"))
+        Bulk.Add((SysTime, "Initial Timesketch Load", "autorun_date", "system:runtime"))
+        Bulk.Close()
 
 
     ###########################################################################
-    # Write Web Browser Downloads (Use Python CSV Reader Module)              #
-    ###########################################################################
-    if RunAllAll == 1 or RunFBrHst == 1:
-        print("[+] Transforming File and Web Browser Downloads...")
-
-        reccount = 0
-        ###########################################################################
-        # os.path.join will not work if Downlod starts with a path separator      #
-        # - use [1:] to ignore path separator                                     #
-        ###########################################################################
-        filname = os.path.join(dirname, Downlod[1:])
-        filnout = os.path.join(dirtrge, "ts_browsedown.csv")
-
-        if os.path.isfile(filname):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-            with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                for csvrow in csvread:
-                    if len(csvrow) > 18:
-                        if reccount == 0:
-                            csvoutf.write("\""
-                                         + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + "message" + "\",\"" + csvrow[2].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[7].replace(',',' - ').replace('"','') + "\",\"" + csvrow[8].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[9].replace(',',' - ').replace('"','') + "\",\"" + csvrow[10].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[11].replace(',',' - ').replace('"','') +"\",\"" + csvrow[12].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[13].replace(',',' - ').replace('"','') + "\",\"" + csvrow[14].replace(',',' - ').replace('"','') +"\",\""
-                                         + csvrow[15].replace(',',' - ').replace('"','') + "\",\"" + csvrow[16].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[17].replace(',',' - ').replace('"','') + "\",\"" + csvrow[18].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[19].replace(',',' - ').replace('"','') + "\",\""
-                                         + "datetime\",\"timestamp_desc\",\"data_type\"\n")
-                        else:
-                            datetime_object = datetime.datetime.strptime(csvrow[5].replace(',', ' - '), "%m/%d/%Y %I:%M:%S %p")
-                            iso_string = datetime_object.isoformat()
-                            csvoutf.write("\""
-                                         + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[14].replace(',',' - ').replace('"','') + "\",\"" + csvrow[15].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[16].replace(',',' - ').replace('"','') + "\",\"" + csvrow[17].replace(',',' - ').replace('"','') + "\",\""
-                                         + csvrow[18].replace(',',' - ').replace('"','') + "\",\"" + csvrow[19].replace(',',' - ').replace('"','') + "\",\""
-                                         + iso_string + "\",\"" + "webDownload\",\"browser:download\"\n")
-
-                        reccount = reccount + 1
-
-            if reccount < 2:
-                print("[!] No Records Processed: " + dirname)
-                csvoutf.write("\""
-                             + "NoData" + "\",\"" + "No Data parsed From Input" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\"" + "NoData" + "\",\""
-                             + "NoData" + "\",\""
-                             + "1900-01-01T19:01:01\",\"NoData\",\"NoData:Input\"\n")
-            else:
-                print("[+] Records Processed: " + str(reccount))
-
-            csvfile.close()
-            csvoutf.close()
-
-        else:
-            print("[!] Bypassing Browser History Transform (No Input Data) ...")
-    else:
-        print("[!] Bypassing Browser History Transform (No Input Data) ...")
-
-
-    ###########################################################################
-    # Parse SRUM DB                                                           #
-    ###########################################################################
-    if RunAllAll == 1 or SrcSrum == 1:
-        print("[+] Generating SRUM Data...")
-        exeName = os.path.join(dirleft, "SYS", "SrumECmd.exe")
-
-        if os.path.isfile(exeName):
-            if os.path.isdir(os.path.join(dirname, SrumDir[1:])) and os.path.isfile(os.path.join(dirname, SysRegs[1:], "SOFTWARE")):
-                cmdexec = exeName + " -d " + os.path.join(dirname, "Cache") + " -r " + os.path.join(dirname, "Cache", "SOFTWARE") + " --csv " + os.path.join(dirtrge, "SRUM")
-                returned_value = os.system(cmdexec)
-
-                ###########################################################################
-                # Transform Just the Network activity for Timesketch                      #
-                ###########################################################################
-                print("[+] Processing SRUM Network Usage: SrumECmd_NetworkUsages_Output.csv")
-                for curfile in os.listdir(os.path.join(dirtrge, "SRUM")):
-                    if curfile.endswith("SrumECmd_NetworkUsages_Output.csv"):
-                        reccount = 0
-                        filname = os.path.join(dirtrge, "SRUM", curfile)
-                        filnout = os.path.join(dirtrge, "ts_srumnetusage.csv")
-
-                        csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-                        with open(filname, 'r', encoding='utf8', errors="replace") as csvfile:
-                            csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                            for csvrow in csvread:
-                                if len(csvrow) > 15:
-                                    if reccount == 0:
-                                        csvoutf.write("\""
-                                                     + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + "datetime" + "\",\"" + "message" + "\",\""
-                                                     + csvrow[3].replace(',',' - ').replace('"','') + "\",\"" + csvrow[4].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[5].replace(',',' - ').replace('"','') + "\",\"" + csvrow[6].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[7].replace(',',' - ').replace('"','') + "\",\"" + csvrow[8].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[9].replace(',',' - ').replace('"','') + "\",\"" + csvrow[10].replace(',',' - ').replace('"','') +"\",\""
-                                                     + csvrow[11].replace(',',' - ').replace('"','') +"\",\"" + csvrow[12].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[13].replace(',',' - ').replace('"','') + "\",\"" + csvrow[14].replace(',',' - ').replace('"','') +"\",\""
-                                                     + csvrow[15].replace(',',' - ').replace('"','') + "\",\"" + csvrow[16].replace(',',' - ').replace('"','') + "\",\""
-                                                     + "timestamp_desc\",\"data_type\"\n")
-                                    else:
-                                        csvoutf.write("\""
-                                                     + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(' ', 'T').replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[2].replace(',',' - ').replace('"','') + " - Bytes In: " +  csvrow[10].replace(',',' - ').replace('"','')
-                                                     + " - Bytes Out: " + csvrow[11].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[8].replace(',',' - ').replace('"','') + "\",\"" + csvrow[9].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[10].replace(',',' - ').replace('"','') + "\",\"" + csvrow[11].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[12].replace(',',' - ').replace('"','') + "\",\"" + csvrow[13].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[14].replace(',',' - ').replace('"','') + "\",\"" + csvrow[15].replace(',',' - ').replace('"','') + "\",\""
-                                                     + csvrow[16].replace(',',' - ').replace('"','') + "\",\""
-                                                     + "srumnetusage\",\"srum:netusage\"\n")
-
-                                    reccount = reccount + 1
-
-                        if reccount < 2:
-                            print("[!] No Records Processed For: SrumECmd_NetworkUsages_Output.csv")
-                            csvoutf.write("\""
-                                         + "NoData" + "\",\"" + "1900-01-01T19:01:01" + "\",\"" + "No Data Parsed From Input" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData" + "\",\"" + "NoData" + "\",\""
-                                         + "NoData\",\"NoData:Input\"\n")
-                        else:
-                            print("[+] Records Processed: " + str(reccount))
-
-                        csvfile.close()
-                        csvoutf.close()
-
-            else:
-                print("[!] SRUM or SYSTEM registry Not Found in the Collection: " + dirname + SrumDir)
-                SrcPrf = 0
-        else:
-            print("[!] SrumECmd Not Found...")
-            SrcPrf = 0
-    else:
-        print("[!] Bypassing SRUM Data ...")
-
-
-    ###########################################################################
-    # Run Countercept Chainsaw Program against all .EVTX Files                #
-    #                                                                         #
-    # IMPORTANT NOTE: This section is coded for Chainsaw v2.9 - Other         #
-    #  versions may require modifications to accomodate, since output can     #
-    #  change between versions.                                               #
+    # Chainsaw and Hayabusa Downloads - Asked here, before the Jobs start     #
+    #  (A Job in a Pool Process has no Console to ask on)                     #
     ###########################################################################
     if (RunAllAll == 1 or RunChnSaw == 1) and SrcEvtx == 1:
-        print("[+] Checking for F-Secure Countercept Chainsaw...")
-
-        filnout = os.path.join(dirtrge, "ts_chainsaw.csv")
-
         if os.path.isfile(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe")) == False:
             print("[?] Chainsaw executable not found...  Would you like to Download F-Secure Countercept...")
             YesOrNo = "Y"
@@ -894,125 +1096,6 @@ def main():
             else:
                 print("[!] Chainsaw Download Bypassed...")
 
-
-        if os.path.isfile(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe")):
-            csvoutf = open(filnout, "w", encoding='utf8', errors="replace")
-
-            print("[+] Chainsaw executable found")
-            print("[+] Running F-Secure Countercept Chainsaw against all Event Logs...")
-
-            ChSwSubDir = ""
-
-            ###########################################################################
-            # os.path.join will not work if EVTDir1 starts with a path separator      #
-            # - use [1:] to ignore path separator                                     #
-            ###########################################################################
-            EvtName = os.path.join(dirname, EvtDir1[1:])
-            cmdexec = os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe") + " hunt " + " --skip-errors --timezone UTC --full --csv --output " + os.path.join(dirtrge, "ChainCSV") + " --mapping " + os.path.join(dirleft, "chainsaw", "mappings", "sigma-event-logs-all.yml") + " --rule " + os.path.join(dirleft, "chainsaw", "rules") + " --sigma " + os.path.join(dirleft, "chainsaw", "sigma") + " " + EvtName
-            returned_value = os.system(cmdexec)
-
-            ###########################################################################
-            # Chainsaw: Log Tampering - Implement in Next Version                     #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Account Tampering - Implement in Next Version                 #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Login Attacks - Implement in Next Version                     #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Antivirus Detections - Implement in Next Version              #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Lateral Movement - Implement in Next Version                  #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Log Tampering (v1.45) - Implement in Next Version             #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Powershell Script (v1.45) - Implement in Next Version         #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: RDP Attacks (v1.45) - Implement in Next Version               #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: RDP Events (v1.45) - Implement in Next Version                #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Service Installation (v1.45) - Implement in Next Version      #
-            ###########################################################################
-            ###########################################################################
-            # Chainsaw: Sigma Detections                                              #
-            ###########################################################################
-            for ChName in glob.glob(os.path.join(dirtrge, "**", "sigma.csv"), recursive=True):
-                reccount = 0
-                with open(ChName, 'r', encoding='utf8', errors="replace") as csvfile:
-                    csvread = csv.reader((line.replace('\0','') for line in csvfile), delimiter=',')
-                    for csvrow in csvread:
-                        if len(csvrow) > 8:
-                            if reccount == 0:
-                                csvoutf.write("\"" + "datetime" + "\",\"" + "message" + "\",\""
-                                             + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[8].replace(',',' - ').replace('"','') + "\",\""
-                                             + "timestamp_desc\",\"data_type\"\n")
-                            else:
-                                ###########################################################################
-                                # Sigma Rules - Sanity check detection start                              #
-                                ###########################################################################
-                                if "defender" in csvrow[1].replace(',',' - ').lower() and "defender" not in csvrow[3].replace(',',' - ').lower():
-                                    continue
-
-                                if "sysmon" in csvrow[1].replace(',', ' - ').lower() and "sysmon" not in csvrow[3].replace(',', ' - ').lower():
-                                    continue
-
-                                if "file was not allowed to run" in csvrow[1].replace(',', ' - ').lower() and "applocker" not in csvrow[3].replace(',', ' - ').lower():
-                                    continue
-
-                                csvrow[0].replace(" ", "T")
-                                csvoutf.write("\""
-                                             + csvrow[0].replace(',',' - ').replace('"','') + "\",\"" + csvrow[1].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[2].replace(',',' - ').replace('"','') + "\",\"" + csvrow[3].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[4].replace(',',' - ').replace('"','') + "\",\"" + csvrow[5].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[6].replace(',',' - ').replace('"','') + "\",\"" + csvrow[7].replace(',',' - ').replace('"','') + "\",\""
-                                             + csvrow[8].replace(',',' - ').replace('"','') + "\",\""
-                                             + "chainsaw_sigma\",\"chainsaw:sigma\"\n")
-
-
-                        reccount = reccount + 1
-
-                if reccount < 2:
-                    print("[!] No Records Processed: " + dirname)
-                    csvoutf.write("\"" + "1900-01-01T19:01:01" + "\",\"" + "No Data Parsed From Input" + "\",\""
-                                 + "NoData" + "\",\"" + "NoData" + "\",\""
-                                 + "NoData" + "\",\"" + "NoData" + "\",\""
-                                 + "NoData" + "\",\"" + "NoData" + "\",\""
-                                 + "NoData" + "\",\""
-                                 + "NoData\",\"NoData:Input\"\n")
-                else:
-                    print("[+] Records Processed: " + str(reccount))
-
-                csvfile.close()
-                csvoutf.close()
-
-        else:
-            print("[!] Chainsaw Executable not found!  Bypassing Chainsaw Processing...")
-
-    else:
-        print("[!] Bypassing Chainsaw Processing...")
-
-
-    ###########################################################################
-    # Run Yamato-Security/hayabusa against all .EVTX Files                    #
-    #                                                                         #
-    # IMPORTANT NOTE: This section is coded for Chainsaw v2.15.0 - Other      #
-    #  versions may require modifications to accomodate, since output can     #
-    #  change between versions.                                               #
-    ###########################################################################
-    if (RunAllAll == 1 or RunChnSaw == 1) and SrcEvtx == 1:
-        print("[+] Checking for Yamato-Security/hayabusa...")
-
         if os.path.isfile(os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe")) == False:
             print("[?] Hayabusa executable not found...  Would you like to Download hayabusa 2.15.0...")
             YesOrNo = "Y"
@@ -1036,32 +1119,118 @@ def main():
                 print("[!] Hayabusa Download Bypassed...")
 
 
-        ###########################################################################
-        # Hayabusa: Writes CSV in Timesketch format - not need for Transform      #
-        ###########################################################################
-        if os.path.isfile(os.path.join(dirleft, "hayabusa\\hayabusa-2.15.0-win-x64.exe")):
-            print("[+] Hayabusa executable found")
-            print("[+] Running Hayabusa against all Event Logs...")
-
-            ChSwSubDir = ""
-            EvtName = os.path.join(dirname, EvtDir1[1:])
-            returned_value = os.system("mkdir " + os.path.join(dirtrge, "Hayabusa"))
-            cmdexec = os.path.join(dirleft, "hayabusa", "hayabusa-2.15.0-win-x64.exe") + " csv-timeline -w --UTC -d " + EvtName + " -o " + os.path.join(dirtrge, "Hayabusa", "ts_Hayabusa.csv") + " -p timesketch-verbose --ISO-8601"
-            returned_value = os.system(cmdexec)
+    ###########################################################################
+    # Event Log Shards (EvtShrd:n) - Built once, for Chainsaw and Hayabusa    #
+    ###########################################################################
+    ShardWork = os.path.join(dirtrge, "ToolShard")
+    if os.path.isdir(ShardWork):
+        shutil.rmtree(ShardWork, ignore_errors=True)
+    ShardDirs = []
 
-            # Old version uses OS Copy
-            # cmdexec = "copy " + dirtrge + "\\Hayabusa\\ts_Hayabusa.csv " + dirtrge + "\\"
-            # returned_value = os.system(cmdexec)
+    if (RunAllAll == 1 or RunChnSaw == 1) and SrcEvtx == 1 and EvtShrd > 1:
+        if os.path.isfile(os.path.join(dirleft, "chainsaw", "chainsaw_x86_64-pc-windows-msvc.exe")) or os.path.isfile(os.path.join(dirleft, "hayabusa\\hayabusa-2.15.0-win-x64.exe")):
+            ShardDirs = ToolShard.BuildShards(ToolShard.ShardPlan(os.path.join(dirname, EvtDir1[1:]), EvtShrd, int(EvtSplt.upper() == "YES")), ShardWork)
 
-            # New Version used Python shutil
-            shutil.copy(os.path.join(dirtrge, "Hayabusa", "ts_Hayabusa.csv"), dirtrge)
 
-        else:
-            print("[!] Hayabusa Executable not found!  Bypassing Hayabusa Processing...")
+    ###########################################################################
+    # The Artifact Jobs (In Config Order) and the Settings they read - With   #
+    #  DedupTL: on, the Dedup Pass writes the Bulk Batches, not the Jobs      #
+    ###########################################################################
+    JobCfg = {"Prefetc": Prefetc, "MFTFile": MFTFile, "MFTShrd": MFTShrd, "AutoRun": AutoRun, "LNKFile": LNKFile,
+              "LastAct": LastAct, "Browser": Browser, "Downlod": Downlod, "SrumDir": SrumDir, "SysRegs": SysRegs,
+              "EvtDir1": EvtDir1, "EvtShrd": EvtShrd, "ShardDirs": ShardDirs, "ArtCDir": ArtCDir,
+              "SigSupp": list(Detections.SigmaSupp.Rules), "BulkIdx": BulkIdx if DedupTL.upper() == "NO" else "", "BulkMBs": BulkMBs,
+              "BulkTID": BulkTID}
+    JobList = []
+
+    if RunAllAll == 1 or SrcPrf == 1:
+        JobList.append(("Prefetch", JobPrefetch))
+    else:
+        print("[!] Bypassing Prefetch Data ...")
+
+    if RunAllAll == 1 or SrcMFT == 1:
+        JobList.append(("MFT", JobMFT))
+    else:
+        print("[!] Bypassing $MFT Transform (No Input Data) ...")
+
+    if RunAllAll == 1 or RunAutoRn == 1:
+        JobList.append(("AutoRuns", JobAutoRuns))
+    else:
+        print("[!] Bypassing Autoruns Transform (No Input Data) ...")
+
+    if RunAllAll == 1 or RunLnkPrs == 1:
+        JobList.append(("LNK Files", JobLnkFiles))
+    else:
+        print("[!] Bypassing Link File Transform (No Input Data) ...")
+
+    if RunAllAll == 1 or RunLastAct == 1:
+        JobList.append(("LastActivity", JobLastAct))
+    else:
+        print("[!] Bypassing Last Activity View Transform (No Input Data) ...")
 
+    if RunAllAll == 1 or RunFBrHst == 1:
+        JobList.append(("Browser History", JobBrowseHist))
+        JobList.append(("Browser Downloads", JobBrowseDown))
     else:
+        print("[!] Bypassing Browser History Transform (No Input Data) ...")
+
+    if RunAllAll == 1 or SrcSrum == 1:
+        JobList.append(("SRUM", JobSrum))
+    else:
+        print("[!] Bypassing SRUM Data ...")
+
+    if (RunAllAll == 1 or RunChnSaw == 1) and SrcEvtx == 1:
+        JobList.append(("Chainsaw", JobChainsaw))
+        JobList.append(("Hayabusa", JobHayabusa))
+    else:
+        print("[!] Bypassing Chainsaw Processing...")
         print("[!] Bypassing Hayabusa Processing...")
 
+    ###########################################################################
+    # OpenSearch Bulk Upload (BulkURL:) - A Job's Batches are Sent as soon as #
+    #  that Job is Done, while the other Jobs keep running (With DedupTL: on, #
+    #  as soon as the Dedup Pass is Done with each File)                      #
+    ###########################################################################
+    BulkPost = None
+    OnDone = None
+    if BulkIdx != "" and BulkURL != "":
+        BulkPost = BulkSink.BulkUpload(BulkURL, BulkCon)
+
+    if BulkPost is not None and DedupTL.upper() == "NO":
+        def OnDone(JobRes):
+            for OutFile in JobRes[3]:
+                for BatchName in BulkSink.BatchFiles(os.path.join(dirtrge, "Bulk"), OutFile):
+                    BulkPost.Send(BatchName)
+
+        for BatchName in BulkSink.BatchFiles(os.path.join(dirtrge, "Bulk"), os.path.join(dirtrge, "ts_system.csv")):
+            BulkPost.Send(BatchName)
+
+    StartTime = time.time()
+    JobDone = RunJobs(JobList, JobCfg, ArtJobs, OnDone)
+    JobTime = time.time() - StartTime
+
+    DupDone = None
+    if DedupTL.upper() != "NO":
+        print("[+] Dropping Duplicate Events from the Timelines...")
+        DupDone = DedupJobs(JobDone, DedupTL, BulkIdx, BulkMBs, BulkTID, BulkPost)
+
+    JobSummary(JobDone, ArtJobs, JobTime, DupDone)
+
+
+    ###########################################################################
+    # Super Timeline (SuperTL:Yes) - Every ts_*.csv Merged by Time into one   #
+    #  Super_Timeline.csv (External Sort - Bounded Memory)                    #
+    ###########################################################################
+    if SuperTL.upper() == "YES":
+        print("[+] Building the Super Timeline...")
+        ts_Merge.SuperTimeline(dirtrge, "Super_Timeline.csv", MrgFrom, MrgUpto, MrgRows)
+
+    if BulkPost is not None:
+        BulkPost.Close()
+
+    if os.path.isdir(ShardWork):
+        shutil.rmtree(ShardWork, ignore_errors=True)
+
     print("[+] Transform Processing Complete!\n")
 
 